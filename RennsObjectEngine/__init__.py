@@ -2,6 +2,13 @@ from .renns_style import RennsStyle, Renns
 from .toggle import RennsToggle
 from .animator import RennsAnimator
 from .action_group import RennsActionGroup
+from .engine import RennsEngine, RennsVirtualClock
+from .stagger import RennsStagger
+from .visibility import RennsVisibility
+from .compositor import RennsCompositor
+from .text_cache import RennsTextCache
+from .icon_cache import RennsIcon
+from .quality import RennsQuality
 
 __all__ = [
     "RennsStyle",
@@ -9,4 +16,12 @@ __all__ = [
     "RennsToggle",
     "RennsAnimator",
     "RennsActionGroup",
+    "RennsEngine",
+    "RennsVirtualClock",
+    "RennsStagger",
+    "RennsVisibility",
+    "RennsCompositor",
+    "RennsTextCache",
+    "RennsIcon",
+    "RennsQuality",
 ]
\ No newline at end of file
@@ -74,7 +74,7 @@ from PySide6.QtCore import (
     Qt, QRect, QRectF, QPoint, QPointF, QTimer, Signal, QEvent, QObject
 )
 from PySide6.QtGui import (
-    QPainter, QColor, QBrush, QFont, QCursor, QTransform
+    QPainter, QColor, QBrush, QCursor, QTransform, QPen, QRegion
 )
 import warnings as _warnings
 
@@ -88,11 +88,15 @@ def _safe_disconnect(signal):
             pass
 
 from .button.button import RennsButton
-from .button.button_ext.animation import resolve_easing
+from .button.button_ext.animation import resolve_easing, retarget
 from .button.button_ext.transform import parse_transform
 from .renns_style import RennsStyle
 from .button.button_ext.css_color import parse_css_color
-from .button.button_ext.backdrop import draw_backdrop_blur
+from .button.button_ext.backdrop import draw_backdrop_blur, parse_backdrop_blur
+from .engine import RennsEngine
+from .stagger import RennsStagger
+from .text_cache import RennsTextCache
+from .quality import RennsQuality
 
 
 # ─────────────────────────────────────────────────────────────
@@ -105,7 +109,7 @@ class _SlotColor(QObject):
         super().__init__()
         self._c       = QColor(base_color)
         self._repaint = repaint_fn
-        self._anim    = QPropertyAnimation(self, b"col")
+        self._anim    = RennsEngine.animation(self, b"col")
         self._anim.setEasingCurve(QEasingCurve.OutCubic)
 
     def getCol(self):    return self._c
@@ -113,12 +117,8 @@ class _SlotColor(QObject):
     col = Property(QColor, getCol, setCol)
 
     def go(self, target: QColor, dur_ms: int, easing: QEasingCurve):
-        self._anim.stop()
-        self._anim.setStartValue(QColor(self._c))
-        self._anim.setEndValue(target)
-        self._anim.setDuration(max(60, dur_ms))
-        self._anim.setEasingCurve(easing)
-        self._anim.start()
+        retarget(self._anim, QColor(target),
+                 max(60, RennsEngine.duration(dur_ms)), easing)
 
     @property
     def color(self): return self._c
@@ -132,24 +132,71 @@ class _SlotScale(QObject):
         super().__init__()
         self._s       = float(base_scale)
         self._repaint = repaint_fn
-        self._anim    = QPropertyAnimation(self, b"sc")
+        self._anim    = RennsEngine.animation(self, b"sc")
 
     def getSc(self):    return self._s
     def setSc(self, v): self._s = float(v); self._repaint()
     sc = Property(float, getSc, setSc)
 
     def go(self, target: float, dur_ms: int, easing: QEasingCurve):
-        self._anim.stop()
-        self._anim.setStartValue(float(self._s))
-        self._anim.setEndValue(float(target))
-        self._anim.setDuration(max(60, dur_ms))
-        self._anim.setEasingCurve(easing)
-        self._anim.start()
+        retarget(self._anim, float(target),
+                 max(60, RennsEngine.duration(dur_ms)), easing)
 
     @property
     def scale(self): return self._s
 
 
+# ─────────────────────────────────────────────────────────────
+#  Style plan — style pill/slot di-parse sekali per (class, state)
+# ─────────────────────────────────────────────────────────────
+
+class _StylePlan:
+    __slots__ = ("bg", "fg", "radius", "font_size", "font_weight",
+                 "border_pen", "border_width", "backdrop_css", "backdrop_blur")
+
+    def __init__(self, merged: dict):
+        def _f(k, d):
+            try:    return float(merged.get(k, d))
+            except: return d
+
+        self.bg     = parse_css_color(merged.get("background", "#2d2f3a"))
+        self.fg     = merged.get("color", "#ffffff")
+        # None → default beda untuk pill (setengah tinggi) dan slot (10)
+        self.radius = _f("border-radius", None)
+        self.font_size   = int(_f("font-size", 13))
+        self.font_weight = merged.get("font-weight", "normal").strip().lower()
+
+        self.border_width = _f("border-width", 0) or 0
+        border_color = merged.get("border-color", None)
+        self.border_pen = None
+        if border_color and self.border_width > 0:
+            self.border_pen = QPen(parse_css_color(border_color))
+            self.border_pen.setWidthF(self.border_width)
+
+        self.backdrop_css  = merged.get("backdrop-filter", "")
+        self.backdrop_blur = parse_backdrop_blur(self.backdrop_css) if self.backdrop_css else 0.0
+
+
+# { (class_name, state): (RennsStyle.generation, _StylePlan) }
+_style_plans: dict = {}
+
+
+def _style_plan(class_name: str, state: str = "base") -> _StylePlan:
+    key = (class_name, state)
+    hit = _style_plans.get(key)
+    if hit is not None and hit[0] == RennsStyle.generation:
+        return hit[1]
+    merged = {**RennsStyle.get(class_name, "base"), **RennsStyle.get(class_name, state)}
+    plan = _StylePlan(merged)
+    _style_plans[key] = (RennsStyle.generation, plan)
+    return plan
+
+
+# Mask pill selama animasi buka/tutup — sedikit lebih besar dari pill penuh
+# supaya overshoot spring/bounce tidak ke-clip
+_MASK_SLACK_SCALE = 1.2
+
+
 # ─────────────────────────────────────────────────────────────
 #  Floating pill overlay
 # ─────────────────────────────────────────────────────────────
@@ -178,6 +225,8 @@ class _PillOverlay(QWidget):
         self._pressed_idx = -1
         self._pill_scale  = 0.0
         self._opacity     = 0.0
+        self._mask_key    = None   # scale tempat mask terakhir dihitung
+        self._dirty_bounds = None  # bounds terakhir yang di-update()
 
         # ── Baca CSS ─────────────────────────────────────────
         base = RennsStyle.get(class_name, "base")
@@ -195,7 +244,7 @@ class _PillOverlay(QWidget):
         dur_s, eas_name = RennsStyle.parse_transition(
             base.get("transition", "0.32s ease-out")
         )
-        self._dur_ms = max(100, int(dur_s * 1000))
+        self._css_dur_ms = max(100, int(dur_s * 1000))
         self._easing = resolve_easing(eas_name)
 
         # ── Pill size ─────────────────────────────────────────
@@ -224,13 +273,19 @@ class _PillOverlay(QWidget):
         self._init_pill_shadow(base)
 
         # ── Animasi ───────────────────────────────────────────
-        self._scale_anim = QPropertyAnimation(self, b"pill_scale")
+        self._scale_anim = RennsEngine.animation(self, b"pill_scale")
         self._scale_anim.setEasingCurve(self._easing)
         self._scale_anim.setDuration(self._dur_ms)
 
-        self._opacity_anim = QPropertyAnimation(self, b"pill_opacity")
+        self._opacity_anim = RennsEngine.animation(self, b"pill_opacity")
         self._opacity_anim.setEasingCurve(QEasingCurve.OutCubic)
 
+        # Entry item RennsButton — satu stagger, animasi di-reuse tiap open
+        self._entry_animating = False
+        self._entry_call      = None
+        self._entry           = RennsStagger(self)
+        self._entry.finished.connect(self._on_entry_done)
+
         # ── Slot colors (hanya untuk dict item) ───────────────
         self._slot_colors: list[_SlotColor] = []
         self._slot_borders: list = []
@@ -255,11 +310,13 @@ class _PillOverlay(QWidget):
         self.setMouseTracking(True)
         self.setAttribute(Qt.WA_TranslucentBackground)
 
-        # Text pixmap cache — sama seperti RennsOverlay supaya rendering identik
-        self._text_pm_cache: dict = {}   # key → QPixmap
-
         self.hide()
 
+    @property
+    def _dur_ms(self) -> int:
+        """Durasi CSS setelah power profile — dibaca ulang tiap open/close."""
+        return RennsEngine.duration(self._css_dur_ms)
+
     # ── Ukuran item ───────────────────────────────────────────
 
     def _measure_items(self):
@@ -316,7 +373,7 @@ class _PillOverlay(QWidget):
         lw = self._pill_shadow.width()
         lh = self._pill_shadow.height()
         self._pill_shadow.move(win_cx - lw // 2, win_cy - lh // 2)
-        self._pill_shadow.setWindowOpacity(self._opacity)
+        self._pill_shadow.set_node_opacity(self._opacity)
 
     # ── Qt Properties ─────────────────────────────────────────
 
@@ -326,39 +383,57 @@ class _PillOverlay(QWidget):
         self._sync_button_overlays()
         self._update_mask()
         self._sync_pill_shadow()
-        self.update()
+        self._invalidate()
     pill_scale = Property(float, getPillScale, setPillScale)
 
+    def _pill_bounds(self, scale: float) -> QRect:
+        """Bounds pill ter-transform pada scale ini (+ border/AA), canvas coords."""
+        tr = self._make_transform(scale)
+        ox, oy = self._pill_origin()
+        r = tr.mapRect(QRectF(ox, oy, self._pill_w, self._pill_h)).toAlignedRect()
+        return r.adjusted(-4, -4, 4, 4).intersected(self.rect())
+
     def _update_mask(self):
-        from PySide6.QtGui import QRegion
-        if self._pill_scale <= 0.01:
-            self.setMask(QRegion())
+        """
+        Mask (hit area + clip) diganti hanya di titik tertentu, bukan tiap
+        frame: kosong saat tertutup, pas saat terbuka penuh, dan selama
+        animasi satu mask longgar seukuran pill ×_MASK_SLACK_SCALE.
+        """
+        s = self._pill_scale
+        if s <= 0.01:
+            key = 0.0
+        elif abs(s - 1.0) < 0.001:
+            key = 1.0
+        else:
+            key = max(_MASK_SLACK_SCALE, s)
+        if key == self._mask_key:
             return
-        tr = self._make_transform()
-        ox, oy = self._pill_origin()
-        corners = [
-            tr.map(QPointF(ox,                 oy)),
-            tr.map(QPointF(ox + self._pill_w,  oy)),
-            tr.map(QPointF(ox + self._pill_w,  oy + self._pill_h)),
-            tr.map(QPointF(ox,                 oy + self._pill_h)),
-        ]
-        xs = [p.x() for p in corners]
-        ys = [p.y() for p in corners]
-        mask_rect = QRect(
-            int(min(xs)) - 4, int(min(ys)) - 4,
-            int(max(xs) - min(xs)) + 8, int(max(ys) - min(ys)) + 8
-        )
-        self.setMask(QRegion(mask_rect))
+        self._mask_key = key
+        if key == 0.0:
+            self.setMask(QRegion())
+        else:
+            self.setMask(QRegion(self._pill_bounds(key)))
+
+    def _invalidate(self):
+        """update() gabungan bounds pill frame lalu + sekarang saja."""
+        new = self._pill_bounds(self._pill_scale) if self._pill_scale > 0.01 else QRect()
+        old = self._dirty_bounds
+        self._dirty_bounds = new
+        area = self.rect() if old is None else new.united(old)
+        if not area.isEmpty():
+            self.update(area)
 
     def getPillOpacity(self):    return self._opacity
     def setPillOpacity(self, v):
         self._opacity = max(0.0, min(1.0, v))
-        # Set opacity untuk button overlays juga
-        for item in self.items:
-            if isinstance(item, RennsButton) and item.overlay:
-                item.overlay.setWindowOpacity(self._opacity)
+        # Opacity button overlays ikut pill — kecuali selama entry, fade
+        # per item dipegang stagger
+        if not self._entry_animating:
+            for item in self.items:
+                if isinstance(item, RennsButton) and item.overlay:
+                    item.overlay.set_node_opacity(self._opacity)
         self._sync_pill_shadow()
-        self.update()
+        self._invalidate()
     pill_opacity = Property(float, getPillOpacity, setPillOpacity)
 
     # ── Slot colors ───────────────────────────────────────────
@@ -368,15 +443,15 @@ class _PillOverlay(QWidget):
         self._slot_borders.clear()
         self._slot_scales.clear()
         b = RennsStyle.get(self.class_name, "base")
-        self._slot_colors.append(_SlotColor(parse_css_color(b.get("background", "#2d2f3a")), self.update))
-        self._slot_borders.append(_SlotBorder(parse_css_color(b.get("border-color", "#00000000")), self.update))
-        self._slot_scales.append(_SlotScale(1.0, self.update))
+        self._slot_colors.append(_SlotColor(parse_css_color(b.get("background", "#2d2f3a")), self._invalidate))
+        self._slot_borders.append(_SlotBorder(parse_css_color(b.get("border-color", "#00000000")), self._invalidate))
+        self._slot_scales.append(_SlotScale(1.0, self._invalidate))
         for item in self.items:
             if isinstance(item, dict):
                 ib = RennsStyle.get(item.get("class", self.class_name), "base")
-                self._slot_colors.append(_SlotColor(parse_css_color(ib.get("background", "#3b3f52")), self.update))
-                self._slot_borders.append(_SlotBorder(parse_css_color(ib.get("border-color", "#00000000")), self.update))
-                self._slot_scales.append(_SlotScale(1.0, self.update))
+                self._slot_colors.append(_SlotColor(parse_css_color(ib.get("background", "#3b3f52")), self._invalidate))
+                self._slot_borders.append(_SlotBorder(parse_css_color(ib.get("border-color", "#00000000")), self._invalidate))
+                self._slot_scales.append(_SlotScale(1.0, self._invalidate))
             else:
                 self._slot_colors.append(None)
                 self._slot_borders.append(None)
@@ -436,9 +511,9 @@ class _PillOverlay(QWidget):
         self._sync_button_overlays()
         self._sync_pill_shadow()
 
-    def _make_transform(self) -> QTransform:
+    def _make_transform(self, scale: float = None) -> QTransform:
         pvx, pvy = self._pivot_in_canvas()
-        s = self._pill_scale
+        s = self._pill_scale if scale is None else scale
         t = QTransform()
         t.translate(pvx, pvy)
         t.scale(s, s)
@@ -516,7 +591,7 @@ class _PillOverlay(QWidget):
         """
         if not self.isVisible():
             return
-        if getattr(self, '_entry_animating', False):
+        if self._entry_animating:
             return
 
         slots = self._slot_rects()
@@ -572,8 +647,13 @@ class _PillOverlay(QWidget):
     def paintEvent(self, event):
         if self._opacity <= 0.0:
             return
+        t0 = RennsQuality.paint_started()
+        RennsQuality.painted(self)
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        # LOD adaptif: antialiasing dilepas selama pill animasi buka/tutup
+        moving = abs(self._pill_scale - 1.0) > 0.001
+        painter.setRenderHint(QPainter.Antialiasing,
+                              not moving or RennsQuality.value("aa_motion"))
         painter.setRenderHint(QPainter.TextAntialiasing)
         painter.setOpacity(self._opacity)
 
@@ -582,33 +662,23 @@ class _PillOverlay(QWidget):
         slots  = self._slot_rects()
 
         # ── Pill background ───────────────────────────────────
-        base     = RennsStyle.get(self.class_name, "base")
-        pill_bg  = parse_css_color(base.get("background", "#2d2f3a"))
-        raw_r    = float(base.get("border-radius", min(ph, pw) / 2))
+        plan     = _style_plan(self.class_name)
+        raw_r    = plan.radius if plan.radius is not None else min(ph, pw) / 2
         pill_rad = min(raw_r, ph / 2, pw / 2)
         pill_rect = QRectF(ox, oy, pw, ph)
-
-        border_color = base.get("border-color", None)
-        try:    border_width = float(base.get("border-width", 0))
-        except: border_width = 0
+        pill_t   = self._make_transform()
 
         # ── Backdrop blur — pakai pill transform supaya ikut scale animasi ──
-        _backdrop_css = base.get("backdrop-filter", "")
-        if _backdrop_css:
+        if plan.backdrop_css:
             draw_backdrop_blur(painter, self, pill_rect.toRect(), pill_rad,
-                               _backdrop_css, transform=self._make_transform())
+                               plan.backdrop_css, transform=pill_t,
+                               blur_r=plan.backdrop_blur)
 
         # Transform untuk animasi scale/expand pill
-        painter.setTransform(self._make_transform())
+        painter.setTransform(pill_t)
 
-        painter.setBrush(QBrush(pill_bg))
-        if border_color and border_width > 0:
-            from PySide6.QtGui import QPen
-            pen = QPen(parse_css_color(border_color))
-            pen.setWidthF(border_width)
-            painter.setPen(pen)
-        else:
-            painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(plan.bg))
+        painter.setPen(plan.border_pen if plan.border_pen is not None else Qt.NoPen)
         painter.drawRoundedRect(pill_rect, pill_rad, pill_rad)
         painter.setClipRect(pill_rect.toAlignedRect())
 
@@ -638,19 +708,15 @@ class _PillOverlay(QWidget):
             self._draw_slot(painter, rect, cname, text, bg_c, bdr_c, anim_sc, hov, prs)
 
         painter.setClipping(False)
+        painter.end()
+        RennsQuality.paint_finished(t0)
 
     def _draw_slot(self, painter, rect: QRectF, class_name: str,
                    text: str, bg_color: QColor, animated_border,
                    anim_scale: float, hovered: bool, pressed: bool):
         state  = "active" if pressed else "hover" if hovered else "base"
-        base   = RennsStyle.get(class_name, "base")
-        props  = RennsStyle.get(class_name, state)
-        merged = {**base, **props}
-
-        fg     = merged.get("color", "#ffffff")
-        radius = float(merged.get("border-radius", 10))
-        fs     = int(float(merged.get("font-size", 13)))
-        fw     = merged.get("font-weight", "normal").strip().lower()
+        plan   = _style_plan(class_name, state)
+        radius = plan.radius if plan.radius is not None else 10.0
         painter.save()
         if abs(anim_scale - 1.0) > 0.001:
             cx, cy = rect.center().x(), rect.center().y()
@@ -658,12 +724,10 @@ class _PillOverlay(QWidget):
             st.translate(cx, cy); st.scale(anim_scale, anim_scale); st.translate(-cx, -cy)
             painter.setTransform(st, True)
 
-        try:    border_width = float(merged.get("border-width", 0))
-        except: border_width = 0
+        border_width = plan.border_width
 
         painter.setBrush(QBrush(bg_color))
         if animated_border and border_width > 0 and animated_border.alpha() > 0:
-            from PySide6.QtGui import QPen
             pen = QPen(animated_border)
             pen.setWidthF(border_width)
             painter.setPen(pen)
@@ -675,9 +739,10 @@ class _PillOverlay(QWidget):
             r_int  = rect.toAlignedRect()
             pm_w   = max(1, r_int.width())
             pm_h   = max(1, r_int.height())
-            pm = self._get_slot_text_pm(text, fg, fs, fw, pm_w, pm_h)
+            pm = self._get_slot_text_pm(text, plan.fg, plan.font_size,
+                                        plan.font_weight, pm_w, pm_h)
             painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            painter.drawPixmap(r_int, pm, QRect(0, 0, pm_w, pm_h))
+            painter.drawPixmap(r_int, pm)
         painter.restore()
 
     def _trig_label(self) -> str:
@@ -686,39 +751,10 @@ class _PillOverlay(QWidget):
 
     def _get_slot_text_pm(self, text: str, color_str: str, font_size: int,
                           font_weight: str, pm_w: int, pm_h: int):
-        """Cache text pixmap persis seperti RennsOverlay._get_text_pixmap."""
-        key = (text, font_size, color_str, font_weight, pm_w, pm_h)
-        if key in self._text_pm_cache:
-            return self._text_pm_cache[key]
-
-        font = QFont()
-        font.setPixelSize(max(1, font_size))
-        font.setHintingPreference(QFont.HintingPreference.PreferNoHinting)
-        fw = font_weight.strip().lower()
-        if   fw == "bold":      font.setBold(True)
-        elif fw == "medium":    font.setWeight(QFont.Weight.Medium)
-        elif fw == "semibold":  font.setWeight(QFont.Weight.DemiBold)
-        elif fw == "thin":      font.setWeight(QFont.Weight.Thin)
-        elif fw == "light":     font.setWeight(QFont.Weight.Light)
-
-        from PySide6.QtGui import QPixmap
-        dpr = self.devicePixelRatioF()
-        pm  = QPixmap(int(pm_w * dpr), int(pm_h * dpr))
-        pm.setDevicePixelRatio(dpr)
-        pm.fill(Qt.transparent)
-
-        p = QPainter(pm)
-        p.setRenderHint(QPainter.TextAntialiasing)
-        p.setFont(font)
-        p.setPen(QColor(color_str))
-        p.drawText(QRect(0, 0, pm_w, pm_h), Qt.AlignCenter, text)
-        p.end()
-
-        # Batasi cache supaya tidak bocor memori
-        if len(self._text_pm_cache) > 64:
-            self._text_pm_cache.pop(next(iter(self._text_pm_cache)))
-        self._text_pm_cache[key] = pm
-        return pm
+        """Raster text dari RennsTextCache, share dengan RennsOverlay."""
+        spec = ("", max(1, font_size), font_weight.strip().lower())
+        return RennsTextCache.get(text, spec, color_str, pm_w, pm_h,
+                                  self.devicePixelRatioF())
 
     # ── Mouse (hanya untuk dict slots + trigger) ──────────────
 
@@ -743,7 +779,7 @@ class _PillOverlay(QWidget):
             self._hovered_idx = idx
             if old >= 0: self._color_slot(old, "active" if self._pressed_idx == old else "base")
             if idx >= 0: self._color_slot(idx, "hover")
-            self.update()
+            self._invalidate()
         self.setCursor(QCursor(Qt.PointingHandCursor if idx >= 0 else Qt.ArrowCursor))
 
     def mousePressEvent(self, event):
@@ -754,7 +790,7 @@ class _PillOverlay(QWidget):
             self._pressed_idx = idx
             if old >= 0: self._color_slot(old, "hover" if self._hovered_idx == old else "base")
             self._color_slot(idx, "active")
-            self.update()
+            self._invalidate()
             event.accept()
         else:
             event.ignore()
@@ -770,7 +806,7 @@ class _PillOverlay(QWidget):
         if fired:
             if idx == 0: self.close_requested.emit()
             else:        self.item_clicked.emit(idx - 1)
-        self.update()
+        self._invalidate()
         if idx >= 0:
             event.accept()
         else:
@@ -781,18 +817,16 @@ class _PillOverlay(QWidget):
         if self._pressed_idx  >= 0: self._color_slot(self._pressed_idx,  "base")
         self._hovered_idx = -1
         self._pressed_idx = -1
-        self.update()
+        self._invalidate()
 
     # ── Show / hide button items ───────────────────────────────
 
     def _show_button_items(self):
         """
         Show button items: tiap item animate dari posisi TRIGGER → posisi FINAL,
-        sambil scale overlay 0→1. Stagger antar item.
+        sambil scale overlay 0→1. Stagger antar item lewat satu RennsStagger.
         """
         self._entry_animating = True
-        if not hasattr(self, '_entry_anims'):
-            self._entry_anims = []
 
         n_btn      = sum(1 for it in self.items if isinstance(it, RennsButton))
         stagger_ms = min(50, self._dur_ms // max(n_btn * 2, 1))
@@ -819,12 +853,20 @@ class _PillOverlay(QWidget):
                         ov.color_anim.stop()
                         ov._bg_color = parse_css_color(bg)
                 ov.anim.stop()
+                # Scale dipegang stagger selama entry — hover tidak boleh
+                # retarget ov.anim yang ikut menulis scale tiap frame
+                ov.hold_channel("scale")
                 ov._scale = 0.0
-                ov.setWindowOpacity(0.0)
+                ov.set_node_opacity(0.0)
+                # Item harus di atas pill (widget biasa) — tidak bisa lewat
+                # canvas compositor yang z-order-nya satu untuk semua overlay
+                ov.detach_from_compositor()
                 ov.show()
                 ov.raise_()
 
         def _deferred_start():
+            self._entry_call = None
+
             # Titik START = center trigger di window coords
             trig_center = self._trigger_ref.mapTo(
                 self.window(), self._trigger_ref.rect().center()
@@ -834,18 +876,15 @@ class _PillOverlay(QWidget):
 
             # Kumpulkan posisi FINAL tiap item (dari slot rect, pill scale=1)
             slots = self._slot_rects()
+            st    = self._entry
+            order = []
 
-            self._entry_anims.clear()
-
-            btn_idx = 0
-            last_end_ms = 0
             for i, item in enumerate(self.items):
                 if not isinstance(item, RennsButton) or not item.overlay:
                     continue
 
                 slot_idx = i + 1
                 if slot_idx >= len(slots) or slots[slot_idx] is None:
-                    btn_idx += 1
                     continue
 
                 r = slots[slot_idx]
@@ -857,10 +896,6 @@ class _PillOverlay(QWidget):
                 ow = ov.width()
                 oh = ov.height()
 
-                # Posisi final overlay (top-left)
-                final_ox = final_win_cx - ow // 2
-                final_oy = final_win_cy - oh // 2
-
                 # Posisi start overlay (center = trigger center)
                 start_ox = trig_win_x - ow // 2
                 start_oy = trig_win_y - oh // 2
@@ -868,77 +903,53 @@ class _PillOverlay(QWidget):
                 # Posisi final item widget (relatif pill)
                 bw = item._layout_w if item._layout_w > 0 else (ov._btn_w if ov._btn_w > 0 else item.width())
                 bh = item._layout_h if item._layout_h > 0 else (ov._btn_h if ov._btn_h > 0 else item.height())
-                final_item_x = final_win_cx - self.x() - bw // 2
-                final_item_y = final_win_cy - self.y() - bh // 2
+                start_item = QPoint(trig_win_x - self.x() - bw // 2, trig_win_y - self.y() - bh // 2)
 
-                # Taruh di posisi start dulu
+                # Taruh di posisi start dulu — item yang masih nunggu giliran
+                # stagger diam di trigger dengan opacity 0
                 ov.move(start_ox, start_oy)
-                item.move(trig_win_x - self.x() - bw // 2, trig_win_y - self.y() - bh // 2)
-
-                delay = btn_idx * stagger_ms
-                last_end_ms = delay + entry_dur + 60
-
-                def _launch(
-                    overlay=ov, itm=item,
-                    sox=start_ox, soy=start_oy,
-                    fox=final_ox, foy=final_oy,
-                    fix=final_item_x, fiy=final_item_y,
-                    bw_=bw, bh_=bh,
-                    d=delay, dur=entry_dur
-                ):
-                    def _go():
-                        # ── Animate posisi overlay: start → final ──
-                        pos_anim = QPropertyAnimation(overlay, b"pos")
-                        pos_anim.setStartValue(QPoint(sox, soy))
-                        pos_anim.setEndValue(QPoint(fox, foy))
-                        pos_anim.setDuration(dur)
-                        pos_anim.setEasingCurve(self._easing)
-                        pos_anim.start()
-                        overlay._entry_pos_anim = pos_anim  # anti-GC
-
-                        # Gerakkan juga item widget bareng overlay
-                        itm_pos_anim = QPropertyAnimation(itm, b"pos")
-                        start_item = itm.pos()
-                        itm_pos_anim.setStartValue(start_item)
-                        itm_pos_anim.setEndValue(QPoint(fix, fiy))
-                        itm_pos_anim.setDuration(dur)
-                        itm_pos_anim.setEasingCurve(self._easing)
-                        itm_pos_anim.start()
-                        overlay._entry_item_pos_anim = itm_pos_anim  # anti-GC
-
-                        # ── Scale overlay 0 → 1 ──
-                        overlay.anim.stop()
-                        overlay.anim.setStartValue(0.0)
-                        overlay.anim.setEndValue(1.0)
-                        overlay.anim.setDuration(dur)
-                        overlay.anim.setEasingCurve(self._easing)
-                        overlay.anim.start()
-
-                        # ── Opacity fade in ──
-                        op = QPropertyAnimation(overlay, b"windowOpacity")
-                        op.setStartValue(0.0)
-                        op.setEndValue(1.0)
-                        op.setDuration(min(120, dur // 3))
-                        op.setEasingCurve(QEasingCurve.OutCubic)
-                        op.start()
-                        overlay._entry_op_anim = op  # anti-GC
-
-                        self._entry_anims.extend([pos_anim, itm_pos_anim, op])
-
-                    if d > 0:
-                        QTimer.singleShot(d, _go)
-                    else:
-                        _go()
-
-                _launch()
-                btn_idx += 1
-
-            def _clear():
-                self._entry_animating = False
-                self._sync_button_overlays_final()
-            QTimer.singleShot(last_end_ms, _clear)
-
-        QTimer.singleShot(0, _deferred_start)
+                item.move(start_item)
+
+                st.animate(ov, b"pos", QPoint(start_ox, start_oy),
+                           QPoint(final_win_cx - ow // 2, final_win_cy - oh // 2),
+                           entry_dur, self._easing, key=item)
+                st.animate(item, b"pos", start_item,
+                           QPoint(final_win_cx - self.x() - bw // 2,
+                                  final_win_cy - self.y() - bh // 2),
+                           entry_dur, self._easing, key=item)
+                st.animate(ov, b"scale", 0.0, 1.0,
+                           entry_dur, self._easing, key=item)
+                st.animate(ov, b"opacity", 0.0, 1.0,
+                           min(120, entry_dur // 3), QEasingCurve(QEasingCurve.OutCubic), key=item)
+                order.append(item)
+
+            if order:
+                st.start(order, stagger_ms)
+            else:
+                self._on_entry_done()
+
+        self._cancel_entry()
+        self._entry_call = RennsEngine.call_later(0, _deferred_start)
+
+    def _cancel_entry(self):
+        """Batalkan entry yang belum mulai / sedang jalan — tidak ada timer tersisa."""
+        if self._entry_call is not None:
+            self._entry_call.cancel()
+            self._entry_call = None
+        self._entry.cancel()
+
+    def _on_entry_done(self):
+        self._entry_animating = False
+        self._release_item_scale(sync_state=True)
+        self._sync_button_overlays_final()
+
+    def _release_item_scale(self, sync_state: bool = False):
+        for item in self.items:
+            if isinstance(item, RennsButton) and item.overlay:
+                item.overlay.hold_channel("scale", False)
+                # Hover/press yang masuk selama entry baru berlaku sekarang
+                if sync_state:
+                    item.update_visual_state()
 
     def _hide_button_items(self):
         # Item adalah child of pill — saat pill.hide() dipanggil nanti, item ikut
@@ -955,6 +966,7 @@ class _PillOverlay(QWidget):
         _safe_disconnect(self._scale_anim.finished)
         self._rebuild_slot_colors()
         self.sync_position()
+        self._dirty_bounds = None
         self.show()
         self.raise_()
         self._show_button_items()
@@ -966,6 +978,7 @@ class _PillOverlay(QWidget):
         _safe_disconnect(self._scale_anim.finished)
 
         self._scale_anim.stop()
+        self._scale_anim.setDuration(self._dur_ms)
         self._scale_anim.setStartValue(self._pill_scale)
         self._scale_anim.setEndValue(1.0)
         self._scale_anim.start()
@@ -981,14 +994,19 @@ class _PillOverlay(QWidget):
     def collapse(self):
         _safe_disconnect(self._scale_anim.finished)
         _safe_disconnect(self._opacity_anim.finished)
-        self._entry_animating = False  # batalkan entry mode kalau collapse duluan
+        # Batalkan entry kalau collapse duluan — stagger stop atomik
+        self._cancel_entry()
+        self._entry_animating = False
+        self._release_item_scale()
 
-        # Reset windowOpacity item overlays supaya tidak stuck di 0
+        # Item overlays mulai dari opacity pill saat ini (entry bisa
+        # berhenti di tengah fade), lalu ikut fade-out pill
         for item in self.items:
             if isinstance(item, RennsButton) and item.overlay:
-                item.overlay.setWindowOpacity(1.0)
+                item.overlay.set_node_opacity(self._opacity)
 
         self._scale_anim.stop()
+        self._scale_anim.setDuration(self._dur_ms)
         self._scale_anim.setStartValue(self._pill_scale)
         self._scale_anim.setEndValue(0.0)
         self._scale_anim.start()
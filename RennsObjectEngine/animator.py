@@ -8,10 +8,11 @@
 from PySide6.QtCore import QObject, QEvent
 from PySide6.QtGui import QIcon
 from .button.button_ext.css_color import parse_css_color
-from .button.overlay import RennsOverlay, OVERLAY_CANVAS_FACTOR
+from .button.overlay import RennsOverlay, canvas_size
 from .renns_style import RennsStyle
 from .button.button_ext.animation import resolve_easing
 from .button.button_ext.transform import parse_transform
+from .engine import RennsEngine
 from PySide6.QtCore import QPropertyAnimation, QEasingCurve
 from PySide6.QtGui import QColor
 
@@ -32,7 +33,7 @@ class RennsAnimator(QObject):
 
         self.widget.installEventFilter(self)
 
-        self.anim = QPropertyAnimation(self.overlay, b"scale")
+        self.anim = RennsEngine.animation(self.overlay, b"scale")
         self.anim.setEasingCurve(QEasingCurve.OutCubic)
 
         self.update_visual_state()
@@ -91,7 +92,7 @@ class RennsAnimator(QObject):
         curve = resolve_easing(easing)
 
         self.anim.stop()
-        self.anim.setDuration(int(duration * 1000))
+        self.anim.setDuration(RennsEngine.duration(duration * 1000))
         self.anim.setEasingCurve(curve)
         self.anim.setEndValue(scale)
         self.anim.start()
@@ -103,13 +104,13 @@ class RennsAnimator(QObject):
             self.overlay.bgColor = parse_css_color(bg)
 
         self.overlay.style_data = merged
-        self.overlay.update()
+        self.overlay.mark_dirty()
 
         self._sync_overlay_position()
 
     def _sync_overlay_position(self):
         """
-        Overlay canvas lebih besar dari widget (OVERLAY_CANVAS_FACTOR x).
+        Overlay canvas seukuran transform terbesar class (canvas_size).
         Di-center tepat di atas widget supaya animasi scale tidak ter-crop.
         """
         bw = self.widget.width()
@@ -117,20 +118,18 @@ class RennsAnimator(QObject):
 
         self.overlay._button_width = bw
         self.overlay._button_height = bh
+        self.overlay._btn_w = bw
+        self.overlay._btn_h = bh
 
-        canvas_w = int(bw * OVERLAY_CANVAS_FACTOR)
-        canvas_h = int(bh * OVERLAY_CANVAS_FACTOR)
-
-        offset_x = (canvas_w - bw) // 2
-        offset_y = (canvas_h - bh) // 2
+        canvas_w, canvas_h = canvas_size(self.class_name, None, bw, bh)
+        if canvas_w != self.overlay._plan_w or canvas_h != self.overlay._plan_h:
+            self.overlay.set_canvas_size(canvas_w, canvas_h)
 
         # Posisi center widget di window
         center = self.widget.mapTo(self.widget.window(),
                                    self.widget.rect().center())
 
         self.overlay.move(
-            center.x() - canvas_w // 2,
-            center.y() - canvas_h // 2
-        )
-
-        self.overlay.resize(canvas_w, canvas_h)
\ No newline at end of file
+            center.x() - self.overlay.width() // 2,
+            center.y() - self.overlay.height() // 2
+        )
\ No newline at end of file
@@ -5,17 +5,40 @@
 # Author: @ahsanihlwn
 # Copyright (c) 2026 @ahsanihlwn
 
+import weakref
+
 from PySide6.QtWidgets import QPushButton
 from PySide6.QtCore import QPropertyAnimation, QEasingCurve, Property, Qt, QSize
-from PySide6.QtGui import QIcon, QPainter
+from PySide6.QtGui import QPainter, QCursor
 from .button_ext.css_color import parse_css_color
 from PySide6.QtCore import QPointF
 from ..renns_style import RennsStyle
-from .overlay import RennsOverlay
-from .button_ext.animation import resolve_easing
+from .overlay import RennsOverlay, canvas_size
+from .button_ext.animation import resolve_easing, retarget
 from .button_ext.transform import parse_transform
+from .button_ext.pointer import PointerSampler
+from ..engine import RennsEngine
+from ..visibility import RennsVisibility
+from ..icon_cache import RennsIcon
 from PySide6.QtGui import QColor
 
+def _call_hover_intent(button, dwell: int):
+    # Callback cuma pegang weakref — button yang dihapus selama dwell
+    # tidak ditahan hidup dan callback-nya jadi no-op
+    ref = weakref.ref(button)
+
+    def _fire():
+        b = ref()
+        if b is None:
+            return
+        try:
+            b._check_hover_intent(dwell)
+        except RuntimeError:
+            pass   # objek C++ sudah dihapus
+
+    return RennsEngine.call_later(dwell, _fire)
+
+
 class RennsButton(QPushButton):
     def __init__(
         self,
@@ -33,17 +56,15 @@ class RennsButton(QPushButton):
         self.duration_ms = int(duration * 1000)
         self.render_type = render_type
 
-        if icon_path:
-            self.icon_obj = QIcon(icon_path)
-        else:
-            self.icon_obj = None
+        # RennsIcon — file di-decode sekali per proses, raster di-cache bareng
+        self.icon_obj = RennsIcon.from_any(icon_path) if icon_path else None
 
         self.setStyleSheet("border:none; background:transparent;")
 
         self._scale = 1.0
         self.target_scale = 1.0 + self.hover_percent
 
-        self.anim = QPropertyAnimation(self, b"scale")
+        self.anim = RennsEngine.animation(self, b"scale")
         self.overlay = None
         self.anim.setDuration(self.duration_ms)
         self.anim.setEasingCurve(QEasingCurve.OutCubic)
@@ -51,9 +72,17 @@ class RennsButton(QPushButton):
         self._overlay_active = False
         self._hovered = False
         self._pressed = False
+        # Hover intent — call_later handle selama pointer belum "niat" hover
+        self._intent_call = None
+        self._intent_pos  = None
+        # Panjang lintasan pointer selama dwell (bukan jarak ujung ke ujung)
+        self._intent_path = 0.0
+        self._intent_tracking = None   # mouseTracking sebelum dwell
         self._drag_origin = None
         self._drag_offset = QPointF(0, 0)
         self._elastic_radius = 0.0
+        # Move event dikumpulkan, elastic dihitung sekali per frame
+        self._pointer = PointerSampler(self._on_pointer_frame)
 
         self._class_name = None
         self._component = None
@@ -83,6 +112,11 @@ class RennsButton(QPushButton):
         self.overlay.show()
         self._overlay_ready = True
 
+        # Overlay/shadow di-parent ke window — culling saat button
+        # ke-scroll keluar, tab tidak aktif, atau window minimized
+        RennsVisibility.watch(self, self._on_visibility_changed,
+                              self._on_ancestor_moved)
+
         if self._pending_class:
             self._apply_class(self._pending_class, self._pending_component)
             self._pending_class = None
@@ -146,13 +180,10 @@ class RennsButton(QPushButton):
             self.resize(btn_w, btn_h)
             self.updateGeometry()
 
-        OVERLAY_MULTIPLIER = 5
-        overlay_w = int(btn_w * OVERLAY_MULTIPLIER)
-        overlay_h = int(btn_h * OVERLAY_MULTIPLIER)
-
-        self.overlay.resize(overlay_w, overlay_h)
+        # Canvas pas dengan transform terbesar class ini (bukan 5x tombol)
         self.overlay._btn_w = btn_w
         self.overlay._btn_h = btn_h
+        self.overlay.set_canvas_size(*canvas_size(class_name, component, btn_w, btn_h))
 
         if not self._managed_z_order:
             self.overlay.show()
@@ -185,23 +216,32 @@ class RennsButton(QPushButton):
         style_data = self._resolve_style_for_render(state)
         scale, rotate, duration, easing_name = self._resolve_style(state)
 
+        # Keyframe animation — channel yang dipegang track tidak ditransisi
+        self.overlay.set_animation(style_data.get("animation"),
+                                   self._class_name, self._component)
+
         bg = style_data.get("background")
-        if bg and self.overlay:
-            new_color = parse_css_color(bg)
-            self.overlay.color_anim.stop()
-            self.overlay.color_anim.setStartValue(self.overlay.bgColor)
-            self.overlay.color_anim.setEndValue(new_color)
-            self.overlay.color_anim.setDuration(int(duration * 1000))
-            self.overlay.color_anim.start()
+        if bg and self.overlay and not self.overlay.track_owns("background"):
+            retarget(self.overlay.color_anim, parse_css_color(bg),
+                     RennsEngine.duration(duration * 1000))
 
         if self.overlay:
             self.overlay.style_data = style_data
+            # `icon:` per state (path / atlas cell) menimpa icon dari kode
+            icon_css = style_data.get("icon")
+            icon = RennsIcon.from_css(icon_css, style_data.get("atlas-cell")) \
+                if icon_css else self.icon_obj
+            if icon is not self.overlay.icon:
+                self.overlay.icon = icon
             try:
                 target_fs = float(style_data.get("font-size", "13"))
             except:
                 target_fs = 13.0
-            self.overlay.set_font_size(target_fs)
-            self.overlay.update()
+            # font-size beda per state → transisi pakai transition state ini
+            self.overlay.set_font_size(target_fs,
+                                       RennsEngine.duration(duration * 1000),
+                                       resolve_easing(easing_name))
+            self.overlay.mark_dirty()
 
         self._apply_animation(scale, duration, easing_name, rotate)
 
@@ -298,19 +338,19 @@ class RennsButton(QPushButton):
 
         curve = resolve_easing(easing_name)
 
-        self.overlay.anim.stop()
-        self.overlay.anim.setStartValue(self.overlay.scale)
-        self.overlay.anim.setEasingCurve(curve)
-        self.overlay.anim.setDuration(int(duration * 1000))
-        self.overlay.anim.setEndValue(scale)
-        self.overlay.anim.start()
+        dur_ms = RennsEngine.duration(duration * 1000)
 
-        self.overlay.rotate_anim.stop()
-        self.overlay.rotate_anim.setStartValue(self.overlay.rotate)
-        self.overlay.rotate_anim.setEasingCurve(curve)
-        self.overlay.rotate_anim.setDuration(int(duration * 1000))
-        self.overlay.rotate_anim.setEndValue(rotate)
-        self.overlay.rotate_anim.start()
+        # Retarget, bukan stop-and-restart: state yang sama di-skip,
+        # balik arah di tengah jalan lanjut dari posisi sekarang
+        if self.overlay.track_owns("scale"):
+            self.overlay.anim.stop()
+        else:
+            retarget(self.overlay.anim, scale, dur_ms, curve)
+
+        if self.overlay.track_owns("rotate"):
+            self.overlay.rotate_anim.stop()
+        else:
+            retarget(self.overlay.rotate_anim, rotate, dur_ms, curve)
 
     # ======================
     # SCALE PROPERTY
@@ -333,10 +373,27 @@ class RennsButton(QPushButton):
             center.y() - self.overlay.height() // 2
         )
 
+    def _on_visibility_changed(self, visible: bool):
+        if self.overlay:
+            if visible:
+                self._sync_overlay_position()
+                self.overlay.resume()
+            else:
+                self.overlay.suspend()
+        if self._shadow:
+            self._shadow.set_culled(not visible)
+
+    def _on_ancestor_moved(self):
+        # Scroll / layout parent bergeser → overlay & shadow ikut
+        self._sync_overlay_position()
+        if self._shadow:
+            self._shadow._sync_pos()
+
     def _clear_overlay(self):
         if self.overlay:
             if self.overlay.anim:
                 self.overlay.anim.stop()
+            self.overlay.stop_track()
             self.overlay.deleteLater()
             self.overlay = None
 
@@ -353,22 +410,104 @@ class RennsButton(QPushButton):
         super().resizeEvent(event)
 
     def enterEvent(self, event):
-        self._hovered = True
-        self.update_visual_state()
+        dwell = self._hover_intent_ms()
+        if dwell > 0 and not self._pressed:
+            self._arm_hover_intent(dwell)
+        else:
+            self._hovered = True
+            self.update_visual_state()
         super().enterEvent(event)
 
     def leaveEvent(self, event):
+        if self._intent_call is not None:
+            # Cuma lewat — hover belum pernah tampil, tidak ada yang dibalik
+            self._cancel_hover_intent()
+            super().leaveEvent(event)
+            return
         self._hovered = False
         self.update_visual_state()
         super().leaveEvent(event)
 
+    # ======================
+    # HOVER INTENT
+    # ======================
+
+    def _hover_intent_ms(self) -> int:
+        """CSS `hover-intent: 80ms | 0.08s | none`, fallback RennsEngine.hover_intent()."""
+        dwell = RennsEngine.hover_intent()[0]
+        if not self._class_name:
+            return dwell
+        raw = RennsStyle.get(self._class_name, "base", self._component).get("hover-intent")
+        if raw is None:
+            return dwell
+        raw = raw.strip().lower()
+        if raw in ("none", "off", "0"):
+            return 0
+        try:
+            if raw.endswith("ms"):
+                return max(0, int(float(raw[:-2])))
+            if raw.endswith("s"):
+                return max(0, int(float(raw[:-1]) * 1000))
+            return max(0, int(float(raw)))
+        except ValueError:
+            return dwell
+
+    def _arm_hover_intent(self, dwell: int):
+        self._cancel_hover_intent()
+        # Move event tanpa tombol ditekan hanya datang dengan mouseTracking
+        self._intent_tracking = self.hasMouseTracking()
+        self.setMouseTracking(True)
+        self._intent_pos  = QCursor.pos()
+        self._intent_path = 0.0
+        self._intent_call = _call_hover_intent(self, dwell)
+
+    def _track_hover_intent(self, pos):
+        # Jumlah tiap langkah — sapuan bolak-balik tetap terhitung cepat
+        self._intent_path += (pos - self._intent_pos).manhattanLength()
+        self._intent_pos   = pos
+
+    def _check_hover_intent(self, dwell: int):
+        self._intent_call = None
+        self._track_hover_intent(QCursor.pos())
+        speed = self._intent_path / max(1, dwell)
+        if speed > RennsEngine.hover_intent()[1]:
+            # Masih nyapu cepat di atas button → tunggu satu dwell lagi
+            self._intent_path = 0.0
+            self._intent_call = _call_hover_intent(self, dwell)
+            return
+        self._end_hover_intent()
+        self._hovered = True
+        self.update_visual_state()
+
+    def _cancel_hover_intent(self):
+        if self._intent_call is not None:
+            self._intent_call.cancel()
+            self._intent_call = None
+        self._end_hover_intent()
+
+    def _end_hover_intent(self):
+        if self._intent_tracking is not None:
+            self.setMouseTracking(self._intent_tracking)
+            self._intent_tracking = None
+
+    def hideEvent(self, event):
+        # Button disembunyikan/dihapus selama dwell → hover batal
+        self._cancel_hover_intent()
+        super().hideEvent(event)
+
     def mousePressEvent(self, event):
+        # Klik = niat pasti — hover yang masih ditunda langsung berlaku
+        if self._intent_call is not None:
+            self._cancel_hover_intent()
+            self._hovered = True
         self._pressed = True
         self._drag_origin = event.position()
+        self._pointer.reset(event.position())
         self.update_visual_state()
         super().mousePressEvent(event)
 
     def mouseReleaseEvent(self, event):
+        self._pointer.flush()
         self._pressed = False
         self.update_visual_state()
         self._drag_origin = None
@@ -379,11 +518,17 @@ class RennsButton(QPushButton):
         super().mouseReleaseEvent(event)
 
     def mouseMoveEvent(self, event):
-        from .button_ext.elastic import apply_elastic
+        if self._intent_call is not None:
+            self._track_hover_intent(event.globalPosition().toPoint())
         if self._pressed and self._elastic_radius > 0 and self.overlay:
-            apply_elastic(self, event)
+            self._pointer.push(event.position())
         super().mouseMoveEvent(event)
 
+    def _on_pointer_frame(self, pos):
+        from .button_ext.elastic import apply_elastic
+        if self._pressed and self._elastic_radius > 0 and self.overlay:
+            apply_elastic(self, pos)
+
     # ======================
     # PAINT
     # ======================
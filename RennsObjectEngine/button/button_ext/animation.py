@@ -5,7 +5,8 @@
 # Author: @ahsanihlwn
 # Copyright (c) 2026 @ahsanihlwn
 
-from PySide6.QtCore import QEasingCurve, QPointF
+from PySide6.QtCore import QEasingCurve, QPointF, QPoint, QAbstractAnimation
+from PySide6.QtGui import QColor
 
 def resolve_easing(name: str) -> QEasingCurve:
     if name == "linear":
@@ -39,3 +40,129 @@ def resolve_easing(name: str) -> QEasingCurve:
         return curve
 
     return QEasingCurve(QEasingCurve.InOutCubic)
+
+
+# ─────────────────────────── Retargeting ───────────────────────────
+
+# Slope awal kurva retarget dibatasi: terlalu curam → overshoot besar
+# saat sisa jarak kecil, terlalu negatif → mundur jauh saat balik arah
+_SLOPE_MIN = -3.0
+_SLOPE_MAX = 3.0
+# Di bawah ini dianggap diam — kurva yang diminta dipakai apa adanya
+_SLOPE_REST = 0.05
+
+
+def _distance(a, b) -> float:
+    if isinstance(a, QColor) and isinstance(b, QColor):
+        return max(abs(a.red() - b.red()), abs(a.green() - b.green()),
+                   abs(a.blue() - b.blue()), abs(a.alpha() - b.alpha())) / 255.0
+    if isinstance(a, (QPoint, QPointF)) and isinstance(b, (QPoint, QPointF)):
+        return abs(a.x() - b.x()) + abs(a.y() - b.y())
+    try:
+        return abs(float(a) - float(b))
+    except (TypeError, ValueError):
+        return 0.0 if a == b else 1.0
+
+
+def _components(v) -> tuple:
+    if isinstance(v, QColor):
+        return (v.red() / 255.0, v.green() / 255.0, v.blue() / 255.0, v.alpha() / 255.0)
+    if isinstance(v, (QPoint, QPointF)):
+        return (float(v.x()), float(v.y()))
+    try:
+        return (float(v),)
+    except (TypeError, ValueError):
+        return ()
+
+
+def _velocity(anim) -> tuple:
+    """Kecepatan animasi yang sedang jalan (unit per ms, per komponen)."""
+    total = anim.duration()
+    a, b  = _components(anim.startValue()), _components(anim.endValue())
+    if total <= 0 or not a or len(a) != len(b):
+        return ()
+    p = min(1.0, max(0.0, anim.currentTime() / total))
+    h = 1e-3
+    lo, hi = max(0.0, p - h), min(1.0, p + h)
+    ease = anim.easingCurve()
+    slope = (ease.valueForProgress(hi) - ease.valueForProgress(lo)) / (hi - lo)
+    if anim.direction() == QAbstractAnimation.Backward:
+        slope = -slope
+    return tuple((bi - ai) * slope / total for ai, bi in zip(a, b))
+
+
+def _continuation_curve(slope: float, curve: QEasingCurve) -> QEasingCurve:
+    """
+    Cubic bezier yang mulai dengan `slope` (progress per progress) dan
+    mendarat seperti `curve` kalau curve itu bezier, selain itu ease-out.
+    """
+    c2 = QPointF(0.58, 1.0)
+    if curve.type() == QEasingCurve.BezierSpline:
+        pts = curve.toCubicSpline()
+        if len(pts) >= 3:
+            c2 = pts[-2]
+    out = QEasingCurve(QEasingCurve.BezierSpline)
+    out.addCubicBezierSegment(QPointF(1 / 3, slope / 3), c2, QPointF(1.0, 1.0))
+    return out
+
+
+def _same(a, b) -> bool:
+    if a is None or b is None:
+        return False
+    return _distance(a, b) < 1e-4
+
+
+def retarget(anim, target, duration_ms: int, curve: QEasingCurve = None) -> bool:
+    """
+    Arahkan animasi ke target baru tanpa stop-and-restart penuh.
+
+    - Sedang menuju target yang sama      → skip
+    - Diam dan nilai sekarang = target    → skip
+    - Sedang jalan ke target lain         → lanjut dari nilai dan kecepatan
+      sekarang. Durasi diskalakan dengan sisa jarak dibanding jarak
+      transisi lama (hover-out cepat = transisi balik pendek). Kecepatan
+      lama (slope kurva lama × span / durasi) diproyeksikan ke arah target
+      baru dan jadi slope awal bezier pengganti easing — tidak ada loncatan
+      kecepatan, balik arah di tengah jalan melambat dulu baru berbalik.
+
+    Return True kalau animasi di-(re)start.
+    """
+    active = anim.state() != QAbstractAnimation.Stopped
+    if active and _same(anim.endValue(), target):
+        return False
+
+    obj     = anim.targetObject()
+    current = obj.property(bytes(anim.propertyName()).decode()) if obj else None
+    if current is None:
+        current = anim.currentValue()
+    if not active and _same(current, target):
+        return False
+
+    full = max(0, int(duration_ms))
+    dur  = full
+    if curve is None:
+        curve = anim.easingCurve()
+
+    if active:
+        span      = _distance(anim.startValue(), anim.endValue())
+        remaining = _distance(current, target)
+        if span > 1e-6:
+            dur = max(int(full * min(1.0, remaining / span)), min(full, 32))
+
+        vel = _velocity(anim)
+        d   = tuple(t - c for c, t in zip(_components(current), _components(target)))
+        dd  = sum(x * x for x in d)
+        if vel and len(vel) == len(d) and dd > 1e-12 and dur > 0:
+            # Slope awal kurva baru = kecepatan lama searah target × durasi / jarak
+            slope = sum(v * x for v, x in zip(vel, d)) / dd * dur
+            slope = max(_SLOPE_MIN, min(_SLOPE_MAX, slope))
+            if abs(slope) > _SLOPE_REST:
+                curve = _continuation_curve(slope, curve)
+
+    anim.stop()
+    anim.setStartValue(current)
+    anim.setEndValue(target)
+    anim.setDuration(dur)
+    anim.setEasingCurve(curve)
+    anim.start()
+    return True
@@ -28,6 +28,9 @@ from PySide6.QtWidgets import (
     QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect
 )
 
+from .raster import new_raster, to_pixmap, native
+from ...quality import RennsQuality
+
 # { win_id: QPixmap }  — raw texture
 _raw: dict = {}
 
@@ -45,21 +48,24 @@ def _do_blur(src: QPixmap, radius: int) -> QPixmap:
     """Blur pixmap. Dipanggil lazy saat pertama kali radius diminta."""
     if radius <= 0:
         return src.copy()
+    # Scene bekerja di pixel: DPR dilepas selama blur (kalau tidak, item
+    # digambar di ukuran logical dan hasil 2x kosong), dipasang lagi di hasil
     dpr   = src.devicePixelRatio()
+    px    = QPixmap(src)
+    px.setDevicePixelRatio(1.0)
     scene = QGraphicsScene()
-    item  = QGraphicsPixmapItem(src)
+    item  = QGraphicsPixmapItem(px)
     fx    = QGraphicsBlurEffect()
     fx.setBlurRadius(radius * dpr)
     fx.setBlurHints(QGraphicsBlurEffect.QualityHint)
     item.setGraphicsEffect(fx)
     scene.addItem(item)
-    out = QPixmap(src.size())
-    out.setDevicePixelRatio(dpr)
-    out.fill(Qt.transparent)
+    out = new_raster(px.width(), px.height())
     p = QPainter(out)
     scene.render(p)
     p.end()
-    return out
+    out.setDevicePixelRatio(dpr)
+    return to_pixmap(out)
 
 
 def set_window_texture(win, pixmap: QPixmap):
@@ -70,7 +76,8 @@ def set_window_texture(win, pixmap: QPixmap):
     if not pixmap or pixmap.isNull():
         return
     win_id = id(win)
-    _raw[win_id]    = pixmap
+    # Konversi format sekali di sini — blur + crop per paint tanpa konversi
+    _raw[win_id]    = native(pixmap)
     _layers[win_id] = {}          # reset cache blur lama
 
 
@@ -89,16 +96,24 @@ def parse_backdrop_blur(css: str) -> float:
     return 0.0
 
 
+def _nearest_layer(layers: dict, radius: int):
+    if not layers:
+        return None
+    return layers[min(layers, key=lambda r: abs(r - radius))]
+
+
 def draw_backdrop_blur(painter: QPainter, overlay,
                        btn_rect, radius: float, css: str,
-                       transform=None):
+                       transform=None, blur_r: float = None):
     """
     Draw blur di btn_rect.
     transform: QTransform lengkap (scale+rotate+elastic+flatten) dari overlay.paintEvent.
     Clip path di-transform dengan benar menggunakan transform.map(path)
     bukan mapRect() yang hanya akurat untuk axis-aligned transform.
+    blur_r: radius yang sudah di-parse (render plan) — css tidak di-parse ulang.
     """
-    blur_r = parse_backdrop_blur(css)
+    if blur_r is None:
+        blur_r = parse_backdrop_blur(css)
 
     win = overlay.window()
     if not win:
@@ -110,13 +125,18 @@ def draw_backdrop_blur(painter: QPainter, overlay,
         return
 
     snapped = _snap_radius(blur_r)
-
-    if win_id not in _layers:
-        _layers[win_id] = {}
-    if snapped not in _layers[win_id]:
-        _layers[win_id][snapped] = _do_blur(raw, snapped)
-
-    layer = _layers[win_id][snapped]
+    layers  = _layers.setdefault(win_id, {})
+    layer   = layers.get(snapped)
+    if layer is None:
+        if not RennsQuality.value("blur_bake"):
+            # LOD turun: bake full-window blur di paint justru stall
+            # di frame yang sudah lewat budget → pakai layer cached
+            # terdekat, atau lewati backdrop sampai quality pulih
+            layer = _nearest_layer(layers, snapped)
+            if layer is None:
+                return
+        else:
+            layer = layers[snapped] = _do_blur(raw, snapped)
     if layer.isNull():
         return
 
@@ -149,12 +169,9 @@ def draw_backdrop_blur(painter: QPainter, overlay,
     crop_w = max(1, int(bb.width()  * sx * dpr))
     crop_h = max(1, int(bb.height() * sy * dpr))
 
-    cropped = layer.copy(crop_x, crop_y, crop_w, crop_h)
-    if cropped.isNull():
-        return
-
     # ── Draw: clip = transformed path, draw di bounding box ─────────
+    # Source rect langsung dari layer — tanpa copy() per paint
     painter.save()
     painter.setClipPath(clip_path)
-    painter.drawPixmap(bb, cropped, QRectF(cropped.rect()))
+    painter.drawPixmap(bb, layer, QRectF(crop_x, crop_y, crop_w, crop_h))
     painter.restore()
\ No newline at end of file
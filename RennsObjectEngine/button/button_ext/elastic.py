@@ -7,18 +7,25 @@
 
 import math
 
+from ...engine import RennsEngine
 
-def apply_elastic(button, event):
+
+def apply_elastic(button, pos):
     """
     Efek elastic drag:
     - Object bergerak dalam bounding box button
     - Makin deket tepi, makin berat (asymptotic via tanh)
     - Makin jauh, makin gepeng sesuai ARAH drag (bukan cuma X/Y)
+
+    pos = posisi pointer lokal (QPointF) — dipanggil sekali per frame
+    oleh PointerSampler, bukan per mouse event. Event lama masih diterima.
     """
+    if hasattr(pos, "position"):
+        pos = pos.position()
     if button._drag_origin is None:
-        button._drag_origin = event.position()
+        button._drag_origin = pos
 
-    delta = event.position() - button._drag_origin
+    delta = pos - button._drag_origin
     dx = delta.x()
     dy = delta.y()
 
@@ -27,7 +34,7 @@ def apply_elastic(button, event):
         button.overlay._elastic_offset_x = 0.0
         button.overlay._elastic_offset_y = 0.0
         button.overlay._elastic_flatten = 0.0
-        button.overlay.update()
+        button.overlay.mark_dirty()
         return
 
     vx = dx / distance
@@ -48,7 +55,7 @@ def apply_elastic(button, event):
     button.overlay._elastic_vec_x = vx
     button.overlay._elastic_vec_y = vy
 
-    button.overlay.update()
+    button.overlay.mark_dirty()
 
 
 def reset_elastic(overlay, duration_ms=520):
@@ -63,7 +70,7 @@ def reset_elastic(overlay, duration_ms=520):
 
     Posisi offset snapback: spring ringan dengan sedikit overshoot.
     """
-    from PySide6.QtCore import QPropertyAnimation, QEasingCurve, QPointF
+    from PySide6.QtCore import QEasingCurve, QPointF
 
     # ── Posisi: spring ringan ─────────────────────────────────
     spring = QEasingCurve(QEasingCurve.BezierSpline)
@@ -73,16 +80,16 @@ def reset_elastic(overlay, duration_ms=520):
         QPointF(1.00, 1.00)
     )
 
-    anim_x = QPropertyAnimation(overlay, b"elastic_offset_x")
-    anim_x.setDuration(duration_ms)
+    anim_x = RennsEngine.animation(overlay, b"elastic_offset_x")
+    anim_x.setDuration(RennsEngine.duration(duration_ms))
     anim_x.setStartValue(overlay._elastic_offset_x)
     anim_x.setEndValue(0.0)
     anim_x.setEasingCurve(spring)
     anim_x.start()
     overlay._snapback_x = anim_x
 
-    anim_y = QPropertyAnimation(overlay, b"elastic_offset_y")
-    anim_y.setDuration(duration_ms)
+    anim_y = RennsEngine.animation(overlay, b"elastic_offset_y")
+    anim_y.setDuration(RennsEngine.duration(duration_ms))
     anim_y.setStartValue(overlay._elastic_offset_y)
     anim_y.setEndValue(0.0)
     anim_y.setEasingCurve(spring)
@@ -141,8 +148,9 @@ def reset_elastic(overlay, duration_ms=520):
     )
 
     peak = overlay._elastic_flatten
-    anim_f = QPropertyAnimation(overlay, b"elastic_flatten_prop")
-    anim_f.setDuration(duration_ms)
+    anim_f = RennsEngine.animation(overlay, b"elastic_flatten_prop")
+    # Wobble flatten = dekoratif → di-skip di power saver
+    anim_f.setDuration(RennsEngine.duration(duration_ms, decorative=True))
     anim_f.setStartValue(peak)
     anim_f.setEndValue(0.0)
     anim_f.setEasingCurve(flatten_curve)
@@ -16,9 +16,11 @@ Implementasi:
   - Fill ring dengan QConicalGradient putih
   - Tidak pakai QPen gradient (tidak reliable di Qt)
   - Pola opacity: hi → lo → hi → lo, persis cincin kaca Apple
+  - Ring path + gradient di-cache (LRU, dipakai bareng semua overlay)
 """
 
 import re
+from collections import OrderedDict
 
 from PySide6.QtCore import Qt, QRectF, QPointF
 from PySide6.QtGui import (
@@ -41,18 +43,35 @@ def parse_glass_border(value: str):
     return deg, max(0.1, width)
 
 
-def draw_glass_border(painter: QPainter, rect, radius: float,
-                      light_deg: float, border_width: float):
-    """
-    Gambar glass border sebagai filled ring dengan conical gradient.
-    Ring = outer rounded rect - inner rounded rect (shrunk by border_width).
-    Fill ring dengan putih, opacity 50→10→50 mengikuti arah cahaya.
-    """
-    r  = QRectF(rect)
-    cx = r.center().x()
-    cy = r.center().y()
+# ── Cache ring + gradient ──────────────────────────────────
+#
+# path_out.subtracted(path_in) itu boolean path op yang mahal, dan tiap
+# paint tombol glass (apalagi selama elastic drag) dulu membangunnya ulang.
+# Ring + brush dibuat di origin (0, 0) lalu di-cache per ukuran; saat
+# menggambar painter cukup di-translate ke posisi rect.
+
+_RING_CACHE_MAX = 128
+
+_ring_cache: "OrderedDict" = OrderedDict()
+_brush_cache: "OrderedDict" = OrderedDict()
+
+
+def _lru_get(cache, key, build):
+    hit = cache.get(key)
+    if hit is not None:
+        cache.move_to_end(key)
+        return hit
+    hit = build()
+    cache[key] = hit
+    while len(cache) > _RING_CACHE_MAX:
+        cache.popitem(last=False)
+    return hit
+
+
+def _build_ring(w: float, h: float, radius: float, border_width: float) -> QPainterPath:
+    r = QRectF(0.0, 0.0, w, h)
 
-    max_rc = min(r.width(), r.height()) / 2.0
+    max_rc = min(w, h) / 2.0
     rc_out = min(float(radius), max_rc)
 
     # Inner rect — shrink sesuai border_width
@@ -70,8 +89,10 @@ def draw_glass_border(painter: QPainter, rect, radius: float,
         path_in.addRoundedRect(r_in, rc_in, rc_in)
 
     # Ring = outer - inner
-    ring = path_out.subtracted(path_in)
+    return path_out.subtracted(path_in)
 
+
+def _build_brush(w: float, h: float, light_deg: float) -> QBrush:
     # Conical gradient — putih semua, opacity 50→10→50
     # CSS 0deg=atas, QConicalGradient 0=kanan CCW → qt_angle = 90 - css_deg
     qt_angle = 90.0 - light_deg
@@ -79,16 +100,42 @@ def draw_glass_border(painter: QPainter, rect, radius: float,
     a_hi = 128   # ~50%
     a_lo = 25    # ~10%
 
-    grad = QConicalGradient(QPointF(cx, cy), qt_angle)
+    grad = QConicalGradient(QPointF(w / 2.0, h / 2.0), qt_angle)
     grad.setColorAt(0.00, QColor(255, 255, 255, a_hi))
     grad.setColorAt(0.25, QColor(255, 255, 255, a_lo))
     grad.setColorAt(0.50, QColor(255, 255, 255, a_hi))
     grad.setColorAt(0.75, QColor(255, 255, 255, a_lo))
     grad.setColorAt(1.00, QColor(255, 255, 255, a_hi))
+    return QBrush(grad)
+
+
+def clear_glass_cache():
+    # Dipanggil RennsStyle.load — ukuran/radius lama tidak dipakai lagi
+    _ring_cache.clear()
+    _brush_cache.clear()
+
+
+def draw_glass_border(painter: QPainter, rect, radius: float,
+                      light_deg: float, border_width: float):
+    """
+    Gambar glass border sebagai filled ring dengan conical gradient.
+    Ring = outer rounded rect - inner rounded rect (shrunk by border_width).
+    Fill ring dengan putih, opacity 50→10→50 mengikuti arah cahaya.
+    Ring + gradient diambil dari cache LRU per (ukuran, radius, lebar, sudut).
+    """
+    r = QRectF(rect)
+    w, h = r.width(), r.height()
+    radius = float(radius)
+
+    ring  = _lru_get(_ring_cache, (w, h, radius, border_width),
+                     lambda: _build_ring(w, h, radius, border_width))
+    brush = _lru_get(_brush_cache, (w, h, light_deg),
+                     lambda: _build_brush(w, h, light_deg))
 
     painter.save()
     painter.setRenderHint(QPainter.Antialiasing)
+    painter.translate(r.topLeft())
     painter.setPen(Qt.NoPen)
-    painter.setBrush(QBrush(grad))
+    painter.setBrush(brush)
     painter.drawPath(ring)
-    painter.restore()
\ No newline at end of file
+    painter.restore()
@@ -0,0 +1,141 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Author: @ahsanihlwn
+# Copyright (c) 2026 @ahsanihlwn
+
+"""
+pointer.py — coalescing event mouse per frame.
+
+Mouse polling-rate tinggi kirim 500–1000 move event per detik. Event cuma
+dicatat (O(1)); kerja berat (math elastic, move knob, blend warna) jalan
+SEKALI per frame engine dengan posisi terakhir.
+
+    sampler = PointerSampler(on_frame)   # on_frame(pos: QPointF)
+    sampler.push(event.position())       # dari mouseMoveEvent
+    sampler.flush()                      # proses sisa sample sekarang (release)
+    sampler.velocity()                   # (vx, vy) px/ms dari history sample
+
+Prediksi (RennsEngine.set_pointer_prediction(ms)):
+    on_frame menerima posisi latest + velocity * ms. Begitu pointer diam
+    (tidak ada sample baru), satu frame tambahan mengembalikan ke posisi
+    asli. flush() selalu pakai posisi asli — release tidak pernah memakai
+    tebakan.
+"""
+
+from collections import deque
+
+from PySide6.QtCore import QPointF
+
+from ...engine import RennsEngine
+
+# Sample lebih tua dari ini tidak ikut hitung velocity
+_HISTORY_MS  = 80.0
+_HISTORY_MAX = 64
+
+# Batas jarak tebakan — flick cepat tidak boleh melempar object jauh
+_MAX_PREDICT_PX = 48.0
+
+
+class PointerSampler:
+
+    def __init__(self, on_frame):
+        self._on_frame = on_frame
+        self._samples  = deque(maxlen=_HISTORY_MAX)   # (t_ms, x, y)
+        self._latest   = None
+        self._pending  = False
+        self._predicted = False   # frame terakhir dirender di posisi tebakan
+
+    def reset(self, pos: QPointF = None):
+        """Mulai gesture baru. pos = titik awal (press)."""
+        RennsEngine.unregister(self)
+        self._samples.clear()
+        self._pending   = False
+        self._predicted = False
+        self._latest    = None
+        if pos is not None:
+            self._latest = QPointF(pos)
+            self._samples.append((RennsEngine.now_ms(), pos.x(), pos.y()))
+
+    def push(self, pos: QPointF):
+        self._latest = QPointF(pos)
+        self._samples.append((RennsEngine.now_ms(), pos.x(), pos.y()))
+        if not self._pending:
+            self._pending = True
+            RennsEngine.register(self)
+
+    def flush(self):
+        """
+        Proses sample yang belum diproses sekarang juga (mis. sebelum release).
+        Kalau frame terakhir memakai tebakan, rekonsiliasi ke posisi asli.
+        """
+        if self._pending or self._predicted:
+            RennsEngine.unregister(self)
+            self._pending   = False
+            self._predicted = False
+            self._on_frame(self._latest)
+
+    def latest(self):
+        return self._latest
+
+    def velocity(self):
+        """
+        (vx, vy) dalam px/ms — slope least-squares semua sample dalam
+        _HISTORY_MS terakhir. Lebih stabil dari selisih dua event terakhir,
+        dan tidak tergantung polling rate mouse.
+        """
+        if len(self._samples) < 2:
+            return 0.0, 0.0
+        t_end = self._samples[-1][0]
+        pts = [s for s in self._samples if t_end - s[0] <= _HISTORY_MS]
+        if len(pts) < 2:
+            pts = list(self._samples)[-2:]
+
+        n  = len(pts)
+        mt = sum(p[0] for p in pts) / n
+        mx = sum(p[1] for p in pts) / n
+        my = sum(p[2] for p in pts) / n
+        var = sum((p[0] - mt) ** 2 for p in pts)
+        if var <= 1e-9:
+            return 0.0, 0.0
+        vx = sum((p[0] - mt) * (p[1] - mx) for p in pts) / var
+        vy = sum((p[0] - mt) * (p[2] - my) for p in pts) / var
+        return vx, vy
+
+    def predicted(self, horizon_ms: float):
+        """Posisi latest + velocity * horizon, jarak dibatasi _MAX_PREDICT_PX."""
+        if self._latest is None or horizon_ms <= 0:
+            return self._latest
+        vx, vy = self.velocity()
+        px, py = vx * horizon_ms, vy * horizon_ms
+        dist = (px * px + py * py) ** 0.5
+        if dist > _MAX_PREDICT_PX:
+            k = _MAX_PREDICT_PX / dist
+            px, py = px * k, py * k
+        return QPointF(self._latest.x() + px, self._latest.y() + py)
+
+    # ── Engine client ─────────────────────────────────────────
+
+    def tick(self, now_ms: float) -> bool:
+        horizon = RennsEngine.pointer_prediction()
+
+        if not self._pending:
+            if not self._predicted:
+                return False
+            # Pointer diam > 2 frame → tebakan terakhir sudah basi,
+            # kembalikan ke posisi asli
+            if now_ms - self._samples[-1][0] < RennsEngine.FRAME_MS * 2:
+                return True
+            self._predicted = False
+            self._on_frame(self._latest)
+            return self._pending
+
+        self._pending = False
+        if horizon > 0:
+            self._predicted = True
+            self._on_frame(self.predicted(horizon))
+            return True
+        self._on_frame(self._latest)
+        # push() selama on_frame → tetap terdaftar untuk frame berikutnya
+        return self._pending
@@ -0,0 +1,280 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Author: @ahsanihlwn
+# Copyright (c) 2026 @ahsanihlwn
+
+"""
+raster.py — satu format raster untuk semua cache engine.
+
+Raster paint engine Qt blend paling cepat dari ARGB32_Premultiplied
+(dan RGB32 untuk gambar opaque). Format lain — ARGB32 biasa, RGBA8888,
+indexed, RGB888 dari file — dikonversi ulang SETIAP kali di-blit, kira-
+kira 2x lebih mahal. Yang menghemat blit hanya sumber dari luar: icon
+file dan window texture dikonversi sekali. QPixmap.fill di raster backend
+sudah premultiplied, jadi raster yang engine gambar sendiri (shadow, text,
+body) lewat new_raster demi DPR eksplisit dan satu jalur, bukan blit
+yang lebih murah.
+
+Semua raster milik engine (shadow, backdrop blur, text, body, icon)
+dibuat lewat sini:
+
+    img = new_raster(w, h, dpr)      # QImage premultiplied, transparan
+    p = QPainter(img); ...; p.end()
+    pm = to_pixmap(img)              # tanpa konversi format
+
+    pm = native(pixmap_dari_luar)    # konversi sekali, bukan per blit
+    is_native(pm)                    # True kalau blit tidak konversi
+
+DPR: key semua cache raster memuat DPR. Window yang dipantau
+(watch_window — otomatis untuk window berisi node Renns) memanggil
+listener add_dpr_listener(fn(window, old, new)) saat pindah ke layar
+dengan DPR lain. Cache hanya membuang raster yang dpr_released() —
+DPR lama yang tidak dipakai window lain lagi — jadi window di layar
+lain (setup 1x/2x campuran) tetap memakai raster-nya.
+
+Verifikasi (QT_QPA_PLATFORM=offscreen):
+    check_native_caches()       # AssertionError kalau ada cache yang konversi
+    benchmark_blit()            # { sumber: (format, native, us/blit) }
+"""
+
+import math
+import weakref
+
+from PySide6.QtCore import Qt, QObject, QEvent
+from PySide6.QtGui import QImage, QPixmap
+
+RASTER_FORMAT = QImage.Format_ARGB32_Premultiplied
+# Format yang di-blit raster engine tanpa konversi
+_NATIVE_FORMATS = (QImage.Format_ARGB32_Premultiplied, QImage.Format_RGB32)
+
+# Raster boleh dibake lebih rapat dari DPR layar (body cache saat scale > 1):
+# DPR raster = DPR layar × oversample, kelipatan STEP sampai MAX
+OVERSAMPLE_STEP = 0.5
+OVERSAMPLE_MAX  = 3.0
+
+
+def new_raster(w: float, h: float, dpr: float = 1.0) -> QImage:
+    """QImage transparan w x h (logical) di DPR ini."""
+    img = QImage(max(1, int(math.ceil(w * dpr))),
+                 max(1, int(math.ceil(h * dpr))), RASTER_FORMAT)
+    img.setDevicePixelRatio(dpr)
+    img.fill(0)
+    return img
+
+
+def to_pixmap(img: QImage) -> QPixmap:
+    """QImage (sudah format native) → QPixmap, DPR ikut."""
+    return QPixmap.fromImage(img, Qt.NoFormatConversion)
+
+
+def native_image(img: QImage) -> QImage:
+    """Image dengan format yang di-blit tanpa konversi — copy hanya kalau perlu."""
+    if img.isNull() or img.format() in _NATIVE_FORMATS:
+        return img
+    fmt = RASTER_FORMAT if img.hasAlphaChannel() else QImage.Format_RGB32
+    return img.convertToFormat(fmt)
+
+
+def native(pm: QPixmap) -> QPixmap:
+    if pm.isNull() or is_native(pm):
+        return pm
+    return to_pixmap(native_image(pm.toImage()))
+
+
+def is_native(pm) -> bool:
+    """Pixmap / image ini di-blit raster engine tanpa konversi format?"""
+    img = pm.toImage() if isinstance(pm, QPixmap) else pm
+    return img.format() in _NATIVE_FORMATS
+
+
+# ── DPR / layar ───────────────────────────────────────────
+
+# { id(window): [weakref window, dpr terakhir, screenChanged tersambung] }
+_windows: dict = {}
+_dpr_listeners: list = []
+_dpr_filter = None
+
+_DPR_EVENTS = (QEvent.DevicePixelRatioChange, QEvent.ScreenChangeInternal, QEvent.Show)
+
+
+class _DprFilter(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() in _DPR_EVENTS:
+            _check_window(obj)
+        return False
+
+
+def add_dpr_listener(fn):
+    """fn(window, old_dpr, new_dpr) saat DPR window yang dipantau berubah."""
+    if fn not in _dpr_listeners:
+        _dpr_listeners.append(fn)
+
+
+def remove_dpr_listener(fn):
+    try:
+        _dpr_listeners.remove(fn)
+    except ValueError:
+        pass
+
+
+def live_dprs() -> set:
+    """DPR semua window yang dipantau dan masih hidup."""
+    return {entry[1] for entry in _windows.values() if entry[0]() is not None}
+
+
+def _on_grid(dpr: float, base: float) -> bool:
+    if base <= 0:
+        return False
+    r = dpr / base
+    if r < 1.0 - 1e-6 or r > OVERSAMPLE_MAX + 1e-6:
+        return False
+    n = r / OVERSAMPLE_STEP
+    return abs(n - round(n)) < 1e-6
+
+
+def dpr_released(dpr: float, old: float) -> bool:
+    """
+    Raster di `dpr` dibake untuk layar DPR `old` (termasuk oversample) dan
+    tidak ada window dipantau lain yang masih bisa memakainya.
+    """
+    if not _on_grid(dpr, old):
+        return False
+    return not any(_on_grid(dpr, d) for d in live_dprs())
+
+
+def watch_window(win):
+    """Pantau screenChanged / DevicePixelRatioChange window ini (idempotent)."""
+    global _dpr_filter
+    if win is None or id(win) in _windows:
+        return
+    if _dpr_filter is None:
+        _dpr_filter = _DprFilter()
+    key = id(win)
+    _windows[key] = [weakref.ref(win), win.devicePixelRatioF(), False]
+    win.installEventFilter(_dpr_filter)
+    win.destroyed.connect(lambda *_: _windows.pop(key, None))
+    _connect_screen(win)
+
+
+def _connect_screen(win):
+    # windowHandle() baru ada setelah window native dibuat (show)
+    entry = _windows.get(id(win))
+    if entry is None or entry[2]:
+        return
+    handle = win.windowHandle()
+    if handle is None:
+        return
+    entry[2] = True
+    ref = entry[0]
+
+    def _on_screen(*_):
+        w = ref()
+        if w is not None:
+            _check_window(w)
+
+    handle.screenChanged.connect(_on_screen)
+
+
+def _check_window(win):
+    entry = _windows.get(id(win))
+    if entry is None:
+        return
+    _connect_screen(win)
+    dpr = win.devicePixelRatioF()
+    old = entry[1]
+    if dpr == old:
+        return
+    entry[1] = dpr
+    for fn in list(_dpr_listeners):
+        fn(win, old, dpr)
+
+
+# ── Verifikasi / benchmark ───────────────────────────────────
+# Butuh QGuiApplication (QPixmap) — mis. QT_QPA_PLATFORM=offscreen.
+
+def check_native_caches():
+    """
+    Assert output tiap cache engine di-blit tanpa konversi format.
+    AssertionError menyebut cache yang gagal.
+    """
+    import os
+    import tempfile
+    from PySide6.QtGui import QColor
+    from ...text_cache import RennsTextCache
+    from ...shadow import _bake
+    from ...icon_cache import RennsIcon
+    from . import backdrop
+
+    foreign = QImage(64, 32, QImage.Format_ARGB32)
+    foreign.fill(QColor(40, 120, 220, 160))
+
+    # Window texture dari luar → dikonversi sekali di set_window_texture
+    key = object()
+    backdrop.set_window_texture(key, QPixmap.fromImage(foreign, Qt.NoFormatConversion))
+    texture = backdrop._raw.pop(id(key))
+    backdrop._layers.pop(id(key), None)
+
+    fd, path = tempfile.mkstemp(suffix=".png")
+    os.close(fd)
+    try:
+        foreign.save(path)   # PNG alpha → decode ARGB32 biasa
+        icon = RennsIcon.file(path).pixmap(16, 16, 2.0)
+    finally:
+        os.remove(path)
+
+    outputs = {
+        "text":     RennsTextCache.get("Label", ("", 14, "normal"), "#ffffff", 96, 32, 2.0),
+        "shadow":   _bake([{"ox": 0, "oy": 4, "blur": 12, "spread": 0,
+                            "color": QColor(0, 0, 0, 80)}], 96, 32, 8, 2.0)[0][0],
+        "texture":  texture,
+        "backdrop": backdrop._do_blur(texture, 8),
+        "icon":     icon,
+    }
+    bad = {name: pm.toImage().format().name
+           for name, pm in outputs.items() if not is_native(pm)}
+    assert not bad, f"cache output dikonversi per blit: {bad}"
+
+
+def benchmark_blit(n: int = 2000, repeat: int = 3) -> dict:
+    """
+    Biaya blit per format sumber ke target ARGB32_Premultiplied.
+    Return { nama: (format, native, us per blit) }.
+    """
+    import time
+    from PySide6.QtGui import QPainter, QColor
+
+    color = QColor(40, 120, 220, 160)
+
+    def make(fmt):
+        img = QImage(128, 64, QImage.Format_ARGB32)
+        img.fill(color)
+        return QPixmap.fromImage(img.convertToFormat(fmt), Qt.NoFormatConversion)
+
+    filled = QPixmap(128, 64)
+    filled.fill(color)
+    sources = {
+        "new_raster":   make(RASTER_FORMAT),
+        "ARGB32":       make(QImage.Format_ARGB32),
+        "RGBA8888":     make(QImage.Format_RGBA8888),
+        "QPixmap.fill": filled,
+    }
+
+    # Target = backing store widget translucent
+    target = QImage(512, 512, RASTER_FORMAT)
+    target.fill(0)
+
+    def run(pm):
+        p = QPainter(target)
+        t0 = time.perf_counter()
+        for i in range(n):
+            p.drawPixmap((i * 7) % 384, (i * 13) % 448, pm)
+        p.end()
+        return (time.perf_counter() - t0) / n * 1e6
+
+    return {
+        name: (pm.toImage().format().name, is_native(pm),
+               min(run(pm) for _ in range(max(1, repeat))))
+        for name, pm in sources.items()
+    }
@@ -26,7 +26,7 @@ def render_rect(painter, overlay, style: dict, rect: QRect = None):
 
     painter.save()
     painter.setRenderHint(QPainter.Antialiasing)
-    painter.setOpacity(opacity)
+    painter.setOpacity(painter.opacity() * opacity)
 
     painter.setBrush(QBrush(_pc(bg)))
 
@@ -55,10 +55,21 @@ def render_rect_border_only(painter, style: dict, rect):
 
     painter.save()
     painter.setRenderHint(QPainter.Antialiasing)
-    painter.setOpacity(opacity)
+    painter.setOpacity(painter.opacity() * opacity)
     painter.setBrush(Qt.NoBrush)
     pen = QPen(_pc(border_color))
     pen.setWidthF(border_width)
     painter.setPen(pen)
     painter.drawRoundedRect(rect, radius, radius)
-    painter.restore()
\ No newline at end of file
+    painter.restore()
+
+
+def draw_border(painter, rect, radius: float, pen, opacity: float = 1.0):
+    """Border dari render plan — pen sudah jadi, tidak parse style lagi."""
+    painter.save()
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setOpacity(painter.opacity() * opacity)
+    painter.setBrush(Qt.NoBrush)
+    painter.setPen(pen)
+    painter.drawRoundedRect(rect, radius, radius)
+    painter.restore()
@@ -0,0 +1,112 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Author: @ahsanihlwn
+# Copyright (c) 2026 @ahsanihlwn
+
+"""
+render_plan.py — style dict → render plan, dikompilasi sekali per state.
+
+Paint overlay dulu membaca style_data tiap frame: lookup string, float()/
+int(), regex glass-border/backdrop, parse warna border, import fungsi.
+Sekarang semua itu terjadi saat style berubah (update_visual_state), dan
+paint cuma menjalankan plan:
+
+    plan = compile_plan(style_data, render_mode)
+    plan.ops          # urutan draw op body: OP_FILL, OP_GLASS/OP_BORDER, OP_ICON, OP_TEXT
+    plan.radius, plan.padding, plan.border_pen, ...   # parameter numerik
+
+Nilai yang memang hidup per frame (warna background yang ditransisi,
+transform, text tombol) tetap dibaca dari overlay saat paint.
+"""
+
+import math
+
+from PySide6.QtGui import QPen
+
+from .css_color import parse_css_color
+from .glass_border import parse_glass_border
+from .backdrop import parse_backdrop_blur
+
+# Draw op body, dijalankan berurutan
+OP_FILL   = 0   # background _bg_color + glass tint
+OP_GLASS  = 1   # glass-border ring
+OP_BORDER = 2   # border-color / border-width (mode rect)
+OP_ICON   = 3
+OP_TEXT   = 4
+
+# Margin di luar btn_rect: anti-aliasing + setengah stroke border
+_AA_PAD = 2
+
+# Alignment tombol di canvas
+ALIGN_START  = -1
+ALIGN_CENTER = 0
+ALIGN_END    = 1
+
+
+def _f(style, key, default):
+    try:    return float(style.get(key, default))
+    except: return float(default)
+
+
+class RenderPlan:
+    __slots__ = (
+        "ops", "align_x", "align_y", "radius", "padding", "object_size",
+        "backdrop_css", "backdrop_blur", "glass_deg", "glass_width",
+        "border_pen", "border_opacity", "border_radius",
+        "text_color", "font_family", "font_weight", "bounds_pad",
+    )
+
+
+def compile_plan(style: dict, render_mode: str) -> RenderPlan:
+    p = RenderPlan()
+
+    align = str(style.get("align", "center")).strip().lower()
+    p.align_x = ALIGN_START if "left" in align else ALIGN_END if "right" in align else ALIGN_CENTER
+    p.align_y = ALIGN_START if "top" in align else ALIGN_END if "bottom" in align else ALIGN_CENTER
+
+    p.radius  = _f(style, "border-radius", 12)
+    p.padding = int(_f(style, "padding", 0))
+
+    # None → 60% sisi terpendek tombol, dihitung saat paint
+    obj = style.get("object-size")
+    try:    p.object_size = int(float(obj)) if obj else None
+    except: p.object_size = None
+
+    p.backdrop_css  = style.get("backdrop-filter", "")
+    p.backdrop_blur = parse_backdrop_blur(p.backdrop_css) if p.backdrop_css else 0.0
+
+    ops = [OP_FILL]
+    p.glass_deg = p.glass_width = 0.0
+    p.border_pen = None
+    p.border_opacity = 1.0
+    p.border_radius = 0.0
+
+    # glass-border menggantikan border-color sepenuhnya
+    glass_css = style.get("glass-border", "")
+    if glass_css:
+        p.glass_deg, p.glass_width = parse_glass_border(glass_css)
+        ops.append(OP_GLASS)
+    elif render_mode == "rect":
+        border_color = style.get("border-color", None)
+        border_width = _f(style, "border-width", 0)
+        if border_color and border_width > 0:
+            pen = QPen(parse_css_color(border_color))
+            pen.setWidthF(border_width)
+            p.border_pen = pen
+            p.border_opacity = _f(style, "opacity", 1.0)
+            # render_rect_border_only dulu pakai default 0, bukan 12
+            p.border_radius = _f(style, "border-radius", 0)
+            ops.append(OP_BORDER)
+
+    ops.extend((OP_ICON, OP_TEXT))
+    p.ops = tuple(ops)
+
+    # Seberapa jauh gambar body bisa keluar dari btn_rect (dirty rect, body cache)
+    p.bounds_pad = _AA_PAD + int(math.ceil(_f(style, "border-width", 0) / 2))
+
+    p.text_color  = style.get("color", "#ffffff")
+    p.font_family = style.get("font-family", "")
+    p.font_weight = str(style.get("font-weight", "normal")).strip().lower()
+    return p
@@ -5,16 +5,195 @@
 # Author: @ahsanihlwn
 # Copyright (c) 2026 @ahsanihlwn
 
+import math
+from collections import OrderedDict
+
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import QPropertyAnimation, QEasingCurve, Property, Qt, QRect
-from PySide6.QtGui import QPainter, QColor, QPixmap, QFont, QTransform
+from PySide6.QtCore import QPropertyAnimation, QAbstractAnimation, QEasingCurve, Property, Qt, QRect, QRectF
+from PySide6.QtGui import QPainter, QColor, QTransform
 from .button_ext.render_button import render_rect
-from .button_ext.css_color import parse_css_color as _parse_color
-
-OVERLAY_MULTIPLIER = 5
-OVERLAY_CANVAS_FACTOR = OVERLAY_MULTIPLIER
-
-class RennsOverlay(QWidget):
+from .button_ext.animation import retarget
+from .button_ext.render_plan import (
+    compile_plan, OP_FILL, OP_GLASS, OP_BORDER, OP_ICON, OP_TEXT,
+    ALIGN_START, ALIGN_END,
+)
+from .button_ext.glass_border import draw_glass_border
+from .button_ext.render_button import draw_border
+from .button_ext.backdrop import draw_backdrop_blur
+from .button_ext.raster import (new_raster, to_pixmap, add_dpr_listener, dpr_released,
+                                OVERSAMPLE_STEP, OVERSAMPLE_MAX)
+from ..engine import RennsEngine
+from ..compositor import CompositedNode
+from ..quality import RennsQuality
+from ..keyframes import parse_animation, compile_track, _TrackPlayer
+
+# ─────────────────────────── Canvas sizing ─────────────────────────
+#
+# Canvas overlay = bounding box terbesar tombol setelah transform yang
+# mungkin terjadi untuk class itu (scale/rotate semua state + keyframe,
+# elastic offset, gepeng, border), bukan kelipatan tetap ukuran tombol.
+# Kalau runtime ternyata butuh lebih (scale di-set manual, dsb), canvas
+# tumbuh sendiri lewat _ensure_room().
+
+# Elastic offset max = 85% setengah tombol (lihat elastic.apply_elastic)
+_ELASTIC_OFFSET = 0.85
+# Gepeng para_scale = 1 + flatten * 0.07, flatten praktis <= ~1.1
+_FLATTEN_GROWTH = 1.08
+# Easing spring/bounce overshoot di atas target
+_OVERSHOOT = 0.3
+# Anti-aliasing + tepi border
+_EDGE_PAD = 4
+# Canvas yang tumbuh diberi ruang lebih supaya tidak resize tiap frame
+_GROW_SLACK = 1.15
+
+_canvas_cache: dict = {}
+
+
+def clear_canvas_cache():
+    """Dipanggil RennsStyle.load — ukuran canvas + body cache ikut style baru."""
+    _canvas_cache.clear()
+    _body_cache.clear()
+
+
+def _rotated_extent(w, h, max_deg):
+    """Bounding (w, h) terbesar untuk rotasi 0..max_deg."""
+    max_deg = min(90.0, abs(max_deg))
+    best_w, best_h = float(w), float(h)
+    steps = int(max_deg // 5) + 1
+    for k in range(steps + 1):
+        a = math.radians(min(max_deg, k * 5.0))
+        c, s = abs(math.cos(a)), abs(math.sin(a))
+        best_w = max(best_w, w * c + h * s)
+        best_h = max(best_h, w * s + h * c)
+    return best_w, best_h
+
+
+def _match_parity(size, btn):
+    """Selisih canvas - tombol harus genap → tombol tepat di tengah pixel."""
+    return size + ((size - btn) & 1)
+
+
+def _transform_extent(bw, bh, scale, rotate, elastic, flatten):
+    """Ukuran canvas (w, h) yang memuat tombol bw x bh pada transform ini."""
+    rw, rh = _rotated_extent(bw, bh, rotate)
+    ex = abs(elastic[0]) * bw / 2 * 2
+    ey = abs(elastic[1]) * bh / 2 * 2
+    w = (rw * flatten + ex) * abs(scale)
+    h = (rh * flatten + ey) * abs(scale)
+    return w, h
+
+
+def canvas_size(class_name, component, btn_w, btn_h):
+    """
+    Ukuran canvas overlay minimum untuk class ini. Hasil di-cache per
+    (class, component, ukuran tombol).
+    """
+    key = (class_name, component, btn_w, btn_h)
+    hit = _canvas_cache.get(key)
+    if hit is not None:
+        return hit
+
+    from ..renns_style import RennsStyle
+    from .button_ext.transform import parse_transform
+
+    base   = RennsStyle.get(class_name, "base", component) if class_name else {}
+    scales = [1.0]
+    rots   = [0.0]
+    elastic = False
+    springy = False
+    pad     = _EDGE_PAD
+    obj     = 0
+
+    for state in ("base", "hover", "active"):
+        props = {**base, **(RennsStyle.get(class_name, state, component) if class_name else {})}
+        s, r = parse_transform(props.get("transform"))
+        scales.append(s)
+        rots.append(r)
+        if props.get("elastic-drag"):
+            elastic = True
+        tr = props.get("transition", "")
+        if "spring" in tr or "bounce" in tr:
+            springy = True
+        for k in ("border-width", "border"):
+            try:    pad = max(pad, _EDGE_PAD + int(float(str(props.get(k, 0)).split()[0].replace("px", ""))))
+            except: pass
+        gb = props.get("glass-border")
+        if gb:
+            try:
+                from .button_ext.glass_border import parse_glass_border
+                pad = max(pad, _EDGE_PAD + int(math.ceil(parse_glass_border(gb)[1])))
+            except Exception:
+                pass
+        try:    obj = max(obj, int(float(props.get("object-size", 0))))
+        except: pass
+
+        spec = parse_animation(props.get("animation", ""))
+        if spec is not None:
+            track = compile_track(spec, class_name, component)
+            if track is not None:
+                if track.scale is not None:
+                    scales.extend((max(track.scale), min(track.scale)))
+                if track.rotate is not None:
+                    rots.extend((max(track.rotate), min(track.rotate)))
+
+    s_max = max(abs(v) for v in scales)
+    if springy:
+        s_max += (max(scales) - min(scales)) * _OVERSHOOT
+    r_max = max(abs(v) for v in rots)
+
+    bw = max(btn_w, obj)
+    bh = max(btn_h, obj)
+    el = (_ELASTIC_OFFSET, _ELASTIC_OFFSET) if elastic else (0.0, 0.0)
+    w, h = _transform_extent(bw, bh, s_max, r_max, el, _FLATTEN_GROWTH)
+
+    size = (_match_parity(int(math.ceil(w)) + pad * 2, btn_w),
+            _match_parity(int(math.ceil(h)) + pad * 2, btn_h))
+    _canvas_cache[key] = size
+    return size
+
+# ─────────────────────────── Body cache ────────────────────────────
+#
+# Body statis (background + tint + border + icon + text) satu state
+# di-raster sekali ke pixmap, lalu selama animasi transform (scale,
+# rotate, elastic, gepeng) cukup di-blit dengan full_t. Dipakai bareng
+# semua overlay — tombol dengan class + state + ukuran sama share pixmap.
+#
+# Tanpa transform → tetap vector (paling tajam). Warna sedang transisi
+# → vector juga, key berubah tiap frame jadi cache cuma buang memori.
+
+_BODY_CACHE_MAX = 48
+# Transisi font-size: kotak raster label diperbesar raster/floor supaya
+# label yang cuma muat di ukuran kecil tidak terpotong — dibatasi segini
+_FONT_BOX_MAX = 4.0
+
+_body_cache: "OrderedDict" = OrderedDict()
+_body_stats = {"hits": 0, "misses": 0}
+
+
+def _body_oversample(scale: float) -> float:
+    scale = abs(scale)
+    if scale <= 1.0:
+        return 1.0
+    # Scale > 1 → raster lebih rapat supaya blit tidak blur, dibulatkan per step
+    step = OVERSAMPLE_STEP
+    return min(OVERSAMPLE_MAX, math.ceil(scale / step) * step)
+
+
+def _on_dpr_change(window, old, new):
+    # Key body cache = DPR layar × oversample — entry DPR lama yang tidak
+    # dipakai window lain dibuang, di-raster ulang lazy saat paint berikutnya
+    for key in [k for k in _body_cache if dpr_released(k[-1], old)]:
+        del _body_cache[key]
+
+
+add_dpr_listener(_on_dpr_change)
+
+
+# Glass tint — putih ~6% di atas background
+_GLASS_TINT = QColor(255, 255, 255, 15)
+
+
+class RennsOverlay(CompositedNode, QWidget):
     def __init__(self, parent, icon):
         super().__init__(parent)
 
@@ -38,124 +217,461 @@ class RennsOverlay(QWidget):
 
         self._bg_color = QColor(0, 0, 0, 0)
 
-        # Font size
+        # Font size — selama transisi text di-raster sekali di ukuran
+        # _font_raster (terbesar asal/tujuan) lalu diperkecil saat paint;
+        # _font_floor = ukuran terkecil transisi (menentukan kotak raster)
         self._font_size = 13.0
-        self._text_pm = None
-        self._text_pm_key = None
-
-        self.color_anim = QPropertyAnimation(self, b"bgColor")
+        self._font_raster = 0.0
+        self._font_floor = 0.0
+        self._font_size_set = False
+
+        # Key style_data untuk body cache — dihitung ulang kalau dict diganti
+        self._style_key_src = None
+        self._style_key     = None
+
+        # Render plan hasil compile style_data — dibuat ulang hanya kalau
+        # dict style / render_mode diganti (sekali per state change)
+        self._plan      = None
+        self._plan_src  = None
+        self._plan_mode = None
+
+        # Dirty rect — bounds ter-transform yang terakhir di-invalidate.
+        # None → update berikutnya full canvas
+        self._painted_bounds = None
+
+        # Repaint coalescing — True kalau update() sudah dikirim tapi
+        # paintEvent belum jalan. Write berikutnya tidak perlu update() lagi.
+        self._dirty = False
+
+        # Dipanggil tiap scale berubah (shadow ikut sync tanpa polling)
+        self._scale_listeners = []
+
+        # Keyframe track yang sedang main (property `animation:`)
+        self._track_player = None
+        self._anim_source  = ""
+        # Channel yang sementara digerakkan animasi luar (entry stagger pill)
+        self._held_channels = set()
+
+        # Ukuran canvas rencana (dari canvas_size) — canvas bisa tumbuh
+        # di atas ini saat runtime, tidak pernah menyusut di bawahnya
+        self._plan_w = 0
+        self._plan_h = 0
+
+        # Culling — button tidak kelihatan (scroll/tab/minimize)
+        self._suspended          = False
+        self._visible_on_suspend = False
+
+        self.color_anim = RennsEngine.animation(self, b"bgColor")
         self.color_anim.setEasingCurve(QEasingCurve.OutCubic)
 
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.setAttribute(Qt.WA_TranslucentBackground)
 
-        self.anim = QPropertyAnimation(self, b"scale")
+        self.anim = RennsEngine.animation(self, b"scale")
         self.anim.setEasingCurve(QEasingCurve.OutCubic)
-        self.rotate_anim = QPropertyAnimation(self, b"rotate")
+        self.rotate_anim = RennsEngine.animation(self, b"rotate")
         self.rotate_anim.setEasingCurve(QEasingCurve.OutCubic)
+        self.font_anim = RennsEngine.animation(self, b"fontSize")
+        self.font_anim.setEasingCurve(QEasingCurve.OutCubic)
+        self.font_anim.finished.connect(self._on_font_settled)
+
+        # Mode compositor → jadi render node di canvas window, bukan widget
+        self._init_node(parent)
 
     # ------------------------------------------------------------------
     # Qt Properties
     # ------------------------------------------------------------------
 
     def getBgColor(self): return self._bg_color
-    def setBgColor(self, c): self._bg_color = c; self.update()
+    def setBgColor(self, c): self._bg_color = c; self.mark_dirty()
     bgColor = Property(QColor, getBgColor, setBgColor)
 
     def getScale(self): return self._scale
-    def setScale(self, v): self._scale = v; self.update()
+    def setScale(self, v): self._scale = v; self.mark_dirty(); self._notify_scale()
     scale = Property(float, getScale, setScale)
 
     def getRotate(self): return self._transform_rotate
-    def setRotate(self, v): self._transform_rotate = v; self.update()
+    def setRotate(self, v): self._transform_rotate = v; self.mark_dirty()
     rotate = Property(float, getRotate, setRotate)
 
+    def getFontSize(self): return self._font_size
+    def setFontSize(self, v): self._font_size = max(1.0, v); self.mark_dirty()
+    fontSize = Property(float, getFontSize, setFontSize)
+
     # Tiga Qt Properties untuk QPropertyAnimation di reset_elastic
     def getElasticOffsetX(self): return self._elastic_offset_x
-    def setElasticOffsetX(self, v): self._elastic_offset_x = v; self.update()
+    def setElasticOffsetX(self, v): self._elastic_offset_x = v; self.mark_dirty()
     elastic_offset_x = Property(float, getElasticOffsetX, setElasticOffsetX)
 
     def getElasticOffsetY(self): return self._elastic_offset_y
-    def setElasticOffsetY(self, v): self._elastic_offset_y = v; self.update()
+    def setElasticOffsetY(self, v): self._elastic_offset_y = v; self.mark_dirty()
     elastic_offset_y = Property(float, getElasticOffsetY, setElasticOffsetY)
 
     def getElasticFlatten(self): return self._elastic_flatten
-    def setElasticFlatten(self, v): self._elastic_flatten = v; self.update()
+    def setElasticFlatten(self, v): self._elastic_flatten = v; self.mark_dirty()
     elastic_flatten_prop = Property(float, getElasticFlatten, setElasticFlatten)
 
+    # Opacity paint-time (dipasang di painter) — windowOpacity tidak
+    # berlaku untuk overlay karena overlay child widget window
+    def getOpacity(self): return self._node_opacity
+    def setOpacity(self, v): self.set_node_opacity(v)
+    opacity = Property(float, getOpacity, setOpacity)
+
+    def _node_opacity_changed(self):
+        # Opacity 0 → paint dilewati dan _dirty tidak pernah di-reset;
+        # reset di sini supaya perubahan berikutnya tetap minta paint
+        self._dirty = False
+        self.mark_dirty()
+
+    def add_scale_listener(self, fn):
+        if fn not in self._scale_listeners:
+            self._scale_listeners.append(fn)
+
+    def remove_scale_listener(self, fn):
+        try:
+            self._scale_listeners.remove(fn)
+        except ValueError:
+            pass
+
+    def _notify_scale(self):
+        for fn in self._scale_listeners:
+            fn()
+
     # ------------------------------------------------------------------
-    # Font size
+    # Repaint coalescing
     # ------------------------------------------------------------------
 
-    def set_font_size(self, size: float):
-        size = max(1.0, float(size))
-        if size != self._font_size:
-            self._font_size = size
-            self._text_pm = None
+    # Counter global untuk semua overlay:
+    #   requests  = update() yang benar-benar dikirim ke Qt
+    #   coalesced = write yang ditahan karena overlay sudah dirty
+    #   paints    = paintEvent yang jalan
+    _stat_requests  = 0
+    _stat_coalesced = 0
+    _stat_paints    = 0
+
+    def mark_dirty(self):
+        """
+        Tandai overlay perlu repaint. Semua property write dalam satu
+        iterasi event loop (scale + rotate + color + elastic sekaligus)
+        cuma menghasilkan satu update() → satu paint.
+        """
+        if self._dirty:
+            RennsOverlay._stat_coalesced += 1
+            return
+        self._dirty = True
+        RennsOverlay._stat_requests += 1
+        # update() dikirim saat tick engine (flush_paint) — saat itu semua
+        # write frame ini sudah masuk, jadi area yang berubah sudah final
+        RennsEngine.request_paint(self)
+
+    def flush_paint(self):
+        """
+        Dipanggil engine sekali per frame. Invalidate hanya gabungan bounds
+        tombol ter-transform frame lalu + frame ini, bukan seluruh canvas.
+        """
+        # Semua write frame ini sudah masuk → cek ruang canvas sekali di sini
+        self._ensure_room()
+        new = self._content_bounds()
+        old = self._painted_bounds
+        self._painted_bounds = new
+        if old is None:
             self.update()
+        else:
+            self.update(old.united(new))
+
+    def _content_bounds(self) -> QRect:
+        """Bounds tombol setelah transform (+ border/AA), dalam koordinat canvas."""
+        plan = self.render_plan()
+        bw, bh = self._btn_size()
+        box = QRectF(self._btn_rect(plan, bw, bh))
+        if self.icon and plan.object_size and plan.object_size > min(bw, bh):
+            c = box.center()
+            h = plan.object_size / 2
+            box = box.united(QRectF(c.x() - h, c.y() - h, h * 2, h * 2))
+        pad = plan.bounds_pad
+        box.adjust(-pad, -pad, pad, pad)
+        full_t = self._transforms()[0]
+        return full_t.mapRect(box).toAlignedRect().intersected(self.rect())
+
+    @classmethod
+    def repaint_stats(cls) -> dict:
+        return {
+            "requests":  cls._stat_requests,
+            "coalesced": cls._stat_coalesced,
+            "paints":    cls._stat_paints,
+        }
+
+    @classmethod
+    def reset_repaint_stats(cls):
+        cls._stat_requests  = 0
+        cls._stat_coalesced = 0
+        cls._stat_paints    = 0
+
+    @classmethod
+    def body_cache_stats(cls) -> dict:
+        return {**_body_stats, "entries": len(_body_cache)}
 
     # ------------------------------------------------------------------
-    # Text pixmap cache
+    # Canvas size
     # ------------------------------------------------------------------
 
-    def _get_text_pixmap(self, text, color_str, pm_w, pm_h):
-        font_size_int = max(1, int(self._font_size))
-        weight_str = self.style_data.get("font-weight", "normal").strip().lower()
-        family = self.style_data.get("font-family", "")
-        key = (text, font_size_int, color_str, weight_str, family, pm_w, pm_h)
-
-        if self._text_pm is not None and self._text_pm_key == key:
-            return self._text_pm
-
-        font = QFont()
-        if family:
-            font.setFamily(family.strip())
-        font.setPixelSize(font_size_int)
-        font.setHintingPreference(QFont.HintingPreference.PreferNoHinting)
-
-        if   weight_str == "bold":      font.setBold(True)
-        elif weight_str == "thin":      font.setWeight(QFont.Weight.Thin)
-        elif weight_str == "light":     font.setWeight(QFont.Weight.Light)
-        elif weight_str == "medium":    font.setWeight(QFont.Weight.Medium)
-        elif weight_str == "semibold":  font.setWeight(QFont.Weight.DemiBold)
-        elif weight_str == "extrabold": font.setWeight(QFont.Weight.ExtraBold)
-        elif weight_str == "black":     font.setWeight(QFont.Weight.Black)
-        elif weight_str.isdigit():      font.setWeight(int(weight_str))
-
-        dpr = self.devicePixelRatioF()
-        pm = QPixmap(int(pm_w * dpr), int(pm_h * dpr))
-        pm.setDevicePixelRatio(dpr)
-        pm.fill(Qt.transparent)
-
-        p = QPainter(pm)
-        p.setRenderHint(QPainter.TextAntialiasing)
-        p.setFont(font)
-        p.setPen(_parse_color(color_str))
-        p.drawText(QRect(0, 0, pm_w, pm_h), Qt.AlignCenter, text)
-        p.end()
+    def set_canvas_size(self, w: int, h: int):
+        """Set ukuran canvas rencana, center overlay dipertahankan."""
+        self._plan_w = int(w)
+        self._plan_h = int(h)
+        self._resize_centered(max(self._plan_w, 1), max(self._plan_h, 1))
+
+    def _resize_centered(self, w, h):
+        if w == self.width() and h == self.height():
+            return
+        # Canvas baru → Qt repaint penuh, bounds lama tidak berlaku
+        self._painted_bounds = None
+        c = self.geometry().center()
+        self.setGeometry(c.x() - w // 2, c.y() - h // 2, w, h)
+
+    def _ensure_room(self):
+        """
+        Dipanggil sekali per frame (flush_paint). Canvas tumbuh kalau
+        transform sekarang tidak muat — mis. scale di-set langsung dari kode.
+        """
+        bw, bh = self._btn_w, self._btn_h
+        if bw <= 0 or bh <= 0:
+            return
+        w, h = _transform_extent(
+            bw, bh, self._scale, self._transform_rotate,
+            (self._elastic_offset_x, self._elastic_offset_y),
+            1.0 + max(0.0, self._elastic_flatten) * 0.07,
+        )
+        w += _EDGE_PAD * 2
+        h += _EDGE_PAD * 2
+        if w <= self.width() and h <= self.height():
+            return
+        self._resize_centered(
+            max(self.width(),  _match_parity(int(math.ceil(w * _GROW_SLACK)), bw)),
+            max(self.height(), _match_parity(int(math.ceil(h * _GROW_SLACK)), bh)),
+        )
+
+    def hideEvent(self, event):
+        self._node_hidden()
+        super().hideEvent(event)
+
+    def _node_hidden(self):
+        # Hidden → paint tidak akan datang, jangan biarkan flag nyangkut.
+        # Show berikutnya repaint penuh.
+        self._dirty = False
+        self._painted_bounds = None
+
+    # ------------------------------------------------------------------
+    # Keyframe animation (@keyframes + animation:)
+    # ------------------------------------------------------------------
+
+    def set_animation(self, value, class_name, component=None):
+        """
+        Pasang/lepas animasi keyframe dari property `animation:`.
+        Value sama dengan yang sedang jalan → tidak di-restart, jadi aman
+        dipanggil di setiap update_visual_state.
+        """
+        value = (value or "").strip()
+        if value == self._anim_source:
+            return
+        self._anim_source = value
+        self.stop_track()
+
+        spec = parse_animation(value)
+        if spec is None:
+            return
+        track = compile_track(spec, class_name, component)
+        if track is None:
+            return
+        self._track_player = _TrackPlayer(self, track, spec)
+        RennsEngine.register(self._track_player)
+        if self._suspended:
+            self._track_player.pause()
+
+    def stop_track(self):
+        if self._track_player:
+            RennsEngine.unregister(self._track_player)
+            self._track_player = None
+
+    def track_owns(self, channel: str) -> bool:
+        """
+        True kalau channel ("scale"/"rotate"/"background") dipegang track
+        atau sedang di-hold animasi luar — transisi state tidak menyentuhnya.
+        """
+        if channel in self._held_channels:
+            return True
+        p = self._track_player
+        return p is not None and channel in p.track.channels
+
+    def hold_channel(self, channel: str, held: bool = True):
+        """Kunci channel selama animasi lain (mis. entry stagger) menulisnya."""
+        if held:
+            self._held_channels.add(channel)
+        else:
+            self._held_channels.discard(channel)
+
+    # ------------------------------------------------------------------
+    # Culling
+    # ------------------------------------------------------------------
 
-        self._text_pm = pm
-        self._text_pm_key = key
-        return pm
+    def suspend(self):
+        """
+        Button tidak kelihatan: sembunyikan, transisi langsung ke nilai
+        akhir (tidak ada yang perlu dilihat), track keyframe di-pause.
+        """
+        if self._suspended:
+            return
+        self._suspended = True
+        self._visible_on_suspend = self.isVisible()
+        for name in ("anim", "color_anim", "rotate_anim", "font_anim",
+                     "_snapback_x", "_snapback_y", "_snapback_f"):
+            a = getattr(self, name, None)
+            if a is not None and a.state() != QAbstractAnimation.Stopped \
+                    and a.totalDuration() >= 0:
+                a.setCurrentTime(a.totalDuration())
+        if self._track_player:
+            self._track_player.pause()
+        self.hide()
+
+    def resume(self):
+        if not self._suspended:
+            return
+        self._suspended = False
+        if self._track_player:
+            self._track_player.resume()
+        if self._visible_on_suspend:
+            self.show()
+
+    def _on_track_finished(self, player):
+        if self._track_player is not player:
+            return
+        self._track_player = None
+        # Iterasi habis → balik ke nilai state via transisi biasa
+        if self.button_ref is not None and hasattr(self.button_ref, "update_visual_state"):
+            self.button_ref.update_visual_state()
+
+    # ------------------------------------------------------------------
+    # Font size
+    # ------------------------------------------------------------------
+
+    def set_font_size(self, size: float, duration_ms: int = 0, curve=None):
+        """
+        duration_ms > 0 → transisi: text di-raster SEKALI di ukuran terbesar
+        (asal/tujuan) dan di-scale tiap frame; raster tajam di ukuran akhir
+        baru dibuat saat transisi selesai.
+        """
+        size = max(1.0, float(size))
+        first = not self._font_size_set
+        self._font_size_set = True
+
+        if first or duration_ms <= 0 or not self._text():
+            if self.font_anim.state() != QAbstractAnimation.Stopped:
+                self.font_anim.stop()
+            self._font_raster = 0.0
+            if size != self._font_size:
+                self._font_size = size
+                self.mark_dirty()
+            return
+
+        if retarget(self.font_anim, size, duration_ms, curve):
+            if self._font_raster:
+                self._font_floor = min(self._font_floor, self._font_size, size)
+            else:
+                self._font_floor = min(self._font_size, size)
+            self._font_raster = max(self._font_raster, self._font_size, size)
+
+    def _on_font_settled(self):
+        if self._font_raster:
+            self._font_raster = 0.0
+            self.mark_dirty()
+
+    # ------------------------------------------------------------------
+    # Text pixmap
+    # ------------------------------------------------------------------
+
+    def _get_text_pixmap(self, text, color_str, pm_w, pm_h, dpr=None, font_size=None):
+        """Raster text dari RennsTextCache — label sama di tombol lain di-share."""
+        from ..text_cache import RennsTextCache
+        if font_size is None:
+            font_size = self._font_size
+        plan = self.render_plan()
+        spec = (plan.font_family, max(1, int(font_size)), plan.font_weight)
+        if dpr is None:
+            dpr = self.devicePixelRatioF()
+        return RennsTextCache.get(text, spec, color_str, pm_w, pm_h, dpr)
 
     # ------------------------------------------------------------------
     # Paint
     # ------------------------------------------------------------------
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+    def paint_node(self, painter: QPainter):
+        """
+        Gambar overlay di koordinat lokal — dari paintEvent (CompositedNode)
+        atau compositor. Opacity node sudah terpasang di painter.
+        """
+        self._dirty = False
+        RennsOverlay._stat_paints += 1
+        RennsQuality.painted(self)
+
+        bw, bh = self._btn_size()
+        full_t, para_scale, flatten = self._transforms()
+
+        # LOD adaptif: saat frame berat, hint mahal dilepas selama bergerak
+        moving = not full_t.isIdentity()
+        painter.setRenderHint(QPainter.Antialiasing,
+                              not moving or RennsQuality.value("aa_motion"))
+        painter.setRenderHint(QPainter.SmoothPixmapTransform,
+                              not moving or RennsQuality.value("smooth_motion"))
         painter.setRenderHint(QPainter.TextAntialiasing)
 
-        ow = self.width()
-        oh = self.height()
+        plan = self.render_plan()
+        btn_rect = self._btn_rect(plan, bw, bh)
+        bx, by = btn_rect.x(), btn_rect.y()
+        radius = plan.radius
+
+        # ── Backdrop blur ─────────────────────────────────────────────
+        # Pass full_t supaya crop area ikut: scale, rotate, elastic offset, flatten
+        if plan.backdrop_css:
+            draw_backdrop_blur(painter, self, btn_rect, radius, plan.backdrop_css,
+                               transform=full_t, blur_r=plan.backdrop_blur)
+
+        painter.save()
+        painter.setTransform(full_t, True)
+
+        pm = None
+        if not full_t.isIdentity() and self._body_cacheable():
+            s_eff = self._scale * (para_scale if flatten > 0.001 else 1.0)
+            pm, margin = self._body_pixmap(bw, bh, radius, _body_oversample(s_eff))
+        if pm is not None:
+            # Satu blit ber-transform menggantikan seluruh body vector
+            painter.drawPixmap(bx - margin, by - margin, pm)
+        else:
+            self._paint_body(painter, btn_rect, radius,
+                             glass=RennsQuality.value("glass"))
+
+        painter.restore()
+
+    def _btn_size(self):
+        return (self._btn_w if self._btn_w > 0 else self.width(),
+                self._btn_h if self._btn_h > 0 else self.height())
 
-        bw = self._btn_w if self._btn_w > 0 else ow // OVERLAY_MULTIPLIER
-        bh = self._btn_h if self._btn_h > 0 else oh // OVERLAY_MULTIPLIER
+    def _btn_rect(self, plan, bw, bh) -> QRect:
+        """btn_rect pre-transform dalam koordinat canvas."""
+        ow, oh = self.width(), self.height()
+        if   plan.align_x == ALIGN_START: bx = 0
+        elif plan.align_x == ALIGN_END:   bx = ow - bw
+        else:                             bx = int(ow / 2 - bw / 2)
 
-        cx = ow / 2
-        cy = oh / 2
+        if   plan.align_y == ALIGN_START: by = 0
+        elif plan.align_y == ALIGN_END:   by = oh - bh
+        else:                             by = int(oh / 2 - bh / 2)
+        return QRect(bx, by, bw, bh)
+
+    def _transforms(self):
+        """(full_t, para_scale, flatten) untuk state property sekarang."""
+        bw, bh = self._btn_size()
+        cx = self.width() / 2
+        cy = self.height() / 2
 
         # Elastic offset: normalized → pixel
         el_px = self._elastic_offset_x * (bw / 2)
@@ -195,86 +711,149 @@ class RennsOverlay(QWidget):
             flatten_t = QTransform()
 
         # full_t: flatten dulu (di pivot offset), lalu elastic, lalu base scale/rotate
-        full_t = base_t * elastic_t * flatten_t
-
-        # Hitung btn_rect (pre-transform, dalam canvas coords)
-        align = self.style_data.get("align", "center").strip().lower()
-
-        if "left" in align:    bx = 0
-        elif "right" in align: bx = ow - bw
-        else:                  bx = int(cx - bw / 2)
-
-        if "top" in align:      by = 0
-        elif "bottom" in align: by = oh - bh
-        else:                   by = int(cy - bh / 2)
-
-        btn_rect = QRect(bx, by, bw, bh)
-        radius = float(self.style_data.get("border-radius", 12))
-
-        # ── Backdrop blur ─────────────────────────────────────────────
-        # Pass full_t supaya crop area ikut: scale, rotate, elastic offset, flatten
-        _backdrop_css = self.style_data.get("backdrop-filter", "")
-        if _backdrop_css:
-            from .button_ext.backdrop import draw_backdrop_blur
-            draw_backdrop_blur(painter, self, btn_rect, radius, _backdrop_css,
-                               transform=full_t)
+        return base_t * elastic_t * flatten_t, para_scale, flatten
+
+    def _paint_body(self, painter: QPainter, btn_rect: QRect, radius: float,
+                    dpr: float = None, glass: bool = True):
+        """
+        Jalankan draw op body plan di btn_rect. glass=False → ring
+        glass-border dilewati (LOD); body cache selalu raster penuh.
+        """
+        plan = self.render_plan()
+        bx, by = btn_rect.x(), btn_rect.y()
+        bw, bh = btn_rect.width(), btn_rect.height()
+        pad = plan.padding
+
+        for op in plan.ops:
+            if op == OP_FILL:
+                # Background via _bg_color (dikontrol color_anim untuk transisi smooth)
+                # + glass tint putih ~6% di atasnya, kesan frosted glass
+                if self._bg_color.alpha() > 0:
+                    painter.setPen(Qt.NoPen)
+                    painter.setBrush(self._bg_color)
+                    painter.drawRoundedRect(btn_rect, radius, radius)
+                    painter.setBrush(_GLASS_TINT)
+                    painter.drawRoundedRect(btn_rect, radius, radius)
+
+            elif op == OP_GLASS:
+                if not glass:
+                    continue
+                draw_glass_border(painter, btn_rect, radius,
+                                  plan.glass_deg, plan.glass_width)
+
+            elif op == OP_BORDER:
+                draw_border(painter, btn_rect, plan.border_radius,
+                            plan.border_pen, plan.border_opacity)
+
+            elif op == OP_ICON:
+                if not self.icon:
+                    continue
+                # Elastic sudah masuk ke transform — content pakai btn_rect
+                obj_size = plan.object_size
+                if obj_size is None:
+                    obj_size = int(min(bw, bh) * 0.6)
+                ix = bx + pad + (bw - pad * 2 - obj_size) // 2
+                iy = by + pad + (bh - pad * 2 - obj_size) // 2
+                self.icon.paint(painter, ix, iy, obj_size, obj_size, Qt.AlignCenter)
+
+            elif op == OP_TEXT:
+                text = self._text()
+                if not text:
+                    continue
+                content_rect = QRect(bx + pad, by + pad, bw - pad * 2, bh - pad * 2)
+                self._paint_text(painter, text, content_rect, dpr)
+
+    def _paint_text(self, painter, text, content_rect: QRect, dpr):
+        text_color = self.render_plan().text_color
+        pm_w = max(1, content_rect.width())
+        pm_h = max(1, content_rect.height())
+        if self._font_raster:
+            # Transisi font-size: raster ukuran terbesar, diperkecil
+            # di sekitar center — tidak ada raster baru per frame. Kotak
+            # raster = content / k terkecil (tetap selama transisi), jadi
+            # label yang muat di ukuran kecil tidak terpotong di ukuran
+            # besar; clip ke content_rect sama seperti raster final
+            g  = min(_FONT_BOX_MAX, self._font_raster / max(1.0, self._font_floor))
+            bw = int(math.ceil(pm_w * g))
+            bh = int(math.ceil(pm_h * g))
+            pm = self._get_text_pixmap(text, text_color, bw, bh, dpr,
+                                       self._font_raster)
+            k  = self._font_size / self._font_raster
+            c  = QRectF(content_rect).center()
+            painter.save()
+            painter.setClipRect(content_rect, Qt.IntersectClip)
+            painter.drawPixmap(QRectF(c.x() - bw * k / 2, c.y() - bh * k / 2,
+                                      bw * k, bh * k),
+                               pm, QRectF(pm.rect()))
+            painter.restore()
+        else:
+            pm = self._get_text_pixmap(text, text_color, pm_w, pm_h, dpr)
+            painter.drawPixmap(content_rect, pm)
+
+    def render_plan(self):
+        """Plan untuk style_data sekarang — compile ulang kalau dict diganti."""
+        if self._plan_src is not self.style_data or self._plan_mode != self.render_mode:
+            self._plan      = compile_plan(self.style_data, self.render_mode)
+            self._plan_src  = self.style_data
+            self._plan_mode = self.render_mode
+        return self._plan
+
+    def _text(self) -> str:
+        if self.button_ref is not None and hasattr(self.button_ref, "text"):
+            return self.button_ref.text() or ""
+        return ""
 
-        painter.save()
-        painter.setTransform(full_t)
-
-        # Background via _bg_color (dikontrol color_anim untuk transisi smooth)
-        if self._bg_color.alpha() > 0:
-            painter.setBrush(self._bg_color)
-            painter.setPen(Qt.NoPen)
-            painter.drawRoundedRect(btn_rect, radius, radius)
-
-        # Glass tint — putih ~6% di atas background, kesan frosted glass
-        if self._bg_color.alpha() > 0:
-            painter.setBrush(QColor(255, 255, 255, 15))
-            painter.setPen(Qt.NoPen)
-            painter.drawRoundedRect(btn_rect, radius, radius)
-
-        # Border: hanya gambar kalau TIDAK ada glass-border
-        # glass-border menggantikan border-color sepenuhnya
-        _glass_css = self.style_data.get("glass-border", "")
-        if _glass_css:
-            from .button_ext.glass_border import parse_glass_border, draw_glass_border
-            _gb_deg, _gb_w = parse_glass_border(_glass_css)
-            draw_glass_border(painter, btn_rect, radius, _gb_deg, _gb_w)
-        elif self.render_mode == "rect":
-            from .button_ext.render_button import render_rect_border_only
-            render_rect_border_only(painter, self.style_data, btn_rect)
-
-        # Konten (icon/text) — elastic sudah masuk ke transform,
-        # content_rect pakai btn_rect tanpa tambahan el_px/el_py lagi
-        padding = int(float(self.style_data.get("padding", 0)))
-        content_rect = QRect(
-            int(bx + padding),
-            int(by + padding),
-            bw - padding * 2,
-            bh - padding * 2
-        )
+    # ------------------------------------------------------------------
+    # Body cache
+    # ------------------------------------------------------------------
 
-        # Icon
-        if self.icon:
-            obj_size_raw = self.style_data.get("object-size")
+    def _body_cacheable(self) -> bool:
+        # Warna sedang transisi → key berubah tiap frame, vector lebih murah
+        if self.color_anim.state() != QAbstractAnimation.Stopped:
+            return False
+        if self._font_raster:
+            return False
+        return not self.track_owns("background")
+
+    def _body_pixmap(self, bw, bh, radius, oversample):
+        """
+        (pixmap, margin) body tombol bw x bh — dari cache bersama, atau
+        di-raster sekarang. Tombol ada di (margin, margin) dalam pixmap.
+        """
+        if self._style_key_src is not self.style_data:
+            self._style_key_src = self.style_data
             try:
-                obj_size = int(float(obj_size_raw)) if obj_size_raw else int(min(bw, bh) * 0.6)
-            except:
-                obj_size = int(min(bw, bh) * 0.6)
-            ix = content_rect.x() + (content_rect.width()  - obj_size) // 2
-            iy = content_rect.y() + (content_rect.height() - obj_size) // 2
-            self.icon.paint(painter, ix, iy, obj_size, obj_size, Qt.AlignCenter)
-
-        # Text
-        text = ""
-        if self.button_ref is not None and hasattr(self.button_ref, "text"):
-            text = self.button_ref.text() or ""
-        if text:
-            text_color = self.style_data.get("color", "#ffffff")
-            pm_w = max(1, content_rect.width())
-            pm_h = max(1, content_rect.height())
-            pm = self._get_text_pixmap(text, text_color, pm_w, pm_h)
-            painter.drawPixmap(content_rect, pm, QRect(0, 0, pm_w, pm_h))
-
-        painter.restore()
\ No newline at end of file
+                self._style_key = tuple(sorted(
+                    (k, str(v)) for k, v in self.style_data.items()))
+            except Exception:
+                self._style_key = None
+        if self._style_key is None:
+            return None, 0
+
+        dpr = self.devicePixelRatioF() * oversample
+        icon_key = self.icon.cacheKey() if self.icon else 0
+        key = (self._style_key, self.render_mode, self._bg_color.rgba(),
+               icon_key, self._text(), int(self._font_size), bw, bh, dpr)
+
+        hit = _body_cache.get(key)
+        if hit is not None:
+            _body_cache.move_to_end(key)
+            _body_stats["hits"] += 1
+            return hit
+
+        _body_stats["misses"] += 1
+        margin = self.render_plan().bounds_pad
+        img = new_raster(bw + margin * 2, bh + margin * 2, dpr)
+
+        p = QPainter(img)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setRenderHint(QPainter.SmoothPixmapTransform)
+        p.setRenderHint(QPainter.TextAntialiasing)
+        self._paint_body(p, QRect(margin, margin, bw, bh), radius, dpr)
+        p.end()
+        pm = to_pixmap(img)
+
+        _body_cache[key] = (pm, margin)
+        while len(_body_cache) > _BODY_CACHE_MAX:
+            _body_cache.popitem(last=False)
+        return pm, margin
@@ -0,0 +1,316 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Author: @ahsanihlwn
+# Copyright (c) 2026 @ahsanihlwn
+
+"""
+compositor.py — mode compositor: semua overlay + shadow satu window
+digambar oleh SATU widget, bukan ratusan widget translucent sibling.
+
+    from RennsObjectEngine import RennsCompositor
+    RennsCompositor.set_enabled(True)     # sebelum widget Renns dibuat
+
+Per window ada dua canvas:
+    "under"  → shadow layer (di bawah, sama seperti _ShadowLayer.lower())
+    "over"   → overlay button/toggle/knob
+
+Tiap RennsOverlay / _ShadowLayer jadi render node: QWidget-nya tetap ada
+(property, animasi, geometry, mapTo tetap jalan) tapi tidak pernah
+di-show. show/hide/move/resize/update/raise_/lower diteruskan ke
+compositor, yang repaint HANYA region node yang berubah. paintEvent
+compositor menggambar node yang kena region itu, urut z-order.
+
+Node yang harus berada di atas widget non-Renns (mis. item action group
+di atas pill) bisa keluar dari compositor: overlay.detach_from_compositor().
+
+Opacity node (property `opacity`, bisa dianimasi engine) dipasang lewat
+QPainter.setOpacity saat paint — di compositor maupun paintEvent biasa.
+windowOpacity tidak berlaku untuk child widget.
+"""
+
+from PySide6.QtCore import Qt, QEvent, QRect
+from PySide6.QtGui import QPainter, QRegion
+from PySide6.QtWidgets import QWidget
+
+from .quality import RennsQuality
+from .button.button_ext.raster import watch_window
+
+
+class CompositedNode:
+    """
+    Mixin untuk QWidget yang bisa jadi render node. Subclass wajib punya
+    paint_node(painter) — menggambar di koordinat lokal widget.
+    Taruh SEBELUM QWidget di daftar base class.
+    """
+
+    NODE_LAYER = "over"
+
+    _compositor   = None
+    _node_visible = False
+    _node_opacity = 1.0
+
+    def _init_node(self, parent_window):
+        # Cache raster dibuang saat window pindah ke layar dengan DPR lain
+        watch_window(parent_window)
+        if RennsCompositor.is_enabled() and parent_window is not None:
+            self._compositor = RennsCompositor.for_window(parent_window, self.NODE_LAYER)
+            self._compositor.add(self)
+
+    def is_composited(self) -> bool:
+        return self._compositor is not None
+
+    def detach_from_compositor(self):
+        """Keluar dari compositor → balik jadi widget biasa."""
+        comp = self._compositor
+        if comp is None:
+            return
+        comp.remove(self)
+        self._compositor = None
+        QWidget.setVisible(self, self._node_visible)
+
+    def _node_hidden(self):
+        """Hook subclass — dipanggil saat node di-hide."""
+
+    # ── Opacity ───────────────────────────────────────────────
+
+    def node_opacity(self) -> float:
+        return self._node_opacity
+
+    def set_node_opacity(self, v: float):
+        v = max(0.0, min(1.0, float(v)))
+        if v == self._node_opacity:
+            return
+        self._node_opacity = v
+        self._node_opacity_changed()
+
+    def _node_opacity_changed(self):
+        """Hook subclass — default repaint seluruh node."""
+        self.update()
+
+    def paintEvent(self, event):
+        if self._node_opacity <= 0.0:
+            return
+        t0 = RennsQuality.paint_started()
+        painter = QPainter(self)
+        if self._node_opacity < 1.0:
+            painter.setOpacity(self._node_opacity)
+        self.paint_node(painter)
+        painter.end()
+        RennsQuality.paint_finished(t0)
+
+    # ── Override QWidget ──────────────────────────────────────
+
+    def setVisible(self, visible):
+        comp = self._compositor
+        if comp is None:
+            return QWidget.setVisible(self, visible)
+        visible = bool(visible)
+        if visible == self._node_visible:
+            return
+        self._node_visible = visible
+        if not visible:
+            self._node_hidden()
+        comp.update(self.geometry())
+
+    def isVisible(self):
+        if self._compositor is None:
+            return QWidget.isVisible(self)
+        return self._node_visible
+
+    def update(self, *args):
+        comp = self._compositor
+        if comp is None:
+            return QWidget.update(self, *args)
+        if not self._node_visible:
+            return
+        # update(rect) / update(region) lokal → geser ke koordinat canvas
+        if len(args) == 1 and isinstance(args[0], (QRect, QRegion)):
+            comp.update(args[0].translated(self.pos()))
+        else:
+            comp.update(self.geometry())
+
+    def repaint(self, *args):
+        self.update()
+
+    def move(self, *args):
+        comp = self._compositor
+        if comp is None:
+            return QWidget.move(self, *args)
+        old = self.geometry()
+        QWidget.move(self, *args)
+        comp.node_moved(self, old)
+
+    def resize(self, *args):
+        comp = self._compositor
+        if comp is None:
+            return QWidget.resize(self, *args)
+        old = self.geometry()
+        QWidget.resize(self, *args)
+        comp.node_moved(self, old)
+
+    def setGeometry(self, *args):
+        comp = self._compositor
+        if comp is None:
+            return QWidget.setGeometry(self, *args)
+        old = self.geometry()
+        QWidget.setGeometry(self, *args)
+        comp.node_moved(self, old)
+
+    def raise_(self):
+        comp = self._compositor
+        if comp is None:
+            return QWidget.raise_(self)
+        comp.raise_node(self)
+
+    def lower(self):
+        comp = self._compositor
+        if comp is None:
+            return QWidget.lower(self)
+        comp.lower_node(self)
+
+    def deleteLater(self):
+        if self._compositor is not None:
+            self._compositor.remove(self)
+            self._compositor = None
+        QWidget.deleteLater(self)
+
+
+class RennsCompositor(QWidget):
+    """Canvas per (window, layer) yang menggambar semua node-nya."""
+
+    _enabled = False
+    # { (id(window), layer): RennsCompositor }
+    _instances: dict = {}
+
+    # Counter global: node yang digambar vs dilewati karena di luar region
+    _stat_painted = 0
+    _stat_skipped = 0
+
+    # ── Class API ─────────────────────────────────────────────
+
+    @classmethod
+    def set_enabled(cls, enabled: bool):
+        """Berlaku untuk overlay/shadow yang dibuat SETELAH ini dipanggil."""
+        cls._enabled = bool(enabled)
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def for_window(cls, window, layer: str = "over") -> "RennsCompositor":
+        key = (id(window), layer)
+        comp = cls._instances.get(key)
+        if comp is None:
+            comp = cls(window, layer)
+            cls._instances[key] = comp
+        return comp
+
+    @classmethod
+    def paint_stats(cls) -> dict:
+        return {"painted": cls._stat_painted, "skipped": cls._stat_skipped}
+
+    @classmethod
+    def reset_paint_stats(cls):
+        cls._stat_painted = 0
+        cls._stat_skipped = 0
+
+    # ── Instance ──────────────────────────────────────────────
+
+    def __init__(self, window, layer: str):
+        super().__init__(window)
+        self._window = window
+        self._layer  = layer
+        self._nodes: list = []   # urutan = z-order, terakhir paling atas
+
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setGeometry(window.rect())
+        window.installEventFilter(self)
+
+        key = (id(window), layer)
+        self.destroyed.connect(
+            lambda *_: RennsCompositor._instances.pop(key, None))
+
+        self.show()
+        if layer == "under":
+            self.lower()
+        else:
+            self.raise_()
+
+    def node_count(self) -> int:
+        return len(self._nodes)
+
+    def add(self, node):
+        if node not in self._nodes:
+            self._nodes.append(node)
+
+    def remove(self, node):
+        try:
+            self._nodes.remove(node)
+        except ValueError:
+            return
+        if node._node_visible:
+            self.update(node.geometry())
+
+    def raise_node(self, node):
+        if self._nodes and self._nodes[-1] is not node:
+            self._nodes.remove(node)
+            self._nodes.append(node)
+            if node._node_visible:
+                self.update(node.geometry())
+        # Sama seperti raise_() widget: di atas sibling non-Renns juga
+        if self._layer != "under":
+            self.raise_()
+
+    def lower_node(self, node):
+        if self._nodes and self._nodes[0] is not node:
+            self._nodes.remove(node)
+            self._nodes.insert(0, node)
+            if node._node_visible:
+                self.update(node.geometry())
+        if self._layer == "under":
+            self.lower()
+
+    def node_moved(self, node, old_rect: QRect):
+        if not node._node_visible:
+            return
+        new_rect = node.geometry()
+        if new_rect == old_rect:
+            return
+        self.update(QRegion(old_rect) + QRegion(new_rect))
+
+    # ── Qt ────────────────────────────────────────────────────
+
+    def eventFilter(self, obj, event):
+        if obj is self._window and event.type() == QEvent.Resize:
+            self.setGeometry(self._window.rect())
+        return False
+
+    def paintEvent(self, event):
+        t0      = RennsQuality.paint_started()
+        region  = event.region()
+        painter = QPainter(self)
+        for node in list(self._nodes):
+            try:
+                if not node._node_visible or node._node_opacity <= 0.0:
+                    continue
+                geo = node.geometry()
+            except RuntimeError:
+                # C++ node sudah dihapus tanpa deleteLater() kita
+                self._nodes.remove(node)
+                continue
+            if not region.intersects(geo):
+                RennsCompositor._stat_skipped += 1
+                continue
+            RennsCompositor._stat_painted += 1
+            painter.save()
+            painter.translate(geo.topLeft())
+            painter.setClipRect(QRect(0, 0, geo.width(), geo.height()), Qt.IntersectClip)
+            painter.setOpacity(node._node_opacity)
+            node.paint_node(painter)
+            painter.restore()
+        painter.end()
+        RennsQuality.paint_finished(t0)
@@ -0,0 +1,497 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Author: @ahsanihlwn
+# Copyright (c) 2026 @ahsanihlwn
+
+"""
+engine.py — frame ticker global RennsObjectEngine.
+
+Semua animasi yang digerakkan engine sendiri (keyframe track, dll) di-tick
+dari SATU QTimer, bukan satu timer per widget. Timer hanya jalan selama
+ada client aktif — begitu semua client selesai, timer berhenti.
+
+Client = object apapun dengan method:
+    tick(now_ms: float) -> bool     # False = selesai, lepas dari engine
+
+Idle detection:
+    QPropertyAnimation yang dibuat lewat RennsEngine.animation() dihitung
+    global. Engine idle = tidak ada client + tidak ada animasi running.
+    Saat idle tidak ada timer engine yang hidup sama sekali.
+
+    RennsEngine.is_idle()
+    RennsEngine.add_idle_listener(lambda idle: print("idle" if idle else "busy"))
+
+Virtual clock (test / benchmark):
+    clock = RennsVirtualClock()
+    RennsEngine.set_clock(clock)
+    group._open()
+    clock.advance(400)          # 25 frame @16ms, deterministik, tanpa sleep
+    RennsEngine.set_clock(None) # balik ke wall clock
+
+    Selama virtual clock aktif, animasi tracked di-pause dan digerakkan
+    manual lewat setCurrentTime(); RennsEngine.call_later() masuk antrian
+    virtual; frame ticker engine tidak memakai QTimer.
+"""
+
+import heapq
+import itertools
+import time
+import weakref
+
+from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QAbstractAnimation
+
+
+class RennsEngine:
+
+    FRAME_MS = 16
+
+    # Power profile — lihat set_power_profile()
+    PROFILES = {
+        # frame_ms       : interval tick engine + batas frekuensi repaint overlay
+        # duration_scale : pengali durasi transisi fungsional (scale/color/posisi)
+        # decorative     : False → transisi dekoratif (crossfade shadow, jelly,
+        #                  wobble snapback) langsung loncat ke nilai akhir
+        # shadow_sync    : False → shadow tidak ikut scale per frame, sync
+        #                  sekali saat scale sudah diam
+        "full":     {"frame_ms": 16, "duration_scale": 1.0,  "decorative": True,  "shadow_sync": True},
+        "balanced": {"frame_ms": 24, "duration_scale": 0.85, "decorative": True,  "shadow_sync": True},
+        "saver":    {"frame_ms": 40, "duration_scale": 0.6,  "decorative": False, "shadow_sync": False},
+    }
+
+    _profile_name = "full"
+    _profile = PROFILES["full"]
+
+    # { id(client): client } — dict supaya register/unregister O(1)
+    _clients: dict = {}
+    _timer = None
+
+    # Overlay yang menunggu repaint saat frame rate di-cap
+    _paint_queue: dict = {}
+
+    # { id(anim): weakref } untuk animasi yang sedang Running
+    # (weakref — engine tidak boleh memperpanjang umur animasi yang
+    # sudah dibuang pemiliknya)
+    _running: dict = {}
+    _idle_listeners: list = []
+    _was_idle = True
+
+    # fn(now_ms) dipanggil di akhir tiap tick engine (RennsQuality)
+    _frame_listeners: list = []
+
+    # ── Clock ─────────────────────────────────────────────────
+
+    _clock = None
+
+    # Timer call_later yang masih pending (real clock) — dipegang supaya
+    # tidak di-GC sebelum fire
+    _pending_calls: set = set()
+
+    # Hover intent default — lihat set_hover_intent()
+    _hover_dwell_ms  = 0
+    _hover_max_speed = 0.5
+
+    # Horizon prediksi pointer saat drag (ms) — 0 = off
+    _pointer_prediction_ms = 0.0
+    MAX_POINTER_PREDICTION_MS = 50.0
+
+    @classmethod
+    def now_ms(cls) -> float:
+        if cls._clock is not None:
+            return cls._clock.now_ms()
+        return time.monotonic() * 1000.0
+
+    @classmethod
+    def set_clock(cls, clock):
+        """
+        Pasang clock (RennsVirtualClock) atau None untuk wall clock.
+        Animasi yang sedang jalan ikut pindah ke clock baru.
+        """
+        if clock is cls._clock:
+            return
+        cls._clock = clock
+        for ref in list(cls._running.values()):
+            anim = ref()
+            if anim is None:
+                continue
+            if clock is not None and anim.state() == QAbstractAnimation.Running:
+                anim.pause()
+            elif clock is None and anim.state() == QAbstractAnimation.Paused:
+                anim.resume()
+        if clock is None:
+            if cls._clients or cls._paint_queue:
+                cls._ensure_running()
+        elif cls._timer:
+            cls._timer.stop()
+
+    @classmethod
+    def is_virtual(cls) -> bool:
+        return cls._clock is not None
+
+    @classmethod
+    def call_later(cls, ms, fn):
+        """
+        Pengganti QTimer.singleShot yang ikut clock engine.
+        Return handle dengan .cancel().
+        """
+        if cls._clock is not None:
+            return cls._clock._schedule(ms, fn)
+        return _TimerCall(cls, ms, fn)
+
+    # ── Power profile ─────────────────────────────────────────
+
+    @classmethod
+    def set_power_profile(cls, name: str):
+        """
+        Ganti power profile saat runtime: "full" | "balanced" | "saver".
+        Contoh: RennsEngine.set_power_profile("saver") saat laptop pakai baterai.
+        """
+        name = (name or "full").strip().lower()
+        if name not in cls.PROFILES:
+            raise ValueError(f"Unknown power profile: {name!r} "
+                             f"(pilih: {', '.join(cls.PROFILES)})")
+        cls._profile_name = name
+        cls._profile = cls.PROFILES[name]
+        if cls._timer is not None:
+            cls._timer.setInterval(cls._profile["frame_ms"])
+        if not cls.frame_capped():
+            cls._flush_paints()
+
+    @classmethod
+    def power_profile(cls) -> str:
+        return cls._profile_name
+
+    @classmethod
+    def profile_value(cls, key: str):
+        return cls._profile[key]
+
+    @classmethod
+    def frame_capped(cls) -> bool:
+        return cls._profile["frame_ms"] > cls.FRAME_MS
+
+    @classmethod
+    def duration(cls, ms, decorative: bool = False) -> int:
+        """Durasi transisi setelah power profile diterapkan."""
+        if decorative and not cls._profile["decorative"]:
+            return 0
+        return max(0, int(ms * cls._profile["duration_scale"]))
+
+    # ── Hover intent ──────────────────────────────────────────
+
+    @classmethod
+    def set_hover_intent(cls, dwell_ms=80, max_speed: float = 0.5):
+        """
+        Tunda state hover sampai pointer diam `dwell_ms` di atas button.
+        Pointer yang cuma lewat (leave sebelum dwell, atau masih bergerak
+        lebih cepat dari max_speed px/ms) tidak memicu transisi sama sekali.
+        0 = off (default). CSS `hover-intent` per class menimpa nilai ini.
+        """
+        dwell_ms = int(dwell_ms or 0)
+        if dwell_ms < 0 or max_speed <= 0:
+            raise ValueError("hover intent: dwell_ms >= 0 dan max_speed > 0")
+        cls._hover_dwell_ms  = dwell_ms
+        cls._hover_max_speed = float(max_speed)
+
+    @classmethod
+    def hover_intent(cls):
+        """(dwell_ms, max_speed px/ms)"""
+        return cls._hover_dwell_ms, cls._hover_max_speed
+
+    # ── Pointer prediction ────────────────────────────────────
+
+    @classmethod
+    def set_pointer_prediction(cls, ms):
+        """
+        Render drag (elastic, knob toggle) di posisi pointer yang diprediksi
+        `ms` ke depan dari velocity — menutup lag 1–2 frame di layar 60Hz.
+        Saat release posisi asli yang dipakai. 0 = off (default).
+        """
+        ms = float(ms or 0.0)
+        if ms < 0:
+            raise ValueError(f"Pointer prediction must be >= 0 ms, got {ms}")
+        cls._pointer_prediction_ms = min(ms, cls.MAX_POINTER_PREDICTION_MS)
+
+    @classmethod
+    def pointer_prediction(cls) -> float:
+        return cls._pointer_prediction_ms
+
+    # ── Client registry ───────────────────────────────────────
+
+    @classmethod
+    def register(cls, client):
+        """Daftarkan client ke frame ticker. Aman dipanggil berulang."""
+        key = id(client)
+        if key in cls._clients:
+            return
+        cls._clients[key] = client
+        cls._ensure_running()
+        cls._check_idle()
+
+    @classmethod
+    def unregister(cls, client):
+        if cls._clients.pop(id(client), None) is None:
+            return
+        cls._maybe_stop()
+        cls._check_idle()
+
+    @classmethod
+    def client_count(cls) -> int:
+        return len(cls._clients)
+
+    # ── Capped repaint ────────────────────────────────────────
+
+    @classmethod
+    def request_paint(cls, widget):
+        """
+        update() ditunda ke tick engine berikutnya — sekali per frame, setelah
+        semua client jalan. Widget dengan flush_paint() memakai itu.
+        """
+        cls._paint_queue[id(widget)] = widget
+        cls._ensure_running()
+
+    @classmethod
+    def _flush_paints(cls):
+        if not cls._paint_queue:
+            return
+        queue = list(cls._paint_queue.values())
+        cls._paint_queue.clear()
+        for w in queue:
+            try:
+                # flush_paint() → widget invalidate area yang berubah saja
+                flush = getattr(w, "flush_paint", None)
+                if flush is not None:
+                    flush()
+                else:
+                    w.update()
+            except RuntimeError:
+                pass
+        cls._maybe_stop()
+
+    # ── Animation tracking ────────────────────────────────────
+
+    @classmethod
+    def animation(cls, target, prop: bytes) -> QPropertyAnimation:
+        """QPropertyAnimation yang ikut dihitung untuk idle detection."""
+        return cls.track(QPropertyAnimation(target, prop))
+
+    @classmethod
+    def track(cls, anim):
+        key = id(anim)
+
+        ref = weakref.ref(anim)
+
+        def _on_state(new_state, _old_state):
+            if new_state == QAbstractAnimation.Running:
+                cls._running[key] = ref
+                if cls._clock is not None:
+                    # Virtual clock: jangan biarkan Qt menggerakkan animasi,
+                    # waktu dimajukan manual oleh clock.advance()
+                    a = ref()
+                    if a is not None:
+                        a.pause()
+            elif new_state == QAbstractAnimation.Paused and cls._clock is not None:
+                pass   # pause dari virtual clock — tetap dihitung aktif
+            else:
+                cls._running.pop(key, None)
+            cls._check_idle()
+
+        def _on_destroyed(*_):
+            # Dihapus saat masih Running → stateChanged belum tentu sempat
+            cls._running.pop(key, None)
+            cls._check_idle()
+
+        anim.stateChanged.connect(_on_state)
+        anim.destroyed.connect(_on_destroyed)
+        return anim
+
+    @classmethod
+    def active_animation_count(cls) -> int:
+        return len(cls._running)
+
+    # ── Idle ──────────────────────────────────────────────────
+
+    @classmethod
+    def is_idle(cls) -> bool:
+        """True kalau tidak ada yang dianimasikan dan tidak ada timer engine."""
+        return not cls._clients and not cls._running
+
+    @classmethod
+    def add_idle_listener(cls, fn):
+        """fn(idle: bool) dipanggil setiap kali status idle berubah."""
+        if fn not in cls._idle_listeners:
+            cls._idle_listeners.append(fn)
+
+    @classmethod
+    def remove_idle_listener(cls, fn):
+        try:
+            cls._idle_listeners.remove(fn)
+        except ValueError:
+            pass
+
+    @classmethod
+    def add_frame_listener(cls, fn):
+        """fn(now_ms) dipanggil sekali per tick engine, setelah repaint di-flush."""
+        if fn not in cls._frame_listeners:
+            cls._frame_listeners.append(fn)
+
+    @classmethod
+    def remove_frame_listener(cls, fn):
+        try:
+            cls._frame_listeners.remove(fn)
+        except ValueError:
+            pass
+
+    @classmethod
+    def _check_idle(cls):
+        idle = cls.is_idle()
+        if idle == cls._was_idle:
+            return
+        cls._was_idle = idle
+        for fn in list(cls._idle_listeners):
+            fn(idle)
+
+    # ── Ticker ────────────────────────────────────────────────
+
+    @classmethod
+    def _ensure_running(cls):
+        if cls._clock is not None:
+            return   # virtual clock yang memanggil _tick()
+        if cls._timer is None:
+            cls._timer = QTimer()
+            cls._timer.setTimerType(Qt.PreciseTimer)
+            cls._timer.timeout.connect(cls._tick)
+        cls._timer.setInterval(cls._profile["frame_ms"])
+        if not cls._timer.isActive():
+            cls._timer.start()
+
+    @classmethod
+    def _maybe_stop(cls):
+        if cls._timer and not cls._clients and not cls._paint_queue:
+            cls._timer.stop()
+
+    @classmethod
+    def _advance_animations(cls, dt_ms: float):
+        """Virtual clock: majukan semua animasi tracked sebanyak dt_ms."""
+        for ref in list(cls._running.values()):
+            anim = ref()
+            if anim is None:
+                continue
+            try:
+                step = dt_ms if anim.direction() == QAbstractAnimation.Forward else -dt_ms
+                anim.setCurrentTime(max(0, int(anim.currentTime() + step)))
+            except RuntimeError:
+                pass
+
+    @classmethod
+    def _tick(cls):
+        now = cls.now_ms()
+        for client in list(cls._clients.values()):
+            try:
+                alive = client.tick(now)
+            except RuntimeError:
+                # Widget C++ sudah dihapus (deleteLater) — buang client
+                alive = False
+            if not alive:
+                cls.unregister(client)
+        cls._flush_paints()
+        for fn in list(cls._frame_listeners):
+            fn(now)
+        cls._maybe_stop()
+
+
+# ─────────────────────────── call_later ────────────────────────────
+
+class _TimerCall:
+    """Handle call_later untuk wall clock — QTimer single shot yang bisa di-cancel."""
+
+    def __init__(self, engine, ms, fn):
+        self._engine = engine
+        self._fn     = fn
+        self._timer  = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._fire)
+        engine._pending_calls.add(self)
+        self._timer.start(max(0, int(ms)))
+
+    def _fire(self):
+        self._engine._pending_calls.discard(self)
+        fn, self._fn = self._fn, None
+        if fn is not None:
+            fn()
+
+    def cancel(self):
+        self._timer.stop()
+        self._fn = None
+        self._engine._pending_calls.discard(self)
+
+    @property
+    def active(self) -> bool:
+        return self._fn is not None
+
+
+class _VirtualCall:
+    """Handle call_later untuk virtual clock."""
+
+    __slots__ = ("due", "fn")
+
+    def __init__(self, due, fn):
+        self.due = due
+        self.fn  = fn
+
+    def cancel(self):
+        self.fn = None
+
+    @property
+    def active(self) -> bool:
+        return self.fn is not None
+
+
+# ─────────────────────────── Virtual clock ─────────────────────────
+
+class RennsVirtualClock:
+    """
+    Clock manual — waktu hanya maju saat advance()/step() dipanggil.
+    Satu step = satu frame: animasi Qt tracked, call_later yang jatuh
+    tempo, lalu tick engine (keyframe, shadow, repaint queue).
+    """
+
+    def __init__(self, start_ms: float = 0.0):
+        self._now   = float(start_ms)
+        self._queue = []
+        self._seq   = itertools.count()
+
+    def now_ms(self) -> float:
+        return self._now
+
+    def _schedule(self, ms, fn):
+        call = _VirtualCall(self._now + max(0.0, float(ms)), fn)
+        heapq.heappush(self._queue, (call.due, next(self._seq), call))
+        return call
+
+    def pending_calls(self) -> int:
+        return sum(1 for _, _, c in self._queue if c.active)
+
+    def step(self, frames: int = 1):
+        self.advance(frames * RennsEngine.FRAME_MS)
+
+    def advance(self, ms: float, frame_ms: float = None):
+        """Majukan waktu ms milidetik, frame demi frame (default FRAME_MS)."""
+        frame_ms  = float(frame_ms or RennsEngine.FRAME_MS)
+        remaining = float(ms)
+        while remaining > 1e-9:
+            dt = min(frame_ms, remaining)
+            remaining -= dt
+            self._now += dt
+            RennsEngine._advance_animations(dt)
+            self._run_due()
+            RennsEngine._tick()
+
+    def _run_due(self):
+        # call_later yang di-schedule di dalam callback (delay 0) ikut
+        # dijalankan di frame yang sama selama sudah jatuh tempo
+        while self._queue and self._queue[0][0] <= self._now:
+            _, _, call = heapq.heappop(self._queue)
+            fn, call.fn = call.fn, None
+            if fn is not None:
+                fn()
@@ -0,0 +1,256 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Author: @ahsanihlwn
+# Copyright (c) 2026 @ahsanihlwn
+
+"""
+icon_cache.py — icon yang di-decode sekali dan di-blit pre-scaled.
+
+QIcon.paint() men-scale ulang gambar sumber tiap paint, dan tiap
+QIcon(path) decode file sendiri. RennsIcon:
+
+  - decode tiap file SEKALI per proses (atlas juga: satu file, banyak cell)
+  - raster hasil scale di-cache bareng: key (icon, ukuran, DPR, mode)
+  - RennsIcon untuk path / cell yang sama adalah object yang sama
+
+Dari kode:
+    Renns.object("tool", icon="save.png")
+
+Dari RENSS — sprite sheet, cell ke-(col, row), 0-based:
+    .tool {
+        icon: atlas("icons.png", 3, 7);
+        atlas-cell: 32px;            /* atau "32px 24px" (lebar tinggi) */
+    }
+    .tool:hover { icon: atlas("icons.png", 4, 7); }
+
+`icon:` juga menerima path biasa: icon: "save.png";
+"""
+
+import re
+from collections import OrderedDict
+
+from PySide6.QtCore import Qt, QRect, QSize, QPointF
+from PySide6.QtGui import QIcon, QImage, QPixmap
+
+from .button.button_ext.raster import native_image, to_pixmap, native, add_dpr_listener, dpr_released
+
+_RASTER_CACHE_MAX = 256
+_DEFAULT_CELL = 32
+
+_ATLAS_RE = re.compile(
+    r'atlas\(\s*["\']?([^"\',)]+?)["\']?\s*,\s*(\d+)\s*,\s*(\d+)\s*\)', re.IGNORECASE)
+
+# { path: QImage | QIcon } — QIcon untuk svg (di-render per ukuran)
+_sources: dict = {}
+# { key: RennsIcon }
+_icons: dict = {}
+# { css value + cell: RennsIcon | None }
+_css_icons: dict = {}
+# { (icon key, w, h, dpr, mode): QPixmap } — LRU
+_rasters: "OrderedDict" = OrderedDict()
+_stats = {"hits": 0, "misses": 0, "decodes": 0}
+
+
+def _source(path: str):
+    src = _sources.get(path)
+    if src is None:
+        _stats["decodes"] += 1
+        if path.lower().endswith(".svg"):
+            src = QIcon(path)
+        else:
+            # Format native sekali saat decode — crop/scale/blit tanpa konversi
+            src = native_image(QImage(path))
+        _sources[path] = src
+    return src
+
+
+def _parse_cell(value) -> tuple:
+    nums = re.findall(r'\d+(?:\.\d+)?', str(value or ""))
+    try:
+        w = int(float(nums[0])) if nums else _DEFAULT_CELL
+        h = int(float(nums[1])) if len(nums) > 1 else w
+    except:
+        w = h = _DEFAULT_CELL
+    return max(1, w), max(1, h)
+
+
+class RennsIcon:
+    __slots__ = ("_key", "_path", "_cell", "_hash")
+
+    def __init__(self, key, path: str, cell: QRect = None):
+        self._key  = key
+        self._path = path
+        self._cell = cell
+        self._hash = hash(key)
+
+    # ── Factory ───────────────────────────────────────────────
+
+    @classmethod
+    def file(cls, path: str) -> "RennsIcon":
+        key = ("file", path)
+        icon = _icons.get(key)
+        if icon is None:
+            icon = cls(key, path)
+            _icons[key] = icon
+        return icon
+
+    @classmethod
+    def atlas(cls, path: str, col: int, row: int,
+              cell_w: int = _DEFAULT_CELL, cell_h: int = None) -> "RennsIcon":
+        cell_h = cell_w if cell_h is None else cell_h
+        key = ("atlas", path, col, row, cell_w, cell_h)
+        icon = _icons.get(key)
+        if icon is None:
+            icon = cls(key, path, QRect(col * cell_w, row * cell_h, cell_w, cell_h))
+            _icons[key] = icon
+        return icon
+
+    @classmethod
+    def from_css(cls, value: str, cell=None):
+        """Nilai property `icon:` (+ `atlas-cell:`) → RennsIcon, None kalau kosong."""
+        ck = (value, cell)
+        if ck in _css_icons:
+            return _css_icons[ck]
+        icon = None
+        text = (value or "").strip()
+        m = _ATLAS_RE.search(text)
+        if m:
+            cw, chh = _parse_cell(cell)
+            icon = cls.atlas(m.group(1).strip(), int(m.group(2)), int(m.group(3)), cw, chh)
+        else:
+            url = re.match(r'url\(\s*(.*?)\s*\)$', text, re.IGNORECASE)
+            if url:
+                text = url.group(1)
+            text = text.strip("\"'").strip()
+            if text and text.lower() != "none":
+                icon = cls.file(text)
+        _css_icons[ck] = icon
+        return icon
+
+    @classmethod
+    def from_any(cls, icon):
+        """str path / RennsIcon / None. QIcon dibiarkan apa adanya."""
+        if isinstance(icon, str):
+            return cls.file(icon) if icon else None
+        return icon
+
+    # ── Cache ─────────────────────────────────────────────────
+
+    @staticmethod
+    def cache_stats() -> dict:
+        return {**_stats, "entries": len(_rasters), "sources": len(_sources)}
+
+    @staticmethod
+    def clear_cache():
+        _sources.clear()
+        _rasters.clear()
+
+    # ── QIcon-like ────────────────────────────────────────────
+
+    def __bool__(self):
+        return not self.isNull()
+
+    def isNull(self) -> bool:
+        src = _source(self._path)
+        return src.isNull()
+
+    def cacheKey(self) -> int:
+        return self._hash
+
+    def actualSize(self) -> QSize:
+        """Ukuran asli (cell untuk atlas)."""
+        if self._cell is not None:
+            return self._cell.size()
+        src = _source(self._path)
+        if isinstance(src, QIcon):
+            sizes = src.availableSizes()
+            return sizes[-1] if sizes else QSize(256, 256)
+        return src.size()
+
+    def pixmap(self, w: int, h: int, dpr: float = 1.0,
+               mode=QIcon.Mode.Normal) -> QPixmap:
+        """
+        Pixmap pre-scaled yang muat di w x h (logical), aspect ratio tetap.
+        Seperti QIcon: gambar raster tidak di-upscale melebihi ukuran aslinya.
+        """
+        w, h = max(1, int(w)), max(1, int(h))
+        key = (self._key, w, h, dpr, mode)
+        pm = _rasters.get(key)
+        if pm is not None:
+            _rasters.move_to_end(key)
+            _stats["hits"] += 1
+            return pm
+
+        _stats["misses"] += 1
+        pm = self._rasterize(w, h, dpr, mode)
+        _rasters[key] = pm
+        while len(_rasters) > _RASTER_CACHE_MAX:
+            _rasters.popitem(last=False)
+        return pm
+
+    def paint(self, painter, *args, alignment=Qt.AlignCenter, mode=QIcon.Mode.Normal):
+        """paint(painter, rect) atau paint(painter, x, y, w, h[, alignment])."""
+        if len(args) >= 4:
+            rect = QRect(int(args[0]), int(args[1]), int(args[2]), int(args[3]))
+            if len(args) > 4:
+                alignment = args[4]
+        else:
+            rect = QRect(args[0])
+            if len(args) > 1:
+                alignment = args[1]
+        if rect.isEmpty() or not self:
+            return
+
+        dev = painter.device()
+        dpr = dev.devicePixelRatioF() if dev is not None else 1.0
+        pm = self.pixmap(rect.width(), rect.height(), dpr, mode)
+        size = pm.deviceIndependentSize()
+        x, y = rect.x(), rect.y()
+        if alignment & Qt.AlignHCenter:
+            x += (rect.width() - size.width()) / 2
+        elif alignment & Qt.AlignRight:
+            x += rect.width() - size.width()
+        if alignment & Qt.AlignVCenter:
+            y += (rect.height() - size.height()) / 2
+        elif alignment & Qt.AlignBottom:
+            y += rect.height() - size.height()
+        painter.drawPixmap(QPointF(x, y), pm)
+
+    # ── Internal ──────────────────────────────────────────────
+
+    def _rasterize(self, w: int, h: int, dpr: float, mode) -> QPixmap:
+        src = _source(self._path)
+        if isinstance(src, QIcon):
+            pm = native(src.pixmap(QSize(w, h), dpr))
+        else:
+            img = src.copy(self._cell) if self._cell is not None else src
+            if img.isNull():
+                pm = QPixmap()
+            else:
+                # Ukuran logical = muat di w x h, tidak lebih besar dari asli
+                # (sama dengan QIcon). Pixel = logical * dpr, maksimal asli.
+                s  = min(1.0, w / img.width(), h / img.height())
+                lw = img.width() * s
+                px = min(1.0, s * dpr)
+                if px < 1.0:
+                    img = img.scaled(max(1, round(img.width() * px)),
+                                     max(1, round(img.height() * px)),
+                                     Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                pm = to_pixmap(img)
+                pm.setDevicePixelRatio(pm.width() / lw)
+        if mode != QIcon.Mode.Normal and not pm.isNull():
+            from PySide6.QtWidgets import QApplication, QStyleOption
+            pm = QApplication.style().generatedIconPixmap(mode, pm, QStyleOption())
+        return pm
+
+
+def _on_dpr_change(window, old, new):
+    # Source hasil decode tetap; hanya raster pre-scaled DPR lama yang
+    # tidak dipakai window lain yang dibuang
+    for key in [k for k in _rasters if dpr_released(k[3], old)]:
+        del _rasters[key]
+
+
+add_dpr_listener(_on_dpr_change)
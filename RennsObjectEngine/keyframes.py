@@ -0,0 +1,367 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Author: @ahsanihlwn
+# Copyright (c) 2026 @ahsanihlwn
+
+"""
+keyframes.py — @keyframes RENSS di-compile jadi track siap pakai.
+
+Syntax:
+    @keyframes pulse {
+        0%   { transform: scale(1); }
+        50%  { transform: scale(1.08); background: rgba(80, 90, 200, 0.7); }
+        100% { transform: scale(1); }
+    }
+
+    .status { animation: pulse 1.2s ease-in-out infinite; }
+
+Compile:
+  - Tiap stop di-parse SEKALI (transform → scale/rotate, background → QColor)
+  - Easing di-bake per segmen ke lookup table (_LUT_SIZE sampel per cycle)
+  - Track di-cache per (nama, class, component, easing) → semua widget
+    satu class share instance yang sama
+
+Play:
+  - Satu _TrackPlayer per overlay, di-tick dari RennsEngine (satu timer
+    untuk semua player) — tick = index LUT + lerp, tanpa parsing
+"""
+
+import math
+import re
+from array import array
+
+from PySide6.QtGui import QColor
+
+from .button.button_ext.animation import resolve_easing
+from .button.button_ext.css_color import parse_css_color
+from .button.button_ext.transform import parse_transform
+from .engine import RennsEngine
+
+_LUT_SIZE = 240
+
+_DIRECTIONS = ("normal", "reverse", "alternate", "alternate-reverse")
+_EASINGS    = ("linear", "ease", "ease-in", "ease-out", "ease-in-out",
+               "bounce", "spring")
+
+# { (name, class_name, component, easing): KeyframeTrack }
+_tracks: dict = {}
+
+
+def clear_track_cache():
+    """Dipanggil RennsStyle.load — style baru, track lama tidak valid."""
+    _tracks.clear()
+
+
+# ─────────────────────────── Parser ────────────────────────────────
+
+def parse_keyframe_stops(body: str) -> dict:
+    """
+    Parse isi blok @keyframes → { offset_float: props }.
+    Support: from, to, 0%, 50%, "0%, 100%" (multi selector).
+    """
+    stops = {}
+    for selector, props_body in re.findall(r'([^{}]+)\{([^{}]*)\}', body):
+        props = {}
+        for line in props_body.split(";"):
+            line = line.strip()
+            if ":" in line:
+                key, value = line.split(":", 1)
+                props[key.strip()] = value.strip()
+
+        for sel in selector.split(","):
+            sel = sel.strip().lower()
+            if sel == "from":
+                offset = 0.0
+            elif sel == "to":
+                offset = 1.0
+            elif sel.endswith("%"):
+                try:    offset = float(sel[:-1]) / 100.0
+                except: continue
+            else:
+                continue
+            offset = max(0.0, min(1.0, offset))
+            stops.setdefault(offset, {}).update(props)
+    return stops
+
+
+class AnimationSpec:
+    """Hasil parse property `animation:`."""
+
+    __slots__ = ("name", "duration_ms", "delay_ms", "easing",
+                 "iterations", "direction", "source")
+
+    def __init__(self, name, duration_ms, delay_ms, easing,
+                 iterations, direction, source):
+        self.name        = name
+        self.duration_ms = duration_ms
+        self.delay_ms    = delay_ms
+        self.easing      = easing
+        self.iterations  = iterations
+        self.direction   = direction
+        self.source      = source
+
+
+def parse_animation(value: str):
+    """
+    animation: <name> <duration> [easing] [delay] [count|infinite] [direction]
+    Urutan bebas kecuali duration selalu sebelum delay (sama seperti CSS).
+    Return None kalau tidak ada nama/duration.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.lower() == "none":
+        return None
+
+    name       = None
+    times      = []
+    easing     = "ease"
+    iterations = 1.0
+    direction  = "normal"
+
+    for tok in value.split():
+        low = tok.lower()
+        if re.fullmatch(r'[0-9.]+m?s', low):
+            try:
+                times.append(float(low[:-2]) if low.endswith("ms")
+                             else float(low[:-1]) * 1000.0)
+            except ValueError:
+                pass
+        elif low == "infinite":
+            iterations = math.inf
+        elif re.fullmatch(r'[0-9.]+', low):
+            try:    iterations = max(0.0, float(low))
+            except: pass
+        elif low in _EASINGS:
+            easing = low
+        elif low in _DIRECTIONS:
+            direction = low
+        elif name is None:
+            name = tok
+
+    if name is None or not times:
+        return None
+
+    return AnimationSpec(
+        name=name,
+        duration_ms=max(1.0, times[0]),
+        delay_ms=times[1] if len(times) > 1 else 0.0,
+        easing=easing,
+        iterations=iterations,
+        direction=direction,
+        source=value,
+    )
+
+
+# ─────────────────────────── Track ─────────────────────────────────
+
+class KeyframeTrack:
+    """
+    Track immutable hasil compile. Channel yang tidak disebut di @keyframes
+    = None → player tidak menyentuh property itu (transisi state tetap jalan).
+    """
+
+    __slots__ = ("name", "scale", "rotate", "color", "channels")
+
+    def __init__(self, name, scale, rotate, color):
+        self.name   = name
+        self.scale  = scale    # array('d') | None
+        self.rotate = rotate   # array('d') | None
+        self.color  = color    # list[QColor] | None
+
+        ch = set()
+        if scale  is not None: ch.add("scale")
+        if rotate is not None: ch.add("rotate")
+        if color  is not None: ch.add("background")
+        self.channels = frozenset(ch)
+
+    def sample(self, progress: float):
+        """progress 0..1 → (scale, rotate, QColor), None untuk channel kosong."""
+        pos  = max(0.0, min(1.0, progress)) * (_LUT_SIZE - 1)
+        i    = int(pos)
+        frac = pos - i
+        j    = min(i + 1, _LUT_SIZE - 1)
+
+        s = r = c = None
+        if self.scale is not None:
+            a = self.scale
+            s = a[i] + (a[j] - a[i]) * frac
+        if self.rotate is not None:
+            a = self.rotate
+            r = a[i] + (a[j] - a[i]) * frac
+        if self.color is not None:
+            c = self.color[i if frac < 0.5 else j]
+        return s, r, c
+
+
+def _channel_stops(stops: dict, extract, fallback):
+    """
+    Ambil (offset, value) untuk satu channel. Return None kalau channel
+    tidak disebut sama sekali. 0%/100% yang kosong diisi nilai base class.
+    """
+    pts = []
+    for off in sorted(stops):
+        v = extract(stops[off])
+        if v is not None:
+            pts.append((off, v))
+    if not pts:
+        return None
+    if pts[0][0] > 0.0:
+        pts.insert(0, (0.0, fallback))
+    if pts[-1][0] < 1.0:
+        pts.append((1.0, fallback))
+    return pts
+
+
+def _bake(pts, curve, lerp):
+    """Sampling per segmen dengan easing → list nilai sepanjang _LUT_SIZE."""
+    out = []
+    seg = 0
+    for k in range(_LUT_SIZE):
+        t = k / (_LUT_SIZE - 1)
+        while seg < len(pts) - 2 and t > pts[seg + 1][0]:
+            seg += 1
+        o0, v0 = pts[seg]
+        o1, v1 = pts[seg + 1]
+        span   = o1 - o0
+        local  = 0.0 if span <= 0 else (t - o0) / span
+        out.append(lerp(v0, v1, curve.valueForProgress(local)))
+    return out
+
+
+def _lerp_f(a, b, e):
+    return a + (b - a) * e
+
+
+def _lerp_c(a, b, e):
+    e = max(0.0, min(1.0, e))
+    return QColor(
+        int(a.red()   + (b.red()   - a.red())   * e),
+        int(a.green() + (b.green() - a.green()) * e),
+        int(a.blue()  + (b.blue()  - a.blue())  * e),
+        int(a.alpha() + (b.alpha() - a.alpha()) * e),
+    )
+
+
+def _extract_scale(props):
+    # rotate-only transform tidak boleh klaim channel scale
+    t = props.get("transform", "")
+    if "scale(" not in t:
+        return None
+    return parse_transform(t)[0]
+
+
+def _extract_rotate(props):
+    t = props.get("transform", "")
+    if "rotate" not in t:
+        return None
+    return parse_transform(t)[1]
+
+
+def _extract_color(props):
+    bg = props.get("background")
+    return parse_css_color(bg) if bg else None
+
+
+def compile_track(spec: AnimationSpec, class_name: str, component=None):
+    """
+    Compile (atau ambil dari cache) track untuk spec + class.
+    Return None kalau @keyframes dengan nama itu tidak ada.
+    """
+    key = (spec.name, class_name, component, spec.easing)
+    track = _tracks.get(key)
+    if track is not None:
+        return track
+
+    from .renns_style import RennsStyle
+    stops = RennsStyle.keyframes.get(spec.name)
+    if not stops:
+        return None
+
+    base = RennsStyle.get(class_name, "base", component)
+    base_scale, base_rotate = parse_transform(base.get("transform"))
+    base_color = parse_css_color(base.get("background", "transparent"))
+    curve = resolve_easing(spec.easing)
+
+    scale_pts  = _channel_stops(stops, _extract_scale,  base_scale)
+    rotate_pts = _channel_stops(stops, _extract_rotate, base_rotate)
+    color_pts  = _channel_stops(stops, _extract_color,  base_color)
+
+    track = KeyframeTrack(
+        name=spec.name,
+        scale=array('d', _bake(scale_pts, curve, _lerp_f)) if scale_pts else None,
+        rotate=array('d', _bake(rotate_pts, curve, _lerp_f)) if rotate_pts else None,
+        color=_bake(color_pts, curve, _lerp_c) if color_pts else None,
+    )
+    _tracks[key] = track
+    return track
+
+
+# ─────────────────────────── Player ────────────────────────────────
+
+class _TrackPlayer:
+    """Mainkan satu KeyframeTrack di satu overlay. Di-tick oleh RennsEngine."""
+
+    def __init__(self, overlay, track: KeyframeTrack, spec: AnimationSpec):
+        self.overlay  = overlay
+        self.track    = track
+        self.spec     = spec
+        self.start_ms = RennsEngine.now_ms() + spec.delay_ms
+        self._paused_at = None
+
+    def pause(self):
+        """Berhenti di-tick (widget tidak kelihatan). Fase animasi disimpan."""
+        if self._paused_at is None:
+            self._paused_at = RennsEngine.now_ms()
+            RennsEngine.unregister(self)
+
+    def resume(self):
+        """Lanjut dari fase saat pause — waktu tersembunyi tidak dihitung."""
+        if self._paused_at is not None:
+            self.start_ms += RennsEngine.now_ms() - self._paused_at
+            self._paused_at = None
+            RennsEngine.register(self)
+
+    def _progress(self, elapsed: float):
+        spec  = self.spec
+        cycle = elapsed / spec.duration_ms
+        done  = cycle >= spec.iterations
+        if done:
+            cycle = spec.iterations
+        idx = int(cycle)
+        p   = cycle - idx
+        # Tepat di akhir cycle terakhir → progress 1.0, bukan 0.0 cycle berikutnya
+        if done and p == 0.0 and idx > 0:
+            idx, p = idx - 1, 1.0
+
+        d = spec.direction
+        if d == "reverse":
+            p = 1.0 - p
+        elif d == "alternate" and idx % 2 == 1:
+            p = 1.0 - p
+        elif d == "alternate-reverse" and idx % 2 == 0:
+            p = 1.0 - p
+        return p, done
+
+    def tick(self, now_ms: float) -> bool:
+        elapsed = now_ms - self.start_ms
+        if elapsed < 0:
+            return True
+
+        p, done = self._progress(elapsed)
+        s, r, c = self.track.sample(p)
+
+        ov = self.overlay
+        if s is not None:
+            ov._scale = s
+            ov._notify_scale()
+        if r is not None: ov._transform_rotate = r
+        if c is not None: ov._bg_color = c
+        ov.mark_dirty()
+
+        if done:
+            ov._on_track_finished(self)
+            return False
+        return True
@@ -0,0 +1,214 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Author: @ahsanihlwn
+# Copyright (c) 2026 @ahsanihlwn
+
+"""
+quality.py — level-of-detail adaptif saat paint melewati budget frame.
+
+Waktu paint node engine (overlay, shadow, compositor, pill) diukur dan
+dijumlah per frame engine. Kalau rata-ratanya lewat budget beberapa
+frame berturut-turut, quality turun satu level; begitu paint kembali
+murah cukup lama — atau engine idle — quality naik lagi dan node yang
+sempat digambar murah di-repaint penuh.
+
+    Level 0  penuh
+    Level 1  layer blur backdrop tidak di-bake baru (pakai yang sudah
+             ada), shadow satu layer, tanpa SmoothPixmapTransform
+             selama bergerak
+    Level 2  + tanpa glass ring, tanpa antialiasing selama bergerak
+
+    from RennsObjectEngine import RennsQuality
+    RennsQuality.set_budget(10)      # ms paint per frame, None = 75% frame_ms
+    RennsQuality.force(1)            # kunci level (None = adaptif lagi)
+    RennsQuality.set_enabled(False)  # selalu level 0
+    RennsQuality.stats()
+
+Selama virtual clock aktif tidak ada adaptasi — hasil test tetap
+deterministik.
+"""
+
+import time
+import weakref
+
+from .engine import RennsEngine
+
+
+class RennsQuality:
+
+    LEVELS = (
+        # blur_bake     : False → radius backdrop yang belum di-cache tidak
+        #                 di-bake, pakai layer cached terdekat
+        # shadow_layers : 0 = semua layer box-shadow, n = n layer pertama
+        # glass         : False → glass-border ring dilewati (path vector)
+        # smooth_motion : False → tanpa SmoothPixmapTransform saat ter-transform
+        # aa_motion     : False → tanpa Antialiasing saat ter-transform
+        {"blur_bake": True,  "shadow_layers": 0, "glass": True,  "smooth_motion": True,  "aa_motion": True},
+        {"blur_bake": False, "shadow_layers": 1, "glass": True,  "smooth_motion": False, "aa_motion": True},
+        {"blur_bake": False, "shadow_layers": 1, "glass": False, "smooth_motion": False, "aa_motion": False},
+    )
+
+    # Frame berturut-turut di atas budget sebelum turun level
+    DEGRADE_FRAMES = 3
+    # Berapa lama (ms) paint harus di bawah RESTORE_RATIO × budget untuk naik level
+    RESTORE_MS     = 500
+    RESTORE_RATIO  = 0.5
+    # Bobot frame terbaru di rata-rata paint time (EMA)
+    SMOOTHING      = 0.3
+
+    _enabled  = True
+    _forced   = None
+    _budget   = None     # None → 75% frame_ms power profile
+
+    _level    = 0
+    _params   = LEVELS[0]
+
+    _frame_ms = 0.0      # paint time terkumpul sejak tick terakhir
+    _avg_ms   = 0.0
+    _over     = 0
+    _calm_ms  = 0.0
+    _last_now = None
+
+    # Node yang digambar di level > 0 — di-repaint saat quality pulih
+    _degraded = weakref.WeakSet()
+
+    _degrades = 0
+    _restores = 0
+
+    # ── API ───────────────────────────────────────────────────
+
+    @classmethod
+    def set_enabled(cls, enabled: bool):
+        cls._enabled = bool(enabled)
+        if not enabled:
+            cls._set_level(0)
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def set_budget(cls, ms=None):
+        """Budget paint per frame (ms). None = 75% frame_ms power profile."""
+        cls._budget = None if ms is None else max(0.1, float(ms))
+
+    @classmethod
+    def budget_ms(cls) -> float:
+        if cls._budget is not None:
+            return cls._budget
+        return RennsEngine.profile_value("frame_ms") * 0.75
+
+    @classmethod
+    def force(cls, level=None):
+        """Kunci level 0..2, atau None untuk kembali adaptif."""
+        if level is None:
+            cls._forced = None
+            return
+        level = max(0, min(len(cls.LEVELS) - 1, int(level)))
+        cls._forced = level
+        cls._set_level(level)
+
+    @classmethod
+    def level(cls) -> int:
+        return cls._level
+
+    @classmethod
+    def value(cls, key: str):
+        return cls._params[key]
+
+    @classmethod
+    def stats(cls) -> dict:
+        return {
+            "level":     cls._level,
+            "paint_ms":  round(cls._avg_ms, 3),
+            "budget_ms": cls.budget_ms(),
+            "degrades":  cls._degrades,
+            "restores":  cls._restores,
+        }
+
+    @classmethod
+    def reset_stats(cls):
+        cls._degrades = 0
+        cls._restores = 0
+
+    # ── Dipanggil dari paint ──────────────────────────────────
+
+    @staticmethod
+    def paint_started() -> float:
+        return time.perf_counter()
+
+    @classmethod
+    def paint_finished(cls, t0: float):
+        cls._frame_ms += (time.perf_counter() - t0) * 1000.0
+
+    @classmethod
+    def painted(cls, node):
+        """Node baru digambar — dicatat kalau level sedang turun."""
+        if cls._level:
+            cls._degraded.add(node)
+
+    # ── Internal ──────────────────────────────────────────────
+
+    @classmethod
+    def _on_frame(cls, now: float):
+        frame_ms, cls._frame_ms = cls._frame_ms, 0.0
+        last, cls._last_now = cls._last_now, now
+        if not cls._enabled or cls._forced is not None or RennsEngine.is_virtual():
+            return
+
+        a = cls.SMOOTHING
+        cls._avg_ms = cls._avg_ms * (1.0 - a) + frame_ms * a
+        budget = cls.budget_ms()
+
+        if cls._avg_ms > budget:
+            cls._calm_ms = 0.0
+            cls._over += 1
+            if cls._over >= cls.DEGRADE_FRAMES and cls._level < len(cls.LEVELS) - 1:
+                cls._over = 0
+                cls._degrades += 1
+                cls._set_level(cls._level + 1)
+            return
+
+        cls._over = 0
+        if cls._level and cls._avg_ms < budget * cls.RESTORE_RATIO:
+            dt = (now - last) if last is not None else 0.0
+            cls._calm_ms += max(0.0, min(dt, 100.0))
+            if cls._calm_ms >= cls.RESTORE_MS:
+                cls._calm_ms = 0.0
+                cls._restores += 1
+                cls._set_level(cls._level - 1)
+        else:
+            cls._calm_ms = 0.0
+
+    @classmethod
+    def _on_idle(cls, idle: bool):
+        # Semua animasi selesai → frame terakhir harus kualitas penuh
+        if idle and cls._level and cls._forced is None:
+            cls._restores += 1
+            cls._avg_ms = 0.0
+            cls._set_level(0)
+        cls._last_now = None
+
+    @classmethod
+    def _set_level(cls, level: int):
+        if level == cls._level:
+            return
+        upgraded = level < cls._level
+        cls._level  = level
+        cls._params = cls.LEVELS[level]
+        if upgraded:
+            # Repaint node yang terakhir digambar lebih murah dari level ini
+            nodes = list(cls._degraded)
+            if level == 0:
+                cls._degraded.clear()
+            for node in nodes:
+                try:
+                    node.update()
+                except RuntimeError:
+                    pass
+
+
+RennsEngine.add_frame_listener(RennsQuality._on_frame)
+RennsEngine.add_idle_listener(RennsQuality._on_idle)
@@ -11,9 +11,24 @@ class RennsStyle:
 
     styles = {}
 
+    # { name: { offset_float: props } } — isi mentah @keyframes
+    keyframes = {}
+
+    # Naik tiap load() — cache turunan style (render plan) cek ini
+    generation = 0
+
     @classmethod
     def load(cls, path):
         cls.styles.clear()
+        cls.keyframes.clear()
+        cls.generation += 1
+
+        from .keyframes import clear_track_cache
+        clear_track_cache()
+        from .button.overlay import clear_canvas_cache
+        clear_canvas_cache()
+        from .button.button_ext.glass_border import clear_glass_cache
+        clear_glass_cache()
 
         with open(path, "r", encoding="utf-8") as f:
             content = f.read()
@@ -21,6 +36,10 @@ class RennsStyle:
         # Strip komentar /* ... */ (CSS-style, bisa multiline)
         content = re.sub(r'/[*].*?[*]/', '', content, flags=re.DOTALL)
 
+        # @keyframes di-extract duluan — body-nya nested { { } },
+        # regex selector di bawah tidak bisa handle nesting
+        content = cls._extract_keyframes(content)
+
         pattern = r"(.*?)\s*\{(.*?)\}"
         matches = re.findall(pattern, content, re.DOTALL)
 
@@ -72,6 +91,31 @@ class RennsStyle:
             cls.styles[class_part].setdefault(key, {})
             cls.styles[class_part][key][state] = props
 
+    @classmethod
+    def _extract_keyframes(cls, content: str) -> str:
+        """Ambil semua blok @keyframes ke cls.keyframes, return sisa content."""
+        from .keyframes import parse_keyframe_stops
+
+        out = []
+        pos = 0
+        for m in re.finditer(r'@keyframes\s+([\w-]+)\s*\{', content):
+            if m.start() < pos:
+                continue
+            # Cari kurung tutup pasangan
+            depth = 1
+            i = m.end()
+            while i < len(content) and depth > 0:
+                if content[i] == "{":
+                    depth += 1
+                elif content[i] == "}":
+                    depth -= 1
+                i += 1
+            cls.keyframes[m.group(1)] = parse_keyframe_stops(content[m.end():i - 1])
+            out.append(content[pos:m.start()])
+            pos = i
+        out.append(content[pos:])
+        return "".join(out)
+
     @classmethod
     def get(cls, class_name, state, component=None):
         """
@@ -212,9 +256,10 @@ class Renns:
         from PySide6.QtCore import QEvent, QTimer
         from PySide6.QtGui import QColor
         from .button.button_ext.css_color import parse_css_color
-        from .button.overlay import RennsOverlay, OVERLAY_MULTIPLIER
-        from .button.button_ext.animation import resolve_easing
+        from .button.overlay import RennsOverlay, canvas_size
+        from .button.button_ext.animation import resolve_easing, retarget
         from .button.button_ext.transform import parse_transform
+        from .engine import RennsEngine
 
         class _Wrapped(QWidget):
             def __init__(self, widget, class_name, parent):
@@ -248,7 +293,7 @@ class Renns:
                     self.overlay.render_mode = "rect"
                     self.overlay._btn_w = bw
                     self.overlay._btn_h = bh
-                    self.overlay.resize(bw * OVERLAY_MULTIPLIER, bh * OVERLAY_MULTIPLIER)
+                    self.overlay.set_canvas_size(*canvas_size(self._class_name, None, bw, bh))
                     self.overlay.show()
                     self._update()
                 QTimer.singleShot(0, self._sync)
@@ -279,21 +324,13 @@ class Renns:
                 bg = merged.get("background")
                 if bg:
                     dur, easing = RennsStyle.parse_transition(merged.get("transition", "0.25s ease"))
-                    self.overlay.color_anim.stop()
-                    self.overlay.color_anim.setStartValue(self.overlay.bgColor)
-                    self.overlay.color_anim.setEndValue(parse_css_color(bg))
-                    self.overlay.color_anim.setDuration(int(dur * 1000))
-                    self.overlay.color_anim.setEasingCurve(resolve_easing(easing))
-                    self.overlay.color_anim.start()
+                    retarget(self.overlay.color_anim, parse_css_color(bg),
+                             RennsEngine.duration(dur * 1000), resolve_easing(easing))
                 scale, rotate = parse_transform(merged.get("transform"))
                 dur, easing   = RennsStyle.parse_transition(merged.get("transition", "0.25s ease"))
-                self.overlay.anim.stop()
-                self.overlay.anim.setStartValue(self.overlay.scale)
-                self.overlay.anim.setEndValue(scale)
-                self.overlay.anim.setDuration(int(dur * 1000))
-                self.overlay.anim.setEasingCurve(resolve_easing(easing))
-                self.overlay.anim.start()
+                retarget(self.overlay.anim, scale,
+                         RennsEngine.duration(dur * 1000), resolve_easing(easing))
                 self.overlay.style_data = merged
-                self.overlay.update()
+                self.overlay.mark_dirty()
 
         return _Wrapped(widget, class_name, parent)
\ No newline at end of file
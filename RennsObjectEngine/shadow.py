@@ -11,10 +11,15 @@ from typing import Optional, List
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import (
     Qt, QRectF, QTimer, QEvent, QObject, Property,
-    QPropertyAnimation, QEasingCurve
+    QPropertyAnimation, QEasingCurve, QAbstractAnimation
 )
 from PySide6.QtGui import QPainter, QColor, QPixmap, QBrush
 
+from .engine import RennsEngine
+from .compositor import CompositedNode
+from .button.button_ext.raster import new_raster, to_pixmap
+from .quality import RennsQuality
+
 
 # ─────────────────────────── CSS parser ────────────────────────────
 
@@ -71,29 +76,33 @@ def _parse_rgba(value: str) -> QColor:
 # ─────────────────────────── Blur + bake ───────────────────────────
 
 def _blur_pixmap(src: QPixmap, radius: int) -> QPixmap:
-    """Qt GPU blur — tidak freeze."""
+    """Qt GPU blur — tidak freeze. radius logical, blur jalan di pixel device."""
     if radius <= 0:
         return src
     from PySide6.QtWidgets import (
         QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect
     )
+    # Scene bekerja di pixel: DPR dilepas selama blur, dipasang lagi di hasil
+    dpr = src.devicePixelRatio()
+    px  = QPixmap(src)
+    px.setDevicePixelRatio(1.0)
     scene = QGraphicsScene()
-    item  = QGraphicsPixmapItem(src)
+    item  = QGraphicsPixmapItem(px)
     fx    = QGraphicsBlurEffect()
-    fx.setBlurRadius(radius * 2)
+    fx.setBlurRadius(radius * 2 * dpr)
     fx.setBlurHints(QGraphicsBlurEffect.QualityHint)
     item.setGraphicsEffect(fx)
     scene.addItem(item)
-    out = QPixmap(src.size())
-    out.fill(Qt.transparent)
+    out = new_raster(px.width(), px.height())
     p = QPainter(out)
     scene.render(p)
     p.end()
-    return out
+    out.setDevicePixelRatio(dpr)
+    return to_pixmap(out)
 
 
 def _bake(shadows: List[dict], bw: int, bh: int,
-          radius: float) -> List[tuple]:
+          radius: float, dpr: float = 1.0) -> List[tuple]:
     """Bake list of shadow dicts → [(pixmap, pad, ox, oy)]."""
     result = []
     for sh in shadows:
@@ -103,9 +112,8 @@ def _bake(shadows: List[dict], bw: int, bh: int,
         pad    = int(blur * 1.5) + int(abs(ox)) + int(abs(oy)) + int(spread) + 4
         pw, ph = max(1, bw + pad * 2), max(1, bh + pad * 2)
 
-        pm = QPixmap(pw, ph)
-        pm.fill(Qt.transparent)
-        p = QPainter(pm)
+        img = new_raster(pw, ph, dpr)
+        p = QPainter(img)
         p.setRenderHint(QPainter.Antialiasing)
         r = min(radius, bh / 2, bw / 2)
         p.setBrush(QBrush(sh["color"]))
@@ -115,6 +123,7 @@ def _bake(shadows: List[dict], bw: int, bh: int,
                    bw + spread * 2, bh + spread * 2), r, r
         )
         p.end()
+        pm = to_pixmap(img)
 
         br = int(blur / 2)
         if br > 0:
@@ -126,9 +135,11 @@ def _bake(shadows: List[dict], bw: int, bh: int,
 
 # ─────────────────────────── _ShadowLayer ──────────────────────────
 
-class _ShadowLayer(QWidget):
+class _ShadowLayer(CompositedNode, QWidget):
     """Floating widget shadow, support crossfade antar state."""
 
+    NODE_LAYER = "under"
+
     def __init__(self, parent_window, btn_w: int, btn_h: int,
                  shadows: List[dict], border_radius: float = 12.0):
         super().__init__(parent_window)
@@ -136,6 +147,7 @@ class _ShadowLayer(QWidget):
         self._bh      = btn_h
         self._radius  = border_radius
         self._scale   = 1.0
+        self._dpr     = 1.0   # DPR raster shadow sekarang — ikut layar window
 
         self._sh_from  = shadows
         self._sh_to    = shadows
@@ -148,30 +160,38 @@ class _ShadowLayer(QWidget):
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.setAttribute(Qt.WA_TranslucentBackground)
 
-        self._anim = QPropertyAnimation(self, b"cf")
+        self._anim = RennsEngine.animation(self, b"cf")
         self._anim.setEasingCurve(QEasingCurve.OutCubic)
 
+        self._dpr = self.devicePixelRatioF()
         self._rebake_all()
         self._resize_canvas()
 
+        self._init_node(parent_window)
+
     # Qt property
     def getCf(self):    return self._cf
     def setCf(self, v): self._cf = float(v); self.update()
     cf = Property(float, getCf, setCf)
 
+    # Opacity paint-time (pill fade dll) — bukan windowOpacity
+    def getOpacity(self):    return self._node_opacity
+    def setOpacity(self, v): self.set_node_opacity(v)
+    opacity = Property(float, getOpacity, setOpacity)
+
     def _key(self, sh_list):
-        return (self._bw, self._bh, self._radius, self._scale, id(sh_list))
+        return (self._bw, self._bh, self._radius, self._scale, self._dpr, id(sh_list))
 
     def _rebake_all(self):
         bw = max(1, int(self._bw * self._scale))
         bh = max(1, int(self._bh * self._scale))
         k = self._key(self._sh_from)
         if self._key_from != k:
-            self._c_from   = _bake(self._sh_from, bw, bh, self._radius)
+            self._c_from   = _bake(self._sh_from, bw, bh, self._radius, self._dpr)
             self._key_from = k
         k2 = self._key(self._sh_to)
         if self._key_to != k2:
-            self._c_to   = _bake(self._sh_to, bw, bh, self._radius)
+            self._c_to   = _bake(self._sh_to, bw, bh, self._radius, self._dpr)
             self._key_to = k2
 
     def _resize_canvas(self):
@@ -204,37 +224,54 @@ class _ShadowLayer(QWidget):
         self._key_to = None
         bw = max(1, int(self._bw * self._scale))
         bh = max(1, int(self._bh * self._scale))
-        self._c_to   = _bake(new_shadows, bw, bh, self._radius)
+        self._c_to   = _bake(new_shadows, bw, bh, self._radius, self._dpr)
         self._key_to = self._key(new_shadows)
 
         self._resize_canvas()
 
         self._anim.stop()
+        dur_ms = RennsEngine.duration(dur_ms, decorative=True)
+        if dur_ms <= 0:
+            self.setCf(1.0)
+            return
         self._anim.setDuration(max(60, dur_ms))
         self._anim.setEasingCurve(easing)
         self._anim.setStartValue(0.0)
         self._anim.setEndValue(1.0)
         self._anim.start()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def paint_node(self, painter: QPainter):
+        # Window pindah layar dengan DPR lain → bake ulang di sini (lazy)
+        dpr = self.devicePixelRatioF()
+        if dpr != self._dpr:
+            self._dpr = dpr
+            self._rebake_all()
+
         painter.setRenderHint(QPainter.SmoothPixmapTransform)
         cw, ch = self.width(), self.height()
         cf = max(0.0, min(1.0, self._cf))
+        base = painter.opacity()
+        RennsQuality.painted(self)
+        # LOD adaptif: n layer box-shadow pertama saja (0 = semua)
+        n = RennsQuality.value("shadow_layers") or None
 
         if self._c_from and cf < 1.0:
-            painter.setOpacity(1.0 - cf)
-            for pm, _, ox, oy in self._c_from:
+            painter.setOpacity(base * (1.0 - cf))
+            for pm, pad, ox, oy in self._c_from[:n]:
                 painter.drawPixmap(
-                    (cw - pm.width()) // 2 + int(ox),
-                    (ch - pm.height()) // 2 + int(oy), pm)
+                    (cw - self._bake_w(pad)) // 2 + int(ox),
+                    (ch - self._bake_h(pad)) // 2 + int(oy), pm)
 
         if self._c_to and cf > 0.0:
-            painter.setOpacity(cf)
-            for pm, _, ox, oy in self._c_to:
+            painter.setOpacity(base * cf)
+            for pm, pad, ox, oy in self._c_to[:n]:
                 painter.drawPixmap(
-                    (cw - pm.width()) // 2 + int(ox),
-                    (ch - pm.height()) // 2 + int(oy), pm)
+                    (cw - self._bake_w(pad)) // 2 + int(ox),
+                    (ch - self._bake_h(pad)) // 2 + int(oy), pm)
+
+    # Ukuran logical pixmap bake — pm.width() adalah pixel device
+    def _bake_w(self, pad): return max(1, int(self._bw * self._scale)) + pad * 2
+    def _bake_h(self, pad): return max(1, int(self._bh * self._scale)) + pad * 2
 
 
 # ─────────────────────────── RennsShadow ───────────────────────────
@@ -249,9 +286,17 @@ class RennsShadow(QObject):
         self._component  = component
         self._layer: Optional[_ShadowLayer] = None
 
-        self._timer = QTimer(self)
-        self._timer.setInterval(16)
-        self._timer.timeout.connect(self._sync_scale)
+        # Tidak ada timer per shadow — overlay memberi tahu saat scale
+        # berubah, lalu sync dijalankan sekali di frame engine berikutnya
+        self._overlay = None
+
+        # box-shadow CSS yang sedang dituju — state baru dengan shadow sama
+        # tidak perlu bake + crossfade ulang
+        self._css_target = None
+
+        # Button di luar layar (RennsVisibility) — layer disembunyikan,
+        # tidak ada sync/rebake sampai kelihatan lagi
+        self._culled = False
 
         button.installEventFilter(self)
 
@@ -280,6 +325,7 @@ class RennsShadow(QObject):
         base    = RennsStyle.get(self._class_name, "base", self._component)
         css     = base.get("box-shadow", "")
         shadows = parse_box_shadow(css) if css else []
+        self._css_target = css
 
         try:    radius = float(base.get("border-radius", 12))
         except: radius = 12.0
@@ -292,10 +338,53 @@ class RennsShadow(QObject):
             btn_w=bw, btn_h=bh,
             shadows=shadows, border_radius=radius,
         )
-        self._layer.show()
-        self._layer.lower()
+        if not self._culled:
+            self._layer.show()
+            self._layer.lower()
         self._sync_pos()
-        self._timer.start()
+        self._watch_overlay()
+
+    def _watch_overlay(self):
+        ov = getattr(self._button, 'overlay', None)
+        if ov is None or ov is self._overlay:
+            return
+        if self._overlay is not None:
+            self._overlay.remove_scale_listener(self.request_sync)
+        self._overlay = ov
+        ov.add_scale_listener(self.request_sync)
+        self.request_sync()
+
+    def request_sync(self):
+        """Dipanggil overlay tiap scale berubah. Sync di-coalesce per frame."""
+        if self._layer and not self._culled:
+            RennsEngine.register(self)
+
+    def set_culled(self, culled: bool):
+        if culled == self._culled:
+            return
+        self._culled = culled
+        if not self._layer:
+            return
+        if culled:
+            RennsEngine.unregister(self)
+            a = self._layer._anim
+            if a.state() != QAbstractAnimation.Stopped:
+                a.setCurrentTime(a.totalDuration())
+            self._layer.hide()
+        else:
+            self._layer.show()
+            self._layer.lower()
+            self._sync_pos()
+            self.request_sync()
+
+    def tick(self, now_ms: float) -> bool:
+        if not RennsEngine.profile_value("shadow_sync"):
+            # Power saver: jangan rebake per frame, tunggu scale diam dulu
+            ov = self._overlay
+            if ov is not None and ov.anim.state() == QAbstractAnimation.Running:
+                return True
+        self._sync_scale()
+        return False   # one-shot — register ulang saat scale berubah lagi
 
     def _sync_pos(self):
         if not self._layer:
@@ -324,6 +413,9 @@ class RennsShadow(QObject):
         base_p  = RennsStyle.get(self._class_name, "base",  self._component)
         state_p = RennsStyle.get(self._class_name, state,   self._component)
         css     = {**base_p, **state_p}.get("box-shadow", "")
+        if css == self._css_target:
+            return
+        self._css_target = css
         shadows = parse_box_shadow(css) if css else []
         self._layer.transition_shadows(shadows, dur_ms, easing)
 
@@ -334,12 +426,15 @@ class RennsShadow(QObject):
                 self._sync_pos()
             elif t == QEvent.Hide and self._layer:
                 self._layer.hide()
-            elif t == QEvent.Show and self._layer:
+            elif t == QEvent.Show and self._layer and not self._culled:
                 self._layer.show()
         return False
 
     def deleteLater(self):
-        self._timer.stop()
+        RennsEngine.unregister(self)
+        if self._overlay is not None:
+            self._overlay.remove_scale_listener(self.request_sync)
+            self._overlay = None
         if self._layer:
             self._layer.deleteLater()
             self._layer = None
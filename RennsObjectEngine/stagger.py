@@ -0,0 +1,200 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Author: @ahsanihlwn
+# Copyright (c) 2026 @ahsanihlwn
+
+"""
+stagger.py — animasi bertahap (stagger) untuk sekumpulan widget dari SATU object.
+
+    st = RennsStagger(parent)
+    for item in items:
+        st.animate(item, b"pos", start, end, 280, curve)
+        st.animate(item.overlay, b"scale", 0.0, 1.0, 280, curve)
+    st.start(items, stagger_ms=40)   # item ke-i mulai setelah i * 40ms
+    st.reverse()                      # balik arah dari posisi sekarang
+    st.cancel()                       # stop semua sekaligus
+    st.untrack(item)                  # lepas animasi satu item
+    st.clear()                        # lepas semua
+
+Struktur (Qt animation group, bukan timer per item):
+
+    QParallelAnimationGroup                  ← satu-satunya yang di-track engine
+      └─ per item: QSequentialAnimationGroup
+                     ├─ QPauseAnimation(i * stagger_ms)
+                     └─ QParallelAnimationGroup(animasi property item itu)
+
+Animasi per (target, property) dibuat sekali lalu di-reuse tiap start() —
+buka/tutup berulang tidak membuat object baru dan tidak meninggalkan timer.
+Item yang key atau target-nya di-destroy dilepas otomatis.
+"""
+
+import weakref
+
+from PySide6.QtCore import (
+    QObject, Signal, QAbstractAnimation, QPropertyAnimation,
+    QParallelAnimationGroup, QSequentialAnimationGroup, QPauseAnimation,
+)
+
+from .engine import RennsEngine
+
+
+class _StaggerItem:
+    __slots__ = ("ref", "seq", "pause", "body", "anims")
+
+    def __init__(self, key):
+        # id() bisa dipakai ulang object lain — ref memastikan entry milik key ini
+        self.ref   = weakref.ref(key)
+        self.seq   = QSequentialAnimationGroup()
+        self.pause = QPauseAnimation(0)
+        self.body  = QParallelAnimationGroup()
+        self.seq.addAnimation(self.pause)
+        self.seq.addAnimation(self.body)
+        self.anims = {}   # { (id(target), prop): QPropertyAnimation }
+
+
+class RennsStagger(QObject):
+
+    finished = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._group = QParallelAnimationGroup(self)
+        RennsEngine.track(self._group)
+        self._group.finished.connect(self.finished)
+
+        # { id(key_object): _StaggerItem } — urutan insert tidak penting,
+        # urutan stagger ditentukan argumen start()
+        self._items: dict = {}
+
+    # ── Setup ─────────────────────────────────────────────────
+
+    def _item(self, key) -> _StaggerItem:
+        it = self._lookup(key)
+        if it is None:
+            it = _StaggerItem(key)
+            self._items[id(key)] = it
+            self._watch(key, it)
+        return it
+
+    def _lookup(self, key):
+        it = self._items.get(id(key))
+        if it is not None and it.ref() is not key:
+            # Entry basi dari object lama dengan id yang sama
+            self._drop(id(key), it)
+            return None
+        return it
+
+    def _watch(self, obj, it: _StaggerItem):
+        destroyed = getattr(obj, "destroyed", None)
+        if destroyed is not None:
+            kid = id(it.ref())
+            destroyed.connect(lambda *_: self._drop(kid, it))
+
+    def _drop(self, kid: int, it: _StaggerItem = None):
+        if it is not None and self._items.get(kid) is not it:
+            return
+        it = self._items.pop(kid, None)
+        if it is None:
+            return
+        try:
+            idx = self._group.indexOfAnimation(it.seq)
+            if idx >= 0:
+                self._group.takeAnimation(idx)
+            it.seq.stop()
+        except RuntimeError:
+            pass   # stagger sendiri sudah dihapus
+
+    def track(self, target, prop: bytes, key=None) -> QPropertyAnimation:
+        """
+        Animasi (target, prop) milik item `key` (default: target sendiri).
+        Dibuat sekali, call berikutnya return object yang sama.
+        """
+        it = self._item(key if key is not None else target)
+        k  = (id(target), bytes(prop))
+        anim = it.anims.get(k)
+        if anim is None:
+            anim = QPropertyAnimation(target, prop)
+            it.body.addAnimation(anim)
+            it.anims[k] = anim
+            if target is not key and key is not None:
+                # Target mati → animasi item ini tidak punya tujuan lagi
+                self._watch(target, it)
+        return anim
+
+    def untrack(self, key):
+        """Lepas semua animasi item `key` (stop kalau sedang jalan)."""
+        if self._lookup(key) is not None:
+            self._drop(id(key))
+
+    def clear(self):
+        """Lepas semua item."""
+        self._group.stop()
+        for kid in list(self._items):
+            self._drop(kid)
+
+    def animate(self, target, prop: bytes, start, end, duration_ms: int,
+                easing=None, key=None) -> QPropertyAnimation:
+        """track() + set nilai. Aman dipanggil ulang tiap open."""
+        anim = self.track(target, prop, key)
+        anim.setStartValue(start)
+        anim.setEndValue(end)
+        anim.setDuration(max(0, int(duration_ms)))
+        if easing is not None:
+            anim.setEasingCurve(easing)
+        return anim
+
+    # ── Playback ──────────────────────────────────────────────
+
+    def start(self, order: list, stagger_ms: int = 40):
+        """
+        Mainkan item sesuai urutan `order` (list key/target). Item yang tidak
+        ada di `order` dikeluarkan dari group untuk run ini.
+        """
+        g = self._group
+        g.stop()
+
+        wanted = []
+        for i, key in enumerate(order):
+            it = self._lookup(key)
+            if it is None:
+                continue
+            it.pause.setDuration(max(0, int(i * stagger_ms)))
+            wanted.append(it.seq)
+
+        for idx in range(g.animationCount() - 1, -1, -1):
+            if g.animationAt(idx) not in wanted:
+                g.takeAnimation(idx)
+        for seq in wanted:
+            if g.indexOfAnimation(seq) < 0:
+                g.addAnimation(seq)
+
+        g.setDirection(QAbstractAnimation.Forward)
+        g.start()
+
+    def reverse(self):
+        """
+        Balik arah. Saat running: lanjut mundur dari posisi sekarang.
+        Saat berhenti: main mundur penuh — item terakhir balik duluan.
+        """
+        g = self._group
+        if g.state() == QAbstractAnimation.Stopped:
+            g.setDirection(QAbstractAnimation.Backward)
+            g.start()
+            return
+        g.setDirection(
+            QAbstractAnimation.Backward
+            if g.direction() == QAbstractAnimation.Forward
+            else QAbstractAnimation.Forward
+        )
+
+    def cancel(self):
+        """Stop semua item sekaligus. finished tidak di-emit."""
+        self._group.stop()
+
+    def is_running(self) -> bool:
+        return self._group.state() != QAbstractAnimation.Stopped
+
+    def duration(self) -> int:
+        return self._group.totalDuration()
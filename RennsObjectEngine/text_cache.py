@@ -0,0 +1,213 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Author: @ahsanihlwn
+# Copyright (c) 2026 @ahsanihlwn
+
+"""
+text_cache.py — cache raster text bersama untuk satu proses.
+
+Label yang sama di ratusan tombol (dan di slot action group) cukup
+di-raster sekali. Key = (text, font spec, warna, ukuran, DPR); entry
+yang paling lama tidak dipakai dibuang begitu total byte lewat budget.
+
+    from RennsObjectEngine import RennsTextCache
+    RennsTextCache.set_budget(4 * 1024 * 1024)   # default 8 MB
+    RennsTextCache.stats()    # {"hits", "misses", "entries", "bytes", "budget"}
+
+Font spec = (family, pixel_size, weight) — weight string CSS apa adanya
+("bold", "semibold", "600", ...). Spec yang sama selalu dapat QFont dan
+QFontMetricsF yang sama (resolve_font / font_metrics), dan layout label
+disimpan sebagai QStaticText — raster ulang label yang sama dengan warna
+atau DPR lain tidak layout ulang glyph.
+"""
+
+from collections import OrderedDict
+
+from PySide6.QtCore import Qt, QRect, QRectF
+from PySide6.QtGui import QPainter, QPixmap, QFont, QFontMetricsF, QStaticText
+
+from .button.button_ext.css_color import parse_css_color
+from .button.button_ext.raster import new_raster, to_pixmap, add_dpr_listener, dpr_released
+
+_DEFAULT_BUDGET = 8 * 1024 * 1024
+_STATIC_TEXT_MAX = 256
+
+# ── Font resolver ─────────────────────────────────────────────
+
+# { spec: QFont } / { spec: QFontMetricsF } — jumlah spec di satu app kecil
+_fonts: dict = {}
+_metrics: dict = {}
+# { (text, spec): QStaticText } — LRU
+_static: "OrderedDict" = OrderedDict()
+
+
+def resolve_font(spec) -> QFont:
+    """QFont bersama untuk spec ini — jangan dimodifikasi caller."""
+    font = _fonts.get(spec)
+    if font is None:
+        font = _make_font(spec)
+        _fonts[spec] = font
+    return font
+
+
+def font_metrics(spec) -> QFontMetricsF:
+    fm = _metrics.get(spec)
+    if fm is None:
+        fm = QFontMetricsF(resolve_font(spec))
+        _metrics[spec] = fm
+    return fm
+
+
+def static_text(text: str, spec):
+    """
+    Layout label (QStaticText) yang sudah di-prepare untuk font spec.
+    None kalau label butuh font fallback (emoji/simbol) atau multi-baris —
+    QStaticText menaruh glyph fallback sedikit beda dari drawText.
+    """
+    key = (text, spec)
+    if key in _static:
+        _static.move_to_end(key)
+        return _static[key]
+    st = None
+    fm = font_metrics(spec)
+    if "\n" not in text and all(fm.inFontUcs4(ord(ch)) for ch in text):
+        st = QStaticText(text)
+        st.setTextFormat(Qt.PlainText)
+        st.setPerformanceHint(QStaticText.AggressiveCaching)
+        st.prepare(font=resolve_font(spec))
+    _static[key] = st
+    while len(_static) > _STATIC_TEXT_MAX:
+        _static.popitem(last=False)
+    return st
+
+
+def clear_fonts():
+    _fonts.clear()
+    _metrics.clear()
+    _static.clear()
+
+
+def _make_font(spec) -> QFont:
+    family, size, weight = spec
+    font = QFont()
+    if family:
+        font.setFamily(family.strip())
+    font.setPixelSize(max(1, int(size)))
+    font.setHintingPreference(QFont.HintingPreference.PreferNoHinting)
+
+    w = (weight or "normal").strip().lower()
+    if   w == "bold":      font.setBold(True)
+    elif w == "thin":      font.setWeight(QFont.Weight.Thin)
+    elif w == "light":     font.setWeight(QFont.Weight.Light)
+    elif w == "medium":    font.setWeight(QFont.Weight.Medium)
+    elif w == "semibold":  font.setWeight(QFont.Weight.DemiBold)
+    elif w == "extrabold": font.setWeight(QFont.Weight.ExtraBold)
+    elif w == "black":     font.setWeight(QFont.Weight.Black)
+    elif w.isdigit():      font.setWeight(int(w))
+    return font
+
+
+class RennsTextCache:
+
+    # { key: QPixmap } — urutan = LRU, paling kiri paling lama
+    _entries: "OrderedDict" = OrderedDict()
+    _sizes:   dict = {}
+    _bytes    = 0
+    _budget   = _DEFAULT_BUDGET
+
+    _hits   = 0
+    _misses = 0
+
+    # ── API ───────────────────────────────────────────────────
+
+    @classmethod
+    def get(cls, text: str, spec, color: str, w: int, h: int,
+            dpr: float = 1.0) -> QPixmap:
+        """Pixmap w x h (logical) berisi text di tengah."""
+        key = (text, spec, color, w, h, dpr)
+        pm = cls._entries.get(key)
+        if pm is not None:
+            cls._entries.move_to_end(key)
+            cls._hits += 1
+            return pm
+
+        cls._misses += 1
+        pm = cls._render(text, spec, color, w, h, dpr)
+        size = pm.width() * pm.height() * 4
+        cls._entries[key] = pm
+        cls._sizes[key] = size
+        cls._bytes += size
+        cls._evict()
+        return pm
+
+    @classmethod
+    def set_budget(cls, nbytes: int):
+        cls._budget = max(0, int(nbytes))
+        cls._evict()
+
+    @classmethod
+    def budget(cls) -> int:
+        return cls._budget
+
+    @classmethod
+    def clear(cls):
+        cls._entries.clear()
+        cls._sizes.clear()
+        cls._bytes = 0
+
+    @classmethod
+    def stats(cls) -> dict:
+        return {
+            "hits":    cls._hits,
+            "misses":  cls._misses,
+            "entries": len(cls._entries),
+            "bytes":   cls._bytes,
+            "budget":  cls._budget,
+        }
+
+    @classmethod
+    def reset_stats(cls):
+        cls._hits = 0
+        cls._misses = 0
+
+    # ── Internal ──────────────────────────────────────────────
+
+    @classmethod
+    def _on_dpr_change(cls, window, old, new):
+        # Buang hanya raster DPR lama yang tidak dipakai window lain —
+        # label di-raster ulang lazy di DPR baru
+        for key in [k for k in cls._entries if dpr_released(k[-1], old)]:
+            del cls._entries[key]
+            cls._bytes -= cls._sizes.pop(key, 0)
+
+    @classmethod
+    def _evict(cls):
+        # Entry terbaru selalu disimpan walau sendirian melebihi budget —
+        # caller langsung memakainya
+        while cls._bytes > cls._budget and len(cls._entries) > 1:
+            key, _ = cls._entries.popitem(last=False)
+            cls._bytes -= cls._sizes.pop(key, 0)
+
+    @staticmethod
+    def _render(text, spec, color, w, h, dpr) -> QPixmap:
+        img = new_raster(w, h, dpr)
+
+        p = QPainter(img)
+        p.setRenderHint(QPainter.TextAntialiasing)
+        p.setFont(resolve_font(spec))
+        p.setPen(parse_css_color(color))
+        st = static_text(text, spec)
+        if st is None:
+            p.drawText(QRect(0, 0, w, h), Qt.AlignCenter, text)
+        else:
+            # Kotak dari metrics = kotak yang dipakai drawText(AlignCenter)
+            box = font_metrics(spec).boundingRect(
+                QRectF(0, 0, w, h), Qt.AlignCenter, text)
+            p.drawStaticText(box.topLeft(), st)
+        p.end()
+        return to_pixmap(img)
+
+
+add_dpr_listener(RennsTextCache._on_dpr_change)
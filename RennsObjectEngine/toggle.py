@@ -11,8 +11,10 @@ from PySide6.QtWidgets import QWidget
 from PySide6.QtGui import QColor
 from .button.button_ext.css_color import parse_css_color
 from .button.button import RennsButton
-from .button.button_ext.animation import resolve_easing
+from .button.button_ext.animation import resolve_easing, retarget
 from .renns_style import RennsStyle
+from .engine import RennsEngine
+from .button.button_ext.pointer import PointerSampler
 from PySide6.QtCore import Signal
 
 def _is_springy(easing_name: str) -> bool:
@@ -32,8 +34,9 @@ class RennsToggle(QWidget):
         self._knob_drag_start_pos   = None
         self._knob_drag_mouse_start = None
         self._drag_moved            = False
-        self._knob_drag_prev_x      = None   # untuk velocity tracking
-        self._knob_drag_vel_x       = 0.0    # velocity frame sebelumnya
+        self._knob_drag_vel_x       = 0.0    # px/frame, dari history PointerSampler
+        # Move event knob dikumpulkan, drag diproses sekali per frame
+        self._knob_pointer          = PointerSampler(self._knob_drag_frame)
 
         # Baca CSS dulu sebelum buat button -- track.width() selalu 0 di __init__
         _tc = RennsStyle.get(class_name, "base", "toggle")
@@ -185,21 +188,10 @@ class RennsToggle(QWidget):
         target_bg    = self._get_track_bg(state)
         target_color = parse_css_color(target_bg)
 
-        # Skip kalau udah menuju warna yang sama
-        current_end = ov.color_anim.endValue()
-        if isinstance(current_end, QColor) and target_color == current_end \
-                and ov.color_anim.state() == QPropertyAnimation.Running:
-            return
-
+        # retarget skip sendiri kalau udah menuju warna yang sama
         dur_s, easing_name = self._get_transition("toggle")
-        curve = resolve_easing(easing_name)
-
-        ov.color_anim.stop()
-        ov.color_anim.setStartValue(ov._bg_color)
-        ov.color_anim.setEndValue(target_color)
-        ov.color_anim.setDuration(int(dur_s * 1000))
-        ov.color_anim.setEasingCurve(curve)
-        ov.color_anim.start()
+        retarget(ov.color_anim, target_color,
+                 RennsEngine.duration(dur_s * 1000), resolve_easing(easing_name))
 
     # =========================================================
     # TRACK HOVER — forward dari knob/toggle area
@@ -239,12 +231,8 @@ class RennsToggle(QWidget):
         target_bg = props.get("background", base.get("background", "#ffffff"))
         target    = parse_css_color(target_bg)
         dur_s, easing_name = self._get_transition("toggle-knob")
-        ov.color_anim.stop()
-        ov.color_anim.setStartValue(ov._bg_color)
-        ov.color_anim.setEndValue(target)
-        ov.color_anim.setDuration(int(dur_s * 1000))
-        ov.color_anim.setEasingCurve(resolve_easing(easing_name))
-        ov.color_anim.start()
+        retarget(ov.color_anim, target,
+                 RennsEngine.duration(dur_s * 1000), resolve_easing(easing_name))
 
     # =========================================================
     # SNAP KNOB
@@ -255,11 +243,11 @@ class RennsToggle(QWidget):
         target_y = self._knob_y()
 
         dur_s, easing_name = self._get_transition("toggle-knob")
-        dur_ms  = int(dur_s * 1000)
+        dur_ms  = RennsEngine.duration(dur_s * 1000)
         curve   = easing_override if easing_override else resolve_easing(easing_name)
         springy = _is_springy(easing_name)
 
-        anim = QPropertyAnimation(self.knob, b"pos")
+        anim = RennsEngine.animation(self.knob, b"pos")
         anim.setDuration(dur_ms)
         anim.setEasingCurve(curve)
         anim.setStartValue(self.knob.pos())
@@ -299,8 +287,8 @@ class RennsToggle(QWidget):
         self._drag_moved            = False
         self._knob_drag_start_pos   = self.knob.pos()
         self._knob_drag_mouse_start = event.globalPosition().toPoint()
-        self._knob_drag_prev_x      = event.globalPosition().x()
         self._knob_drag_vel_x       = 0.0
+        self._knob_pointer.reset(event.globalPosition())
         self.knob._pressed = True
         self.knob.update_visual_state()
         if self._pos_anim:
@@ -310,8 +298,15 @@ class RennsToggle(QWidget):
     def _knob_mouse_move(self, event):
         if not self._knob_dragging:
             return
+        self._knob_pointer.push(event.globalPosition())
+        event.accept()
 
-        mouse_now = event.globalPosition().toPoint()
+    def _knob_drag_frame(self, global_pos: QPointF):
+        """Satu kali per frame engine dengan posisi pointer terakhir."""
+        if not self._knob_dragging:
+            return
+
+        mouse_now = global_pos.toPoint()
         dx = mouse_now.x() - self._knob_drag_mouse_start.x()
 
         if abs(dx) > 3:
@@ -321,12 +316,10 @@ class RennsToggle(QWidget):
         right_x = self._knob_right_x()
         raw_x   = self._knob_drag_start_pos.x() + dx
 
-        # ── Velocity frame ini ──────────────────────────────
-        cur_x   = event.globalPosition().x()
-        frame_v = cur_x - (self._knob_drag_prev_x or cur_x)
-        # Smooth: 70% prev + 30% baru
-        self._knob_drag_vel_x = self._knob_drag_vel_x * 0.70 + frame_v * 0.30
-        self._knob_drag_prev_x = cur_x
+        # ── Velocity ────────────────────────────────────────
+        # Slope semua sample ~80ms terakhir, dikonversi ke px per frame
+        vx, _ = self._knob_pointer.velocity()
+        self._knob_drag_vel_x = vx * RennsEngine.FRAME_MS
         speed = abs(self._knob_drag_vel_x)
 
         # Overflow = tarikan di luar batas
@@ -375,17 +368,17 @@ class RennsToggle(QWidget):
                     ov._elastic_vec_x = 0.0
                     ov._elastic_vec_y = 1.0
                     ov._elastic_flatten = target_flat
-                ov.update()
+                ov.mark_dirty()
 
         # Blend warna track
         progress = (clamped_x - left_x) / max(1, right_x - left_x)
         self._blend_track_color(progress)
 
-        event.accept()
-
     def _knob_mouse_release(self, event):
         if not self._knob_dragging:
             return
+        # Posisi terakhir yang belum sempat diproses frame → proses dulu
+        self._knob_pointer.flush()
         self._knob_dragging = False
         self.knob._pressed  = False
         self.knob.update_visual_state()
@@ -424,7 +417,7 @@ class RennsToggle(QWidget):
         ov._elastic_flatten = max(0.0, float(flatten))
         ov._elastic_vec_x   = float(direction)
         ov._elastic_vec_y   = 0.0
-        ov.update()
+        ov.mark_dirty()
 
     def _reset_knob_jelly_animated(self, dx_dir: int = 1):
         """
@@ -468,8 +461,8 @@ class RennsToggle(QWidget):
             QPointF(0.88, 1.00), QPointF(0.95, 1.00), QPointF(1.00, 1.00)
         )
 
-        anim = QPropertyAnimation(ov, b"elastic_flatten_prop")
-        anim.setDuration(420)
+        anim = RennsEngine.animation(ov, b"elastic_flatten_prop")
+        anim.setDuration(RennsEngine.duration(420, decorative=True))
         anim.setStartValue(peak)
         anim.setEndValue(0.0)
         anim.setEasingCurve(flatten_curve)
@@ -498,7 +491,7 @@ class RennsToggle(QWidget):
         # Nol-kan offset — ini sumber geter sebelumnya
         ov._elastic_offset_x = 0.0
         ov._elastic_offset_y = 0.0
-        ov.update()
+        ov.mark_dirty()
 
     def _set_track_stretch_instant(self, stretch_norm: float, direction: int):
         ov = self.track.overlay
@@ -508,14 +501,14 @@ class RennsToggle(QWidget):
         ov._elastic_vec_y    = 0.0
         ov._elastic_offset_x = 0.0
         ov._elastic_offset_y = 0.0
-        ov.update()
+        ov.mark_dirty()
 
     def _reset_track_stretch_animated(self):
         ov = self.track.overlay
         if not ov: return
 
         dur_s, easing_name = self._get_transition("toggle")
-        dur_ms = int(dur_s * 1000)
+        dur_ms = RennsEngine.duration(dur_s * 1000, decorative=True)
 
         if _is_springy(easing_name):
             curve = QEasingCurve(QEasingCurve.OutElastic)
@@ -524,12 +517,12 @@ class RennsToggle(QWidget):
         else:
             curve = QEasingCurve(QEasingCurve.OutCubic)
 
-        af = QPropertyAnimation(ov, b"elastic_flatten_prop")
+        af = RennsEngine.animation(ov, b"elastic_flatten_prop")
         af.setDuration(dur_ms); af.setStartValue(ov._elastic_flatten)
         af.setEndValue(0.0);    af.setEasingCurve(curve); af.start()
         ov._stretch_f = af
 
-        ax = QPropertyAnimation(ov, b"elastic_offset_x")
+        ax = RennsEngine.animation(ov, b"elastic_offset_x")
         ax.setDuration(dur_ms); ax.setStartValue(ov._elastic_offset_x)
         ax.setEndValue(0.0);    ax.setEasingCurve(curve); ax.start()
         ov._stretch_x = ax
@@ -549,7 +542,7 @@ class RennsToggle(QWidget):
         a  = int(c1.alpha() + (c2.alpha() - c1.alpha()) * progress)
         ov.color_anim.stop()
         ov._bg_color = QColor(r, g, b, a)
-        ov.update()
+        ov.mark_dirty()
 
     # =========================================================
 
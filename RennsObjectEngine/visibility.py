@@ -0,0 +1,202 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Author: @ahsanihlwn
+# Copyright (c) 2026 @ahsanihlwn
+
+"""
+visibility.py — culling widget yang tidak kelihatan di layar.
+
+Overlay dan shadow layer di-parent ke window(), jadi Qt tidak tahu kalau
+button-nya sudah ke-scroll keluar QScrollArea, ada di tab yang tidak aktif,
+atau window-nya di-minimize. RennsVisibility menghitung visibility efektif
+per widget:
+
+    widget.isVisible()
+    AND window tidak minimized
+    AND visibleRegion() tidak kosong (sudah di-clip semua ancestor)
+
+Event Move/Resize/Show/Hide dari widget + semua ancestor-nya (termasuk
+scroll container) dan WindowStateChange dari window men-trigger hitung
+ulang — di-coalesce jadi sekali per frame engine, dan hanya untuk widget
+di bawah ancestor yang mengirim event. Move window top-level diabaikan:
+posisi relatif window dan visibleRegion tidak berubah.
+
+    RennsVisibility.watch(widget, on_change, on_move)
+        on_change(visible: bool)   # saat visibility efektif berubah
+        on_move()                  # widget visible, ancestor bergeser
+    RennsVisibility.is_visible(widget)
+    RennsVisibility.set_enabled(False)   # matikan culling (semua dianggap visible)
+"""
+
+import weakref
+
+from PySide6.QtCore import QObject, QEvent, Qt
+
+from .engine import RennsEngine
+
+_GEOMETRY_EVENTS = (QEvent.Move, QEvent.Resize)
+_VISIBILITY_EVENTS = (QEvent.Show, QEvent.Hide, QEvent.WindowStateChange,
+                      QEvent.ParentChange)
+
+
+def is_effectively_visible(widget) -> bool:
+    if not widget.isVisible():
+        return False
+    win = widget.window()
+    if win is not None and win.windowState() & Qt.WindowMinimized:
+        return False
+    return not widget.visibleRegion().isEmpty()
+
+
+class _Watch:
+    __slots__ = ("ref", "on_change", "on_move", "visible")
+
+    def __init__(self, widget, on_change, on_move):
+        self.ref       = weakref.ref(widget)
+        self.on_change = on_change
+        self.on_move   = on_move
+        self.visible   = True   # widget baru dianggap visible sampai dihitung
+
+
+class _AncestorFilter(QObject):
+    def eventFilter(self, obj, event):
+        t = event.type()
+        if t in _GEOMETRY_EVENTS:
+            if t == QEvent.Move and obj.isWindow():
+                return False
+            RennsVisibility._schedule(moved=True, root=obj)
+        elif t in _VISIBILITY_EVENTS:
+            if t == QEvent.ParentChange:
+                RennsVisibility._rewire = True
+            RennsVisibility._schedule(moved=True, root=obj)
+        return False
+
+
+class RennsVisibility:
+
+    # { id(widget): _Watch }
+    _watched: dict = {}
+    # id(ancestor) yang sudah dipasangi filter
+    _filtered: set = set()
+    _filter = None
+
+    _enabled = True
+    _pending = False
+    _moved   = False
+    _rewire  = False
+    # { id(ancestor): ancestor } yang kirim event frame ini; _all → semua
+    _roots: dict = {}
+    _all     = False
+
+    # ── API ───────────────────────────────────────────────────
+
+    @classmethod
+    def watch(cls, widget, on_change, on_move=None):
+        if id(widget) in cls._watched:
+            return
+        cls._watched[id(widget)] = _Watch(widget, on_change, on_move)
+        cls._install_chain(widget)
+        cls._schedule(moved=False, root=widget)
+
+    @classmethod
+    def unwatch(cls, widget):
+        cls._watched.pop(id(widget), None)
+
+    @classmethod
+    def is_visible(cls, widget) -> bool:
+        w = cls._watched.get(id(widget))
+        if w is not None:
+            return w.visible
+        return is_effectively_visible(widget)
+
+    @classmethod
+    def set_enabled(cls, enabled: bool):
+        """False → semua widget dianggap visible (culling off)."""
+        cls._enabled = bool(enabled)
+        cls._schedule(moved=True)
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def culled_count(cls) -> int:
+        return sum(1 for w in cls._watched.values() if not w.visible)
+
+    # ── Internal ──────────────────────────────────────────────
+
+    @classmethod
+    def _install_chain(cls, widget):
+        if cls._filter is None:
+            cls._filter = _AncestorFilter()
+        obj = widget
+        while obj is not None:
+            key = id(obj)
+            if key not in cls._filtered:
+                obj.installEventFilter(cls._filter)
+                cls._filtered.add(key)
+                obj.destroyed.connect(lambda *_, k=key: cls._filtered.discard(k))
+            obj = obj.parentWidget()
+
+    @classmethod
+    def _schedule(cls, moved: bool, root=None):
+        """root = widget yang berubah; None = hitung ulang semua watch."""
+        cls._moved = cls._moved or moved
+        if root is None:
+            cls._all = True
+        else:
+            cls._roots[id(root)] = root
+        if not cls._pending and cls._watched:
+            cls._pending = True
+            RennsEngine.register(_Ticker)
+
+    @classmethod
+    def _recompute(cls):
+        cls._pending = False
+        moved, cls._moved = cls._moved, False
+        rewire, cls._rewire = cls._rewire, False
+        roots, cls._roots = cls._roots, {}
+        every, cls._all   = cls._all, False
+
+        for key, w in list(cls._watched.items()):
+            widget = w.ref()
+            try:
+                if widget is None:
+                    raise RuntimeError
+                # Subtree lain tidak ikut bayar visibleRegion()
+                if not every and not _under(widget, roots):
+                    continue
+                if rewire:
+                    cls._install_chain(widget)
+                vis = is_effectively_visible(widget) if cls._enabled else True
+            except RuntimeError:
+                # Widget C++ sudah dihapus
+                cls._watched.pop(key, None)
+                continue
+
+            if vis != w.visible:
+                w.visible = vis
+                w.on_change(vis)
+            elif vis and moved and w.on_move is not None:
+                w.on_move()
+
+
+def _under(widget, roots: dict) -> bool:
+    """widget sendiri atau salah satu ancestor-nya ada di roots?"""
+    obj = widget
+    while obj is not None:
+        if id(obj) in roots:
+            return True
+        obj = obj.parentWidget()
+    return False
+
+
+class _Ticker:
+    """Engine client one-shot — recompute sekali per frame."""
+
+    @staticmethod
+    def tick(now_ms: float) -> bool:
+        RennsVisibility._recompute()
+        return False
@@ -10,9 +10,10 @@ from PySide6.QtCore import Qt, QEvent, QPropertyAnimation
 from PySide6.QtGui import QPainter, QColor
 from .button.button_ext.css_color import parse_css_color
 from .renns_style import RennsStyle
-from .button.overlay import RennsOverlay, OVERLAY_CANVAS_FACTOR
+from .button.overlay import RennsOverlay, canvas_size
 from .button.button_ext.transform import parse_transform
 from .button.button_ext.animation import resolve_easing
+from .engine import RennsEngine
 
 
 class RennsButtonWrapper(QWidget):
@@ -41,7 +42,7 @@ class RennsButtonWrapper(QWidget):
         self._hovered = False
         self._pressed = False
 
-        self.anim = QPropertyAnimation(self.overlay, b"scale")
+        self.anim = RennsEngine.animation(self.overlay, b"scale")
 
         self.button.installEventFilter(self)
 
@@ -58,23 +59,17 @@ class RennsButtonWrapper(QWidget):
         self.resize(bw, bh)
         self.button.resize(bw, bh)
 
-        # Overlay canvas lebih besar, di-center dalam wrapper
-        canvas_w = int(bw * OVERLAY_CANVAS_FACTOR)
-        canvas_h = int(bh * OVERLAY_CANVAS_FACTOR)
-        offset_x = (canvas_w - bw) // 2
-        offset_y = (canvas_h - bh) // 2
-
         self.overlay._button_width = bw
         self.overlay._button_height = bh
-
-        # Overlay bisa keluar dari batas wrapper, jadi parenting ke window
-        # Jika overlay di-parent ke self, Qt akan clip. Kita pakai window() supaya bebas.
-        # (Sudah di-parent ke self di __init__; cukup resize & reposition)
-        self.overlay.setGeometry(
-            -offset_x,
-            -offset_y,
-            canvas_w,
-            canvas_h
+        self.overlay._btn_w = bw
+        self.overlay._btn_h = bh
+
+        # Overlay canvas seukuran transform terbesar class (canvas_size),
+        # di-center di atas wrapper
+        self.overlay.set_canvas_size(*canvas_size(self.class_name, None, bw, bh))
+        self.overlay.move(
+            (bw - self.overlay.width()) // 2,
+            (bh - self.overlay.height()) // 2
         )
 
     # =========================
@@ -127,7 +122,7 @@ class RennsButtonWrapper(QWidget):
         curve = resolve_easing(easing)
 
         self.anim.stop()
-        self.anim.setDuration(int(duration * 1000))
+        self.anim.setDuration(RennsEngine.duration(duration * 1000))
         self.anim.setEasingCurve(curve)
         self.anim.setEndValue(scale)
         self.anim.start()
@@ -139,4 +134,4 @@ class RennsButtonWrapper(QWidget):
             self.overlay.bgColor = parse_css_color(bg)
 
         self.overlay.style_data = merged
-        self.overlay.update()
\ No newline at end of file
+        self.overlay.mark_dirty()
\ No newline at end of file